@@ -3,7 +3,7 @@
 # @brief Core command dispatch and git-alias runtime orchestration.
 # @details Provides command routing, repository diagnostics, changelog/version workflows, and process wrappers.
 
-import argparse
+import heapq
 import importlib
 import json
 import os
@@ -13,15 +13,10 @@ import shutil
 import subprocess
 import sys
 from collections import defaultdict
-from dataclasses import dataclass
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
-
-pathspec = importlib.import_module("pathspec")
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 ## @brief Constant `CONFIG_FILENAME` used by CLI runtime paths and policies.
 
@@ -71,6 +66,10 @@ VERSION_CHECK_IDLE_DELAY_SECONDS = 3600
 VERSION_CHECK_ERROR_IDLE_DELAY_SECONDS = 86400
 ## @brief Constant `VERSION_CHECK_TIMEOUT_SECONDS` used by CLI runtime paths and policies.
 VERSION_CHECK_TIMEOUT_SECONDS = 2.0
+## @brief Constant `VERSION_CHECK_REFRESH_LEASE_SECONDS` used by CLI runtime paths and policies.
+# @details Short idle window persisted before spawning a detached refresh so concurrent
+#          invocations do not start duplicate background release checks.
+VERSION_CHECK_REFRESH_LEASE_SECONDS = 60
 ## @brief Constant `VERSION_AVAILABLE_COLOR` used by CLI runtime paths and policies.
 VERSION_AVAILABLE_COLOR = "\033[92;1m"
 ## @brief Constant `VERSION_ERROR_COLOR` used by CLI runtime paths and policies.
@@ -155,6 +154,7 @@ MANAGEMENT_HELP = [
 # @param name Input parameter consumed by `get_config_value`.
 # @return Result emitted by `get_config_value` according to command contract.
 def get_config_value(name):
+    _ensure_cli_config()
     return CONFIG.get(name, DEFAULT_CONFIG[name])
 
 
@@ -181,6 +181,7 @@ def get_editor():
 # @param fallback Input parameter consumed by `_load_config_rules`.
 # @return Result emitted by `_load_config_rules` according to command contract.
 def _load_config_rules(key, fallback):
+    _ensure_cli_config()
     raw_value = CONFIG.get(key, DEFAULT_CONFIG[key])
     if not isinstance(raw_value, list):
         print(f"Ignoring non-list value for {key}", file=sys.stderr)
@@ -298,45 +299,61 @@ def _coerce_unix_timestamp(value: object) -> Optional[int]:
 ## @brief Persist update-check idle-time cache state to JSON file.
 # @details Writes canonical fields `last_check_unix`, `last_check_human`,
 #          `idle_until_unix`, and `idle_until_human` using second-precision
-#          timestamps and emits standardized error diagnostics on I/O or timestamp failures.
+#          timestamps, plus the cached `latest_version` verdict when known, and emits
+#          standardized error diagnostics on I/O or timestamp failures.
 # @param last_check_unix Unix timestamp of last successful version check.
 # @param idle_until_unix Unix timestamp until next remote check is disabled.
+# @param latest_version Latest released version text from the last successful check, or `None`.
 # @return None.
-# @satisfies REQ-126 REQ-131 REQ-136 REQ-137
+# @satisfies REQ-126 REQ-131 REQ-136 REQ-137 REQ-156
 def _write_version_check_state(
     *,
     last_check_unix: int,
     idle_until_unix: int,
+    latest_version: Optional[str] = None,
 ) -> None:
     try:
         last_check_time = datetime.fromtimestamp(last_check_unix)
         idle_until_time = datetime.fromtimestamp(idle_until_unix)
+        state: Dict[str, object] = {
+            "last_check_unix": int(last_check_unix),
+            "last_check_human": last_check_time.isoformat(
+                sep=" ",
+                timespec="seconds",
+            ),
+            "idle_until_unix": int(idle_until_unix),
+            "idle_until_human": idle_until_time.isoformat(
+                sep=" ",
+                timespec="seconds",
+            ),
+        }
+        if latest_version:
+            state["latest_version"] = latest_version
         VERSION_CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         with open(VERSION_CHECK_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "last_check_unix": int(last_check_unix),
-                    "last_check_human": last_check_time.isoformat(
-                        sep=" ",
-                        timespec="seconds",
-                    ),
-                    "idle_until_unix": int(idle_until_unix),
-                    "idle_until_human": idle_until_time.isoformat(
-                        sep=" ",
-                        timespec="seconds",
-                    ),
-                },
-                f,
-            )
+            json.dump(state, f)
     except (OSError, OverflowError, ValueError) as exc:
         _print_update_check_error(f"idle-time state write failed: {exc}")
 
 
+## @brief Extract the cached `latest_version` verdict from idle-time state.
+# @details Accepts only non-empty string values so malformed cache payloads never
+#          produce update warnings.
+# @param cache_data Parsed idle-time JSON object.
+# @return Cached latest version text, or `None` when absent or invalid.
+def _cached_latest_version(cache_data: Dict[str, object]) -> Optional[str]:
+    value = cache_data.get("latest_version")
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
 ## @brief Persist the canonical extended idle-time state for version-check errors.
 # @details Reuses cached `last_check_unix` when available, normalizes missing or
 #          invalid cached values to `0`, and writes `idle_until_unix = now_unix +
 #          VERSION_CHECK_ERROR_IDLE_DELAY_SECONDS` to suppress repeated failing
-#          version checks across all terminal error branches.
+#          version checks across all terminal error branches. The cached
+#          `latest_version` verdict is carried over unchanged.
 # @param cache_data Parsed idle-time JSON object from prior state.
 # @param now_unix Current unix timestamp captured by the active release-check attempt.
 # @return None.
@@ -351,25 +368,101 @@ def _write_version_check_error_state(
     _write_version_check_state(
         last_check_unix=last_check_unix,
         idle_until_unix=now_unix + VERSION_CHECK_ERROR_IDLE_DELAY_SECONDS,
+        latest_version=_cached_latest_version(cache_data),
+    )
+
+
+## @brief Spawn a detached process that refreshes the update-check idle-time cache.
+# @details Starts `python -c` on `_run_background_version_check` in a new session
+#          (POSIX) or detached process group (Windows) with all standard streams bound
+#          to `os.devnull`, so the foreground command never waits on the network.
+#          The package parent directory is prepended to `PYTHONPATH` to keep source-tree
+#          execution importable. Spawn failures are ignored.
+# @param timeout_seconds HTTP timeout forwarded to the background release check.
+# @return None.
+# @satisfies REQ-156
+def _spawn_background_version_check(timeout_seconds: float) -> None:
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    env = os.environ.copy()
+    python_path = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = (
+        package_parent + os.pathsep + python_path if python_path else package_parent
+    )
+    command = [
+        sys.executable,
+        "-c",
+        "from git_alias.core import _run_background_version_check; "
+        f"_run_background_version_check({float(timeout_seconds)!r})",
+    ]
+    popen_kwargs: Dict[str, object] = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "env": env,
+        "close_fds": True,
+    }
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = getattr(
+            subprocess, "DETACHED_PROCESS", 0
+        ) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+    else:
+        popen_kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(command, **popen_kwargs)
+    except (OSError, ValueError):
+        pass
+
+
+## @brief Execute the detached update-check refresh worker.
+# @details Entry point of the process spawned by `_spawn_background_version_check`;
+#          runs the online release check ignoring the refresh lease so the idle-time
+#          JSON receives the new verdict or the error idle window.
+# @param timeout_seconds HTTP timeout applied to the release-check request.
+# @return None.
+# @satisfies REQ-156
+def _run_background_version_check(
+    timeout_seconds: float = VERSION_CHECK_TIMEOUT_SECONDS,
+) -> None:
+    check_for_newer_version(
+        repo_root=Path.cwd(),
+        timeout_seconds=timeout_seconds,
+        ignore_idle_cache=True,
     )
 
 
+## @brief Open one release-check HTTP request through `urllib.request.urlopen`.
+# @details Imports `urllib.request` on first use so command dispatch does not load the
+#          HTTP stack; only online update checks reach this function.
+# @param request `urllib.request.Request` to send.
+# @param timeout HTTP timeout in seconds.
+# @return Response object usable as a context manager.
+# @satisfies REQ-175
+def urlopen(request, timeout=None):
+    from urllib.request import urlopen as open_url
+
+    return open_url(request, timeout=timeout)
+
+
 ## @brief Execute `check_for_newer_version` runtime logic for Git-Alias CLI.
 # @details Executes `check_for_newer_version` using deterministic CLI control-flow,
 #          explicit error propagation, a fixed 3600-second idle window after
 #          successful release checks, and a fixed 86400-second idle window after
 #          terminal version-check errors while rewriting the idle-time JSON before
-#          returning control on every error path.
+#          returning control on every error path. With `background_refresh`, an
+#          expired idle window prints the cached `latest_version` verdict, persists a
+#          short refresh lease, and delegates the online check to a detached process.
 # @param repo_root Input parameter consumed by `check_for_newer_version`.
 # @param timeout_seconds Input parameter consumed by `check_for_newer_version`.
 # @param ignore_idle_cache When `True`, bypasses `idle_until_unix` gating and forces an online check.
+# @param background_refresh When `True`, never performs network I/O in the calling process.
 # @return Result emitted by `check_for_newer_version` according to command contract.
-# @satisfies REQ-123 REQ-126 REQ-127 REQ-129 REQ-130 REQ-131 REQ-137
+# @satisfies REQ-123 REQ-126 REQ-127 REQ-129 REQ-130 REQ-131 REQ-137 REQ-156
 def check_for_newer_version(
     *,
     repo_root: Optional[Path] = None,
     timeout_seconds: float = VERSION_CHECK_TIMEOUT_SECONDS,
     ignore_idle_cache: bool = False,
+    background_refresh: bool = False,
 ) -> None:
     now = datetime.now()
     now_unix = int(now.timestamp())
@@ -408,6 +501,25 @@ def check_for_newer_version(
         _print_update_check_error("installed version is not semantic version.")
         return
 
+    if background_refresh:
+        cached_latest_text = _cached_latest_version(cache_data)
+        cached_latest = (
+            _parse_semver_tuple(cached_latest_text) if cached_latest_text else None
+        )
+        last_check_unix = _coerce_unix_timestamp(cache_data.get("last_check_unix"))
+        _write_version_check_state(
+            last_check_unix=last_check_unix if last_check_unix is not None else 0,
+            idle_until_unix=now_unix + VERSION_CHECK_REFRESH_LEASE_SECONDS,
+            latest_version=cached_latest_text,
+        )
+        _spawn_background_version_check(timeout_seconds)
+        if cached_latest is not None and cached_latest > current:
+            _print_update_available_warning(current, cached_latest_text)
+        return
+
+    from urllib.error import HTTPError, URLError
+    from urllib.request import Request
+
     root = Path(repo_root) if repo_root is not None else get_git_root()
     release_api_url = _resolve_release_api_url(root)
 
@@ -476,6 +588,7 @@ def check_for_newer_version(
     _write_version_check_state(
         last_check_unix=now_unix,
         idle_until_unix=now_unix + idle_seconds,
+        latest_version=latest_text,
     )
 
     if latest > current:
@@ -588,6 +701,36 @@ def load_cli_config(root=None, home=None):
     return config_path
 
 
+## @brief Store whether `main` deferred configuration loading until first access.
+_CONFIG_LOAD_PENDING = False
+
+
+## @brief Load the configuration deferred by `main` on first access.
+# @details Resolves the repository root and runs `load_cli_config` once per `main`
+#          invocation, so aliases that never read configuration skip both steps.
+# @return None.
+# @satisfies REQ-175
+def _ensure_cli_config():
+    global _CONFIG_LOAD_PENDING
+    if _CONFIG_LOAD_PENDING:
+        _CONFIG_LOAD_PENDING = False
+        load_cli_config(get_git_root())
+
+
+@contextmanager
+## @brief Defer configuration loading for one `main` invocation.
+# @details Marks configuration as pending for `_ensure_cli_config` and clears the mark
+#          on exit so direct helper calls outside `main` keep using `CONFIG` as-is.
+# @return Context manager yielding `None`.
+def _deferred_cli_config():
+    global _CONFIG_LOAD_PENDING
+    _CONFIG_LOAD_PENDING = True
+    try:
+        yield
+    finally:
+        _CONFIG_LOAD_PENDING = False
+
+
 ## @brief Execute `_write_missing_config_values` runtime logic for Git-Alias CLI.
 # @details Executes `_write_missing_config_values` using deterministic CLI control-flow and explicit error propagation.
 # @param config_path Input parameter consumed by `_write_missing_config_values`.
@@ -761,7 +904,7 @@ HELP_TEXTS = {
     "get": "Fast-forward local master and develop from origin (with tags) and fast-forward merge develop into the current work branch after preflight checks.",
     "gp": "Open git commits graph (Git K).",
     "gr": "Open git tags graph (Git K).",
-    "l": "Print commit history as a text-based tree. Options: --all, --no-color, --no-status, --reverse, --wrap, --abbrev=<n>, --svdepth=<n>, --style=<n>, --graph-margin-left=<n>, --graph-margin-right=<n>, --graph-symbol-commit=<s>, --graph-symbol-merge=<s>, --graph-symbol-overpass=<s>, --graph-symbol-root=<s>, --graph-symbol-tip=<s>.",
+    "l": "Print commit history as a text-based tree. Options: --all, --no-color, --no-status, --reverse, --wrap, --page[=<n>], --json, --abbrev=<n>, --svdepth=<n>, --style=<n>, --graph-margin-left=<n>, --graph-margin-right=<n>, --graph-symbol-commit=<s>, --graph-symbol-merge=<s>, --graph-symbol-overpass=<s>, --graph-symbol-root=<s>, --graph-symbol-tip=<s>.",
     "lb": "Print all branches.",
     "lg": "Print commit history.",
     "lh": "Print last commit details.",
@@ -996,6 +1139,287 @@ class CommandExecutionError(RuntimeError):
         return str(data)
 
 
+## @brief Constant `GIT_SESSION_CACHED_COMMANDS` used by CLI runtime paths and policies.
+# @details Lists read-only git subcommands whose captured output depends only on refs,
+#          objects, index, or configuration and may be memoized until the next mutation.
+GIT_SESSION_CACHED_COMMANDS = frozenset(
+    {
+        "cat-file",
+        "describe",
+        "for-each-ref",
+        "ls-files",
+        "merge-base",
+        "rev-list",
+        "rev-parse",
+        "show-ref",
+    }
+)
+## @brief Constant `GIT_SESSION_READ_ONLY_COMMANDS` used by CLI runtime paths and policies.
+# @details Lists read-only git subcommands that are never memoized (worktree-dependent or
+#          large outputs) but do not invalidate the session either.
+GIT_SESSION_READ_ONLY_COMMANDS = frozenset(
+    {
+        "blame",
+        "diff",
+        "grep",
+        "log",
+        "ls-tree",
+        "shortlog",
+        "show",
+        "status",
+        "var",
+        "version",
+    }
+)
+## @brief Constant `GIT_SESSION_STABLE_QUERIES` used by CLI runtime paths and policies.
+# @details Repository-location queries whose answers survive every mutation issued by one invocation.
+GIT_SESSION_STABLE_QUERIES = frozenset(
+    {
+        ("rev-parse", "--show-toplevel"),
+        ("rev-parse", "--git-common-dir"),
+        ("rev-parse", "--git-dir"),
+        ("rev-parse", "--is-inside-work-tree"),
+    }
+)
+## @brief Constant `GIT_SESSION_CACHED_SUBCOMMANDS` used by CLI runtime paths and policies.
+# @details `(command, first option)` pairs of otherwise mutating commands whose query form is memoizable.
+GIT_SESSION_CACHED_SUBCOMMANDS = frozenset(
+    {
+        ("branch", "--show-current"),
+        ("config", "--get"),
+        ("config", "--get-all"),
+        ("config", "--get-regexp"),
+        ("config", "--list"),
+        ("config", "-l"),
+        ("remote", "get-url"),
+    }
+)
+## @brief Constant `GIT_SESSION_READ_ONLY_SUBCOMMANDS` used by CLI runtime paths and policies.
+# @details `(command, first option)` pairs of otherwise mutating commands that only read state.
+GIT_SESSION_READ_ONLY_SUBCOMMANDS = frozenset({("worktree", "list")})
+## @brief Constant `GIT_SESSION_LS_FILES_WORKTREE_OPTIONS` used by CLI runtime paths and policies.
+# @details `ls-files` options that inspect the worktree instead of the index and so disable memoization.
+GIT_SESSION_LS_FILES_WORKTREE_OPTIONS = frozenset(
+    {"-o", "--others", "-m", "--modified", "-d", "--deleted", "-k", "--killed", "-i", "--ignored"}
+)
+## @brief Constant `GIT_SESSION_REF_RE` used by CLI runtime paths and policies.
+# @details Matches full ref names that `git cat-file --batch-check` resolves with the same
+#          result as `git show-ref --verify`; anything else falls back to `show-ref`.
+GIT_SESSION_REF_RE = re.compile(r"refs/(?!.*(?:\.\.|@\{))[^\s~^:?*\[\\]+")
+## @brief Constant `GIT_SESSION_OBJECT_ID_RE` used by CLI runtime paths and policies.
+GIT_SESSION_OBJECT_ID_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+
+## @brief Class `GitSession` memoizes git queries for one CLI invocation.
+# @details Serves repeated read-only git queries from an in-memory memo, resolves ref
+#          existence through one long-lived `git cat-file --batch-check` process, and
+#          drops both after any command that may mutate refs, index, or configuration.
+# @satisfies REQ-174
+class GitSession:
+    ## @brief Execute `__init__` runtime logic for Git-Alias CLI.
+    # @param self Input parameter consumed by `__init__`.
+    # @return None.
+    def __init__(self):
+        self._memo = {}
+        self._stable = {}
+        self._batch = None
+        self._batch_cwd = None
+
+    @staticmethod
+    ## @brief Classify one git argv for session memoization.
+    # @details Returns `"stable"` for repository-location queries, `"cache"` for
+    #          memoizable read-only queries, `"read"` for uncached read-only commands,
+    #          and `"mutate"` for every other command (including non-git and shell commands).
+    # @param args Command argv sequence or shell string.
+    # @return Policy token among `"stable"`, `"cache"`, `"read"`, `"mutate"`.
+    def classify(args) -> str:
+        if isinstance(args, (str, bytes)) or len(args) < 2 or args[0] != "git":
+            return "mutate"
+        command = args[1]
+        options = args[2:]
+        if (command, *options) in GIT_SESSION_STABLE_QUERIES:
+            return "stable"
+        subcommand = (command, options[0] if options else None)
+        if subcommand in GIT_SESSION_CACHED_SUBCOMMANDS:
+            return "cache"
+        if subcommand in GIT_SESSION_READ_ONLY_SUBCOMMANDS:
+            return "read"
+        if command == "ls-files" and GIT_SESSION_LS_FILES_WORKTREE_OPTIONS.intersection(
+            options
+        ):
+            return "read"
+        if command == "cat-file" and any(
+            option.startswith("--batch") for option in options
+        ):
+            return "read"
+        if command in GIT_SESSION_CACHED_COMMANDS:
+            return "cache"
+        if command in GIT_SESSION_READ_ONLY_COMMANDS:
+            return "read"
+        return "mutate"
+
+    @staticmethod
+    ## @brief Build the memo key of one `subprocess.run` call.
+    # @details Only calls that capture or discard stdout and provide no stdin payload,
+    #          environment override, or shell are memoizable.
+    # @param args Normalized argv tuple.
+    # @param kwargs `subprocess.run` keyword arguments.
+    # @return Hashable memo key, or `None` when the call must run uncached.
+    def _memo_key(args, kwargs):
+        stdout = kwargs.get("stdout")
+        if kwargs.get("capture_output"):
+            stdout = subprocess.PIPE
+        if stdout not in (subprocess.PIPE, subprocess.DEVNULL):
+            return None
+        if any(kwargs.get(name) is not None for name in ("input", "env", "stdin")):
+            return None
+        if kwargs.get("shell"):
+            return None
+        cwd = kwargs.get("cwd")
+        return (
+            args,
+            os.path.abspath(os.fspath(cwd)) if cwd is not None else os.getcwd(),
+            bool(kwargs.get("text") or kwargs.get("universal_newlines")),
+            kwargs.get("encoding"),
+            kwargs.get("errors"),
+            stdout,
+            kwargs.get("stderr"),
+            bool(kwargs.get("capture_output")),
+        )
+
+    ## @brief Execute one command through the session.
+    # @details Memoizable queries are served from the memo; other commands run directly
+    #          and invalidate the memo and batch process when classified as mutating.
+    #          `check` semantics match `subprocess.run`.
+    # @param popenargs Positional `subprocess.run` arguments.
+    # @param kwargs `subprocess.run` keyword arguments.
+    # @return `subprocess.CompletedProcess` result.
+    # @throws subprocess.CalledProcessError when `check` is true and the command failed.
+    def run(self, popenargs, kwargs):
+        args = kwargs.get("args", popenargs[0] if popenargs else None)
+        policy = self.classify(args)
+        if policy == "mutate":
+            try:
+                return subprocess.run(*popenargs, **kwargs)
+            finally:
+                self.invalidate()
+        if policy == "read" or len(popenargs) != 1:
+            return subprocess.run(*popenargs, **kwargs)
+        try:
+            normalized = tuple(os.fspath(part) for part in args)
+        except TypeError:
+            return subprocess.run(*popenargs, **kwargs)
+        key = self._memo_key(normalized, kwargs)
+        if key is None:
+            return subprocess.run(*popenargs, **kwargs)
+        memo = self._stable if policy == "stable" else self._memo
+        check = kwargs.get("check", False)
+        result = memo.get(key)
+        if result is None:
+            result = subprocess.run(*popenargs, **dict(kwargs, check=False))
+            if result.returncode == 0 or kwargs.get("stderr") is not None:
+                memo[key] = result
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
+        return result
+
+    ## @brief Report whether one full ref name exists.
+    # @details Resolves `ref_name` through the long-lived `git cat-file --batch-check`
+    #          process and memoizes the answer until the next invalidation.
+    # @param ref_name Full ref name starting with `refs/`.
+    # @return `True` when the ref resolves to an existing object; `None` when the batch
+    #         process is unavailable or the name is not batch-safe.
+    def ref_exists(self, ref_name) -> Optional[bool]:
+        if not GIT_SESSION_REF_RE.fullmatch(ref_name):
+            return None
+        cwd = os.getcwd()
+        key = ("ref", cwd, ref_name)
+        if key in self._memo:
+            return self._memo[key]
+        if self._batch is not None and self._batch_cwd != cwd:
+            self._close_batch()
+        try:
+            if self._batch is None:
+                self._batch = subprocess.Popen(
+                    ["git", "cat-file", "--batch-check=%(objectname)"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                )
+                self._batch_cwd = cwd
+            self._batch.stdin.write(ref_name + "\n")
+            self._batch.stdin.flush()
+            answer = self._batch.stdout.readline()
+        except OSError:
+            self._close_batch()
+            return None
+        if not answer:
+            self._close_batch()
+            return None
+        exists = GIT_SESSION_OBJECT_ID_RE.fullmatch(answer.strip()) is not None
+        self._memo[key] = exists
+        return exists
+
+    ## @brief Drop memoized ref-dependent answers and stop the batch process.
+    # @param self Input parameter consumed by `invalidate`.
+    # @return None.
+    def invalidate(self):
+        self._memo.clear()
+        self._close_batch()
+
+    ## @brief Release every session resource.
+    # @param self Input parameter consumed by `close`.
+    # @return None.
+    def close(self):
+        self.invalidate()
+        self._stable.clear()
+
+    ## @brief Terminate the long-lived `git cat-file --batch-check` process when present.
+    # @param self Input parameter consumed by `_close_batch`.
+    # @return None.
+    def _close_batch(self):
+        batch, self._batch = self._batch, None
+        self._batch_cwd = None
+        if batch is None:
+            return
+        try:
+            batch.stdin.close()
+        except OSError:
+            pass
+        try:
+            batch.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            batch.kill()
+            batch.wait()
+        batch.stdout.close()
+
+
+## @brief Store the active `GitSession`, or `None` outside `main`.
+_GIT_SESSION: Optional[GitSession] = None
+
+
+@contextmanager
+## @brief Open the per-invocation git session used by `_run_checked` and `_ref_exists`.
+# @details Context manager installing a fresh `GitSession` as `_GIT_SESSION` and closing it
+#          (including its batch process) on exit; nested use reuses the active session.
+# @return Context manager yielding the active `GitSession`.
+def git_session():
+    global _GIT_SESSION
+    if _GIT_SESSION is not None:
+        yield _GIT_SESSION
+        return
+    session = GitSession()
+    _GIT_SESSION = session
+    try:
+        yield session
+    finally:
+        _GIT_SESSION = None
+        session.close()
+
+
 ## @brief Execute `_run_checked` runtime logic for Git-Alias CLI.
 # @details Executes `_run_checked` using deterministic CLI control-flow and explicit error propagation.
 # @param *popenargs Input parameter consumed by `_run_checked`.
@@ -1004,6 +1428,8 @@ class CommandExecutionError(RuntimeError):
 def _run_checked(*popenargs, **kwargs):
     kwargs.setdefault("check", True)
     try:
+        if _GIT_SESSION is not None:
+            return _GIT_SESSION.run(popenargs, kwargs)
         return subprocess.run(*popenargs, **kwargs)
     except subprocess.CalledProcessError as exc:
         raise CommandExecutionError(exc) from None
@@ -1274,11 +1700,10 @@ def is_inside_git_repo():
     return output.strip().lower() == "true"
 
 
-@dataclass
 ## @brief Class `TagInfo` models a typed runtime container/error boundary.
 # @details Encapsulates tag identity, tag date, and resolved Git object identifier for changelog assembly.
 
-class TagInfo:
+class TagInfo(NamedTuple):
     ## @brief Store raw tag name including `v` prefix when present.
     name: str
     ## @brief Store ISO date string used for changelog section headers.
@@ -1287,17 +1712,37 @@ class TagInfo:
     object_name: str
 
 
-@dataclass(frozen=True)
 ## @brief Class `WorktreeInfo` models parsed worktree-to-branch association data.
 # @details Encapsulates a normalized absolute worktree path and its optional local branch binding
 #          as derived from `git worktree list --porcelain` output.
-class WorktreeInfo:
+class WorktreeInfo(NamedTuple):
     ## @brief Store normalized absolute worktree path.
     path: Path
     ## @brief Store associated local branch name or `None` for detached worktrees.
     branch_name: Optional[str]
 
 
+## @brief Class `OverviewRefGraph` models shared commit-distance data for overview sections.
+# @details Stores the commit hash of each available overview ref, each ref's
+#          commit count above the octopus merge-base, and the ahead/behind
+#          counts of the requested ref pairs, so sections 2 and 4 of the `o`
+#          alias render from one set of Git queries.
+class OverviewRefGraph(NamedTuple):
+    ## @brief Store resolved commit hash for every available ref.
+    hashes: Dict[str, str]
+    ## @brief Store commit count between the octopus merge-base and each available ref.
+    positions: Dict[str, int]
+    ## @brief Store `(ahead, behind)` counts keyed by `(base_ref, target_ref)`.
+    distances: Dict[Tuple[str, str], Tuple[int, int]]
+
+
+## @brief Constant `CHANGELOG_SECTION_FORMAT_VERSION` used by CLI runtime paths and policies.
+# @details Bump whenever changelog section rendering changes so cached sections are rebuilt.
+CHANGELOG_SECTION_FORMAT_VERSION = 1
+## @brief Constant `CHANGELOG_CACHE_DIR_NAME` used by CLI runtime paths and policies.
+CHANGELOG_CACHE_DIR_NAME = "git-alias"
+## @brief Constant `CHANGELOG_CACHE_FILE_NAME` used by CLI runtime paths and policies.
+CHANGELOG_CACHE_FILE_NAME = "changelog-sections.json"
 ## @brief Constant `DELIM` used by CLI runtime paths and policies.
 
 DELIM = "\x1f"
@@ -1437,6 +1882,125 @@ def git_log_subjects(repo_root: Path, rev_range: str) -> List[str]:
     return [x.strip() for x in out.split(RECORD) if x.strip()]
 
 
+## @brief Read commit messages for many tag ranges with one history walk.
+# @details Streams every tag-reachable commit once through `git log --tags` with
+#          hash, parents, tag decorations, and full message, then partitions the
+#          walk in memory. Each range `(exclude_tag, include_tag)` owns one bit in
+#          an include mask and one bit in an exclude mask; masks flow from children
+#          to parents in topological order, so a commit belongs to a range when its
+#          include bit is set and its exclude bit is not, matching `git log
+#          exclude_tag..include_tag` (or `git log include_tag` when `exclude_tag`
+#          is `None`). Each range is then replayed in git's default order (newest
+#          committer date first, ties in insertion order) and merges are skipped,
+#          matching `git_log_subjects`. Complexity O(C * R / w + C log C) for C
+#          commits, R ranges and machine word size w, with one subprocess
+#          regardless of R. Ranges whose tags are not decorated in the walk map to
+#          `None` so callers fall back to `git_log_subjects` instead of rendering an
+#          empty section.
+# @param repo_root Input parameter consumed by `git_log_subjects_by_range`.
+# @param ranges Ordered `(exclude_tag, include_tag)` pairs.
+# @return Mapping from each input range to its ordered non-merge commit messages, or `None`
+#         for ranges the walk cannot resolve.
+# @satisfies REQ-162
+def git_log_subjects_by_range(
+    repo_root: Path, ranges: List[Tuple[Optional[str], str]]
+) -> Dict[Tuple[Optional[str], str], Optional[List[str]]]:
+    ranges = list(dict.fromkeys(ranges))
+    result: Dict[Tuple[Optional[str], str], Optional[List[str]]] = {
+        rng: None for rng in ranges
+    }
+    if not ranges:
+        return result
+    fmt = f"%H{DELIM}%P{DELIM}%ct{DELIM}%D{DELIM}%B{RECORD}"
+    out = run_git_text(
+        [
+            "log",
+            "--tags",
+            "--decorate=short",
+            "--decorate-refs=refs/tags/",
+            f"--pretty=format:{fmt}",
+        ],
+        cwd=repo_root,
+        check=False,
+    )
+    if not out:
+        return result
+    commits: List[str] = []
+    parents: Dict[str, List[str]] = {}
+    commit_times: Dict[str, int] = {}
+    messages: Dict[str, str] = {}
+    tag_commits: Dict[str, str] = {}
+    for chunk in out.split(RECORD):
+        fields = chunk.lstrip("\n").split(DELIM, 4)
+        if len(fields) != 5:
+            continue
+        commit, parent_text, commit_time, decorations, message = fields
+        commits.append(commit)
+        parents[commit] = parent_text.split()
+        commit_times[commit] = int(commit_time or 0)
+        messages[commit] = message.strip()
+        for decoration in decorations.split(", "):
+            if decoration.startswith("tag: "):
+                tag_commits[decoration[len("tag: ") :]] = commit
+    include_bits: Dict[str, int] = defaultdict(int)
+    exclude_bits: Dict[str, int] = defaultdict(int)
+    for bit, (exclude_tag, include_tag) in enumerate(ranges):
+        if include_tag not in tag_commits:
+            continue
+        if exclude_tag is not None:
+            if exclude_tag not in tag_commits:
+                continue
+            exclude_bits[tag_commits[exclude_tag]] |= 1 << bit
+        include_bits[tag_commits[include_tag]] |= 1 << bit
+        result[(exclude_tag, include_tag)] = []
+    # Kahn order over the walked subgraph: every child before its parents.
+    child_counts: Dict[str, int] = defaultdict(int)
+    for commit in commits:
+        for parent in parents[commit]:
+            if parent in parents:
+                child_counts[parent] += 1
+    ready = [commit for commit in reversed(commits) if not child_counts[commit]]
+    include_masks: Dict[str, int] = {}
+    exclude_masks: Dict[str, int] = {}
+    hits: Dict[str, int] = {}
+    while ready:
+        commit = ready.pop()
+        include_mask = include_masks.pop(commit, 0) | include_bits.get(commit, 0)
+        exclude_mask = exclude_masks.pop(commit, 0) | exclude_bits.get(commit, 0)
+        commit_hits = include_mask & ~exclude_mask
+        if commit_hits:
+            hits[commit] = commit_hits
+        for parent in parents[commit]:
+            if parent not in parents:
+                continue
+            include_masks[parent] = include_masks.get(parent, 0) | include_mask
+            exclude_masks[parent] = exclude_masks.get(parent, 0) | exclude_mask
+            child_counts[parent] -= 1
+            if not child_counts[parent]:
+                ready.append(parent)
+    # Replay git's default walk per range: newest committer date first, ties
+    # in insertion order, restricted to the commits inside the range.
+    for bit, rng in enumerate(ranges):
+        start = tag_commits.get(rng[1])
+        if result[rng] is None or not hits.get(start, 0) >> bit & 1:
+            continue
+        sequence = 0
+        queue = [(-commit_times[start], sequence, start)]
+        queued = {start}
+        range_messages = result[rng]
+        while queue:
+            _, _, commit = heapq.heappop(queue)
+            if len(parents[commit]) <= 1 and messages[commit]:
+                range_messages.append(messages[commit])
+            for parent in parents[commit]:
+                if parent in queued or not hits.get(parent, 0) >> bit & 1:
+                    continue
+                queued.add(parent)
+                sequence += 1
+                heapq.heappush(queue, (-commit_times[parent], sequence, parent))
+    return result
+
+
 ## @brief Execute `parse_conventional_commit` runtime logic for Git-Alias CLI.
 # @details Parses a conventional-commit header with optional scope and optional breaking marker (`!`),
 #          then returns extracted type/scope/breaking/description fields for changelog rendering.
@@ -1544,6 +2108,7 @@ def _is_release_marker_commit(subject: str) -> bool:
 # @param date_s Input parameter consumed by `generate_section_for_range`.
 # @param rev_range Input parameter consumed by `generate_section_for_range`.
 # @param expected_version Input parameter consumed by `generate_section_for_range`.
+# @param subjects Pre-fetched commit messages for @p rev_range; when `None`, `git_log_subjects` reads them.
 # @return Result emitted by `generate_section_for_range` according to command contract.
 def generate_section_for_range(
     repo_root: Path,
@@ -1551,8 +2116,10 @@ def generate_section_for_range(
     date_s: str,
     rev_range: str,
     expected_version: Optional[str] = None,
+    subjects: Optional[List[str]] = None,
 ) -> Optional[str]:
-    subjects = git_log_subjects(repo_root, rev_range)
+    if subjects is None:
+        subjects = git_log_subjects(repo_root, rev_range)
     buckets: Dict[str, List[str]] = defaultdict(list)
     for subj in subjects:
         if _is_release_marker_commit(subj):
@@ -1623,6 +2190,8 @@ def _extract_owner_repo(remote_url: str) -> Optional[Tuple[str, str]]:
             return None
         path_part = value.split(":", 1)[1]
     else:
+        from urllib.parse import urlparse
+
         parsed = urlparse(value)
         if parsed.scheme not in {"http", "https", "ssh", "git+ssh"} or not parsed.netloc:
             return None
@@ -1731,6 +2300,90 @@ def build_history_section(
     return "\n".join(lines).rstrip() + "\n"
 
 
+## @brief Resolve the on-disk changelog section cache path for a repository.
+# @details Places the cache under `<git-common-dir>/git-alias/` so every worktree
+#          of one repository shares it and it never appears in the working tree.
+# @param repo_root Absolute path to the repository root used as CWD for the git query.
+# @return Cache file path, or `None` when the Git directory cannot be resolved.
+# @satisfies REQ-163
+def _changelog_cache_path(repo_root: Path) -> Optional[Path]:
+    try:
+        common_dir = run_git_text(["rev-parse", "--git-common-dir"], cwd=repo_root)
+    except RuntimeError:
+        return None
+    if not common_dir:
+        return None
+    git_dir = Path(common_dir)
+    if not git_dir.is_absolute():
+        git_dir = Path(repo_root) / git_dir
+    return git_dir / CHANGELOG_CACHE_DIR_NAME / CHANGELOG_CACHE_FILE_NAME
+
+
+## @brief Build the cache key of one changelog release range.
+# @details Combines the formatter version with the name and object ID
+#          (`TagInfo.object_name`) of the previous and current tags. Object IDs make
+#          moved or re-created tags miss the cache; names are needed because a
+#          lightweight tag's object ID is its commit, and the tag name drives the
+#          section's `expected_version` filter. Git ref names cannot contain `:`,
+#          so the last `:`-separated field is always `<tag.name>@<tag.object_name>`.
+# @param prev_tag Range lower bound tag, or `None` for a range starting at the root.
+# @param tag Range upper bound tag.
+# @return Deterministic cache key string.
+def _changelog_cache_key(prev_tag: Optional[TagInfo], tag: TagInfo) -> str:
+    prev_part = f"{prev_tag.name}@{prev_tag.object_name}" if prev_tag else "-"
+    return (
+        f"{CHANGELOG_SECTION_FORMAT_VERSION}:{prev_part}:{tag.name}@{tag.object_name}"
+    )
+
+
+## @brief Load cached changelog section bodies.
+# @details Returns an empty mapping when the file is missing, unreadable, malformed,
+#          or written by another formatter version. Values are rendered section bodies
+#          without the `## <title> - <date>` header, or `None` for empty ranges.
+# @param cache_path Cache file path from `_changelog_cache_path`.
+# @return Mapping `{cache_key: section_body_or_None}`.
+def _load_changelog_cache(cache_path: Path) -> Dict[str, Optional[str]]:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    if payload.get("format") != CHANGELOG_SECTION_FORMAT_VERSION:
+        return {}
+    sections = payload.get("sections")
+    if not isinstance(sections, dict):
+        return {}
+    return {
+        key: value
+        for key, value in sections.items()
+        if isinstance(key, str) and (value is None or isinstance(value, str))
+    }
+
+
+## @brief Persist changelog section bodies for the ranges rendered in this run.
+# @details Writes through a temporary sibling file and `os.replace`, so readers never
+#          see partial JSON. I/O failures are ignored because the cache is an
+#          optimization.
+# @param cache_path Cache file path from `_changelog_cache_path`.
+# @param sections Mapping `{cache_key: section_body_or_None}` to store.
+# @return None.
+def _store_changelog_cache(cache_path: Path, sections: Dict[str, Optional[str]]) -> None:
+    payload = {"format": CHANGELOG_SECTION_FORMAT_VERSION, "sections": sections}
+    temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+
+
 ## @brief Generate the full CHANGELOG.md document from repository tags and commits.
 # @details Groups commits by minor release (semver where `patch=0` AND version `>=0.1.0`).
 #          By default only minor releases appear; the document body is empty when none exist.
@@ -1741,11 +2394,13 @@ def build_history_section(
 #          minor tags when `include_patch=False`; minor tags plus the latest patch when
 #          `include_patch=True`. Diff links in `# History` use the same ranges as the
 #          corresponding changelog sections. History generation can be disabled by flag.
+#          Commit messages for every section come from one `git_log_subjects_by_range` walk;
+#          sections already present in the `.git/git-alias/` cache are reused without it.
 # @param repo_root Absolute path to the repository root used as CWD for all git commands.
 # @param include_patch When `True`, prepend the latest patch release section to the document.
 # @param disable_history When `True`, omit `# History` section from output.
 # @return Complete `CHANGELOG.md` string content, terminated with a newline.
-# @satisfies REQ-018, REQ-040, REQ-041, REQ-043, REQ-068, REQ-069, REQ-070
+# @satisfies REQ-018, REQ-040, REQ-041, REQ-043, REQ-068, REQ-069, REQ-070, REQ-162, REQ-163
 ## @brief Execute `generate_changelog_document` runtime logic for Git-Alias CLI.
 # @details Executes `generate_changelog_document` using deterministic CLI control-flow and explicit error propagation.
 # @param repo_root Input parameter consumed by `generate_changelog_document`.
@@ -1758,50 +2413,61 @@ def generate_changelog_document(
     all_tags = list_tags_sorted_by_date(repo_root)
     origin_base = _canonical_origin_base(repo_root)
     lines: List[str] = ["# Changelog", ""]
-    release_sections: List[str] = []
     minor_tags = [t for t in all_tags if _is_minor_release_tag(t.name)]
     last_minor: Optional[TagInfo] = minor_tags[-1] if minor_tags else None
     latest_patch: Optional[TagInfo] = None
     if include_patch:
         latest_patch = _latest_patch_tag_after(all_tags, last_minor)
-        if latest_patch:
-            rev_range = (
-                f"{last_minor.name}..{latest_patch.name}"
-                if last_minor
-                else latest_patch.name
-            )
-            display = latest_patch.name.lstrip("v")
-            compare_url = get_origin_compare_url(
-                origin_base, last_minor.name if last_minor else None, latest_patch.name
-            )
-            title = f"[{display}]({compare_url})" if compare_url else display
+    jobs: List[Tuple[Optional[TagInfo], TagInfo]] = []
+    if latest_patch:
+        jobs.append((last_minor, latest_patch))
+    prev_tag: Optional[TagInfo] = None
+    for tag in minor_tags:
+        jobs.append((prev_tag, tag))
+        prev_tag = tag
+    ranges = [(prev.name if prev else None, tag.name) for prev, tag in jobs]
+    keys = [_changelog_cache_key(prev, tag) for prev, tag in jobs]
+    cache_path = _changelog_cache_path(repo_root)
+    cached = _load_changelog_cache(cache_path) if cache_path else {}
+    missing = [rng for rng, key in zip(ranges, keys) if key not in cached]
+    range_subjects = git_log_subjects_by_range(repo_root, missing) if missing else {}
+    sections: List[Optional[str]] = []
+    bodies: Dict[str, Optional[str]] = {}
+    for (prev_name, tag_name), key, (_, tag) in zip(ranges, keys, jobs):
+        rev_range = tag_name if prev_name is None else f"{prev_name}..{tag_name}"
+        display = tag_name.lstrip("v")
+        compare_url = get_origin_compare_url(origin_base, prev_name, tag_name)
+        title = f"[{display}]({compare_url})" if compare_url else display
+        if key in cached:
+            body = cached[key]
+            section = None if body is None else f"## {title} - {tag.iso_date}\n{body}"
+        else:
             section = generate_section_for_range(
                 repo_root,
                 title,
-                latest_patch.iso_date,
+                tag.iso_date,
                 rev_range,
                 expected_version=display,
+                subjects=range_subjects.get((prev_name, tag_name)),
             )
-            if section:
-                lines.append(section)
-    prev_included: Optional[str] = None
-    for tag in minor_tags:
-        rev_range = (
-            tag.name if prev_included is None else f"{prev_included}..{tag.name}"
-        )
-        display = tag.name.lstrip("v")
-        compare_url = get_origin_compare_url(origin_base, prev_included, tag.name)
-        title = f"[{display}]({compare_url})" if compare_url else display
-        section = generate_section_for_range(
-            repo_root,
-            title,
-            tag.iso_date,
-            rev_range,
-            expected_version=display,
-        )
-        if section:
-            release_sections.append(section)
-        prev_included = tag.name
+            body = section.partition("\n")[2] if section else None
+        bodies[key] = body
+        sections.append(section)
+    if cache_path:
+        live_objects = {f"{tag.name}@{tag.object_name}" for tag in all_tags}
+        stored = {
+            key: body
+            for key, body in cached.items()
+            if key.rsplit(":", 1)[-1] in live_objects
+        }
+        stored.update(bodies)
+        if stored != cached:
+            _store_changelog_cache(cache_path, stored)
+    if latest_patch:
+        patch_section = sections.pop(0)
+        if patch_section:
+            lines.append(patch_section)
+    release_sections = [section for section in sections if section]
     if release_sections:
         lines.extend(reversed(release_sections))
     if not disable_history:
@@ -1823,14 +2489,15 @@ def generate_changelog_document(
 ## @brief Store resolved per-rule context for version discovery and matching.
 # @details Encapsulates immutable artifacts required across detect/update/verify phases:
 #          compiled regex, resolved file list, and pre-rendered relative-path map for stable debug output.
+#          `bytes_regex` is the byte-pattern twin used for memory-mapped scans, or `None` when not byte-safe.
 # @note Complexity: O(1) storage per field; aggregate complexity scales with matched file count per rule.
-@dataclass(frozen=True)
-class VersionRuleContext:
+class VersionRuleContext(NamedTuple):
     pattern: str
     expression: str
     compiled_regex: re.Pattern
     files: List[Path]
     relative_map: Dict[Path, str]
+    bytes_regex: Optional[re.Pattern] = None
 
 
 ## @brief Normalize a `ver_rules` pattern to the internal pathspec matching form.
@@ -1850,37 +2517,258 @@ def _normalize_version_rule_pattern(pattern: str) -> str:
     return normalized_pattern
 
 
-## @brief Build a deduplicated repository file inventory for version rule evaluation.
-# @details Executes a single `git ls-files` query from repository root, filters to existing files only,
-#          applies hardcoded exclusion regexes, normalizes relative paths, and deduplicates by resolved path.
+## @brief Constant `GIT_INDEX_MODE_SYMLINK` used by CLI runtime paths and policies.
+# @details Index mode reported by `git ls-files --stage` for tracked symbolic links.
+GIT_INDEX_MODE_SYMLINK = "120000"
+## @brief Constant `GIT_INDEX_MODE_GITLINK` used by CLI runtime paths and policies.
+# @details Index mode reported by `git ls-files --stage` for submodule entries (never regular files).
+GIT_INDEX_MODE_GITLINK = "160000"
+
+
+## @brief Store one tracked path of the version-rule inventory.
+# @details Carries the index metadata needed to defer filesystem checks until a rule selects the path.
+# @note Complexity: O(1) storage per field.
+class VersionInventoryEntry(NamedTuple):
+    path: Path
+    relative: str
+    symlink: bool = False
+
+
+## @brief Build the tracked-file inventory for version rule evaluation without filesystem access.
+# @details Executes a single `git ls-files -z --stage` query from repository root, skips submodule
+#          entries and duplicate unmerged stages, applies hardcoded exclusion regexes, and normalizes
+#          relative paths. Symlinks are flagged from index mode `120000`; existence checks and
+#          symlink dedup are deferred to `_resolve_version_candidates`, which stats rule candidates and symlinks only.
 # @param root Repository root path used as traversal anchor.
-# @return List of tuples `(absolute_path, normalized_relative_path)` used by downstream matchers.
-def _build_version_file_inventory(root: Path) -> List[Tuple[Path, str]]:
-    inventory: List[Tuple[Path, str]] = []
-    seen = set()
+# @return List of `VersionInventoryEntry` records in index order.
+# @satisfies REQ-177
+def _build_version_file_inventory(root: Path) -> List[VersionInventoryEntry]:
+    inventory: List[VersionInventoryEntry] = []
+    previous = None
     try:
-        tracked_files = run_git_text(["ls-files"], cwd=root)
+        tracked_files = run_git_text(["ls-files", "-z", "--stage"], cwd=root)
     except RuntimeError as exc:
         raise VersionDetectionError(
             f"Unable to list repository files with git ls-files: {exc}"
         ) from None
-    for relative in tracked_files.splitlines():
-        normalized_relative = (relative or "").replace("\\", "/").strip()
+    for record in tracked_files.split("\0"):
+        metadata, separator, relative = record.partition("\t")
+        if not separator:
+            continue
+        mode = metadata.split(" ", 1)[0]
+        if mode == GIT_INDEX_MODE_GITLINK or relative == previous:
+            continue
+        previous = relative
+        normalized_relative = relative.replace("\\", "/").strip()
         if not normalized_relative:
             continue
         if normalized_relative.startswith("./"):
             normalized_relative = normalized_relative[2:]
         if _is_version_path_excluded(normalized_relative):
             continue
-        path = root / Path(normalized_relative)
-        if not path.is_file():
+        inventory.append(
+            VersionInventoryEntry(
+                root / Path(normalized_relative),
+                normalized_relative,
+                mode == GIT_INDEX_MODE_SYMLINK,
+            )
+        )
+    return inventory
+
+
+## @brief Constant `VERSION_SCAN_PARALLEL_MIN_FILES` used by CLI runtime paths and policies.
+# @details Distinct matched-file count from which version files are read and scanned by a thread pool;
+#          smaller sets are processed serially because pool startup would dominate.
+VERSION_SCAN_PARALLEL_MIN_FILES = 16
+## @brief Constant `VERSION_SCAN_MAX_WORKERS` used by CLI runtime paths and policies.
+# @details Upper bound of reader threads used by `_prefetch_version_scans`.
+VERSION_SCAN_MAX_WORKERS = 16
+
+
+## @brief Apply a blocking file-system function to many version-file items.
+# @details Runs `function` through a thread pool when at least `VERSION_SCAN_PARALLEL_MIN_FILES` items
+#          are given, so per-file latency (stat, open, read) overlaps on slow or network filesystems;
+#          smaller inputs are processed serially. Results keep input order.
+# @param function Callable applied to each item; must not write to stdout or stderr.
+# @param *iterables Argument sequences zipped as in `map`.
+# @return List of results aligned with the input order.
+# @satisfies REQ-178
+def _map_version_io(function, *iterables) -> list:
+    columns = [list(iterable) for iterable in iterables]
+    count = min((len(column) for column in columns), default=0)
+    if count < VERSION_SCAN_PARALLEL_MIN_FILES:
+        return list(map(function, *columns))
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=min(VERSION_SCAN_MAX_WORKERS, count)
+    ) as executor:
+        return list(executor.map(function, *columns))
+
+
+## @brief Filter rule-selected inventory entries to existing files deduplicated across the inventory.
+# @details Applies the inventory-wide dedup of a full `is_file` + `resolve` pass over every tracked
+#          path (first existing path in inventory order wins for each real file) while touching the
+#          filesystem only for rule candidates, tracked symlinks, and tracked targets of symlinks.
+#          Regular tracked paths are distinct by construction, so only symlinks are resolved. Because
+#          dedup is global, a real file reachable through a symlink is kept under one path for all
+#          rules, so no two kept paths share a real file.
+# @param root Repository root path used to map resolved symlink targets back to relative paths.
+# @param inventory Full `VersionInventoryEntry` list in inventory order.
+# @param candidate_lists Per-rule `VersionInventoryEntry` lists from `VersionRuleMatcher.collect`.
+# @return Per-rule lists of existing, globally deduplicated file paths in inventory order.
+# @satisfies REQ-177
+def _resolve_version_candidates(root: Path, inventory, candidate_lists) -> List[List[Path]]:
+    selected = {entry.relative for entries in candidate_lists for entry in entries}
+    real_root = None
+    identities: Dict[str, str] = {}
+    symlinks = [entry for entry in inventory if entry.symlink]
+    for entry, is_file in zip(
+        symlinks, _map_version_io(Path.is_file, [entry.path for entry in symlinks])
+    ):
+        if not is_file:
             continue
-        resolved = path.resolve()
-        if resolved in seen:
+        if real_root is None:
+            real_root = root.resolve()
+        resolved = entry.path.resolve()
+        try:
+            identities[entry.relative] = resolved.relative_to(real_root).as_posix()
+        except ValueError:
+            identities[entry.relative] = str(resolved)
+    targets = set(identities.values())
+    regular = [
+        entry
+        for entry in inventory
+        if not entry.symlink and (entry.relative in selected or entry.relative in targets)
+    ]
+    for entry, is_file in zip(
+        regular, _map_version_io(Path.is_file, [entry.path for entry in regular])
+    ):
+        if is_file:
+            identities[entry.relative] = entry.relative
+    kept = set()
+    seen = set()
+    for entry in inventory:
+        identity = identities.get(entry.relative)
+        if identity is None or identity in seen:
             continue
-        seen.add(resolved)
-        inventory.append((path, normalized_relative))
-    return inventory
+        seen.add(identity)
+        kept.add(entry.relative)
+    return [
+        [entry.path for entry in entries if entry.relative in kept]
+        for entries in candidate_lists
+    ]
+
+
+## @brief Constant `VERSION_RULE_GLOB_CHARS` used by CLI runtime paths and policies.
+# @details Characters that make a normalized `ver_rules` pattern non-literal for the matcher fast index.
+VERSION_RULE_GLOB_CHARS = frozenset("*?[]\\!#")
+
+
+## @brief Class `VersionRuleMatcher` classifies inventory paths against every `ver_rules` pattern at once.
+# @details Compiles all rule patterns once with pathspec gitignore semantics. Literal patterns
+#          (no wildcard) are served from dictionaries: anchored patterns by exact path and
+#          ancestor-directory prefix, unanchored names by path component. Wildcard patterns are
+#          pre-filtered by one combined regex so a path that matches no rule costs one regex
+#          test plus `O(depth)` dictionary lookups instead of one pathspec test per rule.
+# @note Complexity: O(paths * (depth + 1)) for non-matching paths; matching paths additionally
+#       test the individual wildcard regexes.
+# @satisfies REQ-176
+class VersionRuleMatcher:
+    ## @brief Execute `__init__` runtime logic for Git-Alias CLI.
+    # @param self Input parameter consumed by `__init__`.
+    # @param patterns Raw `ver_rules` patterns in rule order.
+    # @return None.
+    def __init__(self, patterns):
+        self.rule_count = len(patterns)
+        self._anchored: Dict[str, List[Tuple[int, bool]]] = {}
+        self._names: Dict[str, List[Tuple[int, bool]]] = {}
+        self._wildcards: List[Tuple[int, re.Pattern]] = []
+        wildcard_sources = []
+        pathspec = None
+        for index, pattern in enumerate(patterns):
+            normalized = _normalize_version_rule_pattern(pattern)
+            if not normalized:
+                continue
+            if self._index_literal(index, normalized):
+                continue
+            if pathspec is None:
+                pathspec = importlib.import_module("pathspec")
+            for compiled in pathspec.PathSpec.from_lines("gitignore", [normalized]).patterns:
+                if compiled.include and compiled.regex is not None:
+                    self._wildcards.append((index, compiled.regex))
+                    wildcard_sources.append(f"(?:{compiled.regex.pattern})")
+        self._name_keys = frozenset(self._names)
+        self._anchored_depths = sorted({key.count("/") + 1 for key in self._anchored})
+        self._any_wildcard = None
+        if wildcard_sources:
+            try:
+                self._any_wildcard = re.compile("|".join(wildcard_sources))
+            except re.error:
+                self._any_wildcard = None
+
+    ## @brief Register one wildcard-free pattern in the literal fast index.
+    # @details Mirrors the gitignore regexes pathspec generates for literal patterns: an
+    #          anchored `/a/b` matches `a/b` and everything below it, an unanchored `name`
+    #          matches any path component, and a trailing `/` restricts both to directories.
+    # @param index Rule index of the pattern.
+    # @param normalized Pattern normalized by `_normalize_version_rule_pattern`.
+    # @return `True` when the pattern was indexed; `False` when it needs the regex path.
+    def _index_literal(self, index, normalized):
+        if VERSION_RULE_GLOB_CHARS.intersection(normalized):
+            return False
+        directory_only = normalized.endswith("/")
+        body = normalized.strip("/")
+        segments = body.split("/")
+        if not body or any(segment in ("", ".", "..") for segment in segments):
+            return False
+        if normalized.startswith("/"):
+            self._anchored.setdefault(body, []).append((index, directory_only))
+        else:
+            self._names.setdefault(body, []).append((index, directory_only))
+        return True
+
+    ## @brief Return the rule indices matching one normalized relative path.
+    # @details Paths sharing no component with a literal name, no indexed ancestor prefix,
+    #          and failing the combined wildcard regex return without per-rule work.
+    # @param relative POSIX repository-relative path without leading `/` or `./`.
+    # @return Sorted list of distinct matching rule indices.
+    def classify(self, relative):
+        matched = []
+        parts = relative.split("/")
+        depth = len(parts)
+        if self._names and not self._name_keys.isdisjoint(parts):
+            for position, part in enumerate(parts, 1):
+                for index, directory_only in self._names.get(part, ()):
+                    if position < depth or not directory_only:
+                        matched.append(index)
+        for prefix_depth in self._anchored_depths:
+            if prefix_depth > depth:
+                break
+            entries = self._anchored.get("/".join(parts[:prefix_depth]))
+            if entries:
+                for index, directory_only in entries:
+                    if prefix_depth < depth or not directory_only:
+                        matched.append(index)
+        if self._wildcards and (
+            self._any_wildcard is None or self._any_wildcard.match(relative)
+        ):
+            for index, regex in self._wildcards:
+                if regex.match(relative):
+                    matched.append(index)
+        if len(matched) > 1:
+            return sorted(set(matched))
+        return matched
+
+    ## @brief Distribute inventory entries into per-rule candidate lists in one pass.
+    # @param inventory `VersionInventoryEntry` records (or `(path, relative)` tuples) in inventory order.
+    # @return List (rule order) of matched inventory entries preserving inventory order.
+    def collect(self, inventory):
+        files: List[list] = [[] for _ in range(self.rule_count)]
+        for entry in inventory:
+            for index in self.classify(entry[1]):
+                files[index].append(entry)
+        return files
 
 
 ## @brief Execute `_collect_version_files` runtime logic for Git-Alias CLI.
@@ -1888,30 +2776,15 @@ def _build_version_file_inventory(root: Path) -> List[Tuple[Path, str]]:
 #          Uses precomputed inventory when provided to avoid repeated repository traversals.
 # @param root Input parameter consumed by `_collect_version_files`.
 # @param pattern Input parameter consumed by `_collect_version_files`.
-# @param inventory Optional precomputed `(path, normalized_relative_path)` list.
+# @param inventory Optional precomputed `VersionInventoryEntry` list.
 # @return Result emitted by `_collect_version_files` according to command contract.
 def _collect_version_files(root, pattern, *, inventory=None):
-    files = []
-    normalized_pattern = _normalize_version_rule_pattern(pattern)
-    if not normalized_pattern:
-        return files
-    # @details Apply pathspec matcher to preserve configured GitIgnore-like semantics.
-    spec = pathspec.PathSpec.from_lines("gitignore", [normalized_pattern])
     candidates = (
         inventory if inventory is not None else _build_version_file_inventory(root)
     )
-    for path, normalized_relative in candidates:
-        matches = spec.match_file(normalized_relative)
-        if (
-            not matches
-            and normalized_pattern.startswith("/")
-            and not normalized_relative.startswith("/")
-        ):
-            matches = spec.match_file(f"/{normalized_relative}")
-        if matches:
-            files.append(path)
-
-    return files
+    return _resolve_version_candidates(
+        root, candidates, VersionRuleMatcher([pattern]).collect(candidates)
+    )[0]
 
 
 ## @brief Execute `_is_version_path_excluded` runtime logic for Git-Alias CLI.
@@ -1939,6 +2812,96 @@ def _iter_versions_in_text(text, compiled_regexes):
                 yield match.group(0)
 
 
+## @brief Yield version strings matched by a bytes regex, decoding only the matched spans.
+# @details Mirrors `_iter_versions_in_text` group selection (first non-empty group, else whole match)
+#          and decodes each selected span as UTF-8 with `errors="ignore"`.
+# @param data Bytes-like buffer (`bytes` or `mmap`) to scan.
+# @param bytes_regex Regex compiled from a bytes pattern.
+# @return Generator of decoded version strings in match order.
+def _iter_versions_in_bytes(data, bytes_regex):
+    for match in bytes_regex.finditer(data):
+        if match.groups():
+            for group in match.groups():
+                if group:
+                    yield group.decode("utf-8", errors="ignore")
+                    break
+        else:
+            yield match.group(0).decode("utf-8", errors="ignore")
+
+
+## @brief Constant `VERSION_BYTES_SCAN_UNSAFE_BYTES` used by CLI runtime paths and policies.
+# @details ASCII bytes on which byte-pattern and text-pattern matching can disagree: `\r` (text
+#          reads translate `\r\n` and `\r` to `\n`) and `\x1c`-`\x1f` (whitespace for text `\s` only).
+VERSION_BYTES_SCAN_UNSAFE_BYTES = (b"\r", b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+## @brief Constant `VERSION_BYTES_SCAN_CHUNK_BYTES` used by CLI runtime paths and policies.
+# @details Slice size used by `_is_bytes_scan_safe` to bound temporary copies of a mapping.
+VERSION_BYTES_SCAN_CHUNK_BYTES = 1 << 20
+## @brief Constant `VERSION_SCAN_MMAP_MIN_BYTES` used by CLI runtime paths and policies.
+# @details File size from which version files are scanned through `mmap` with byte regexes.
+VERSION_SCAN_MMAP_MIN_BYTES = 1 << 20
+
+
+## @brief Check whether byte-pattern matching on a buffer agrees with text-pattern matching.
+# @details A buffer that is pure ASCII and holds none of `VERSION_BYTES_SCAN_UNSAFE_BYTES` decodes to
+#          identical text, and `.`, `\w`, `\d`, `\b`, `\s` and classes behave the same on it for ASCII
+#          patterns. Non-ASCII bytes would change multi-byte character semantics. Checks run per
+#          `VERSION_BYTES_SCAN_CHUNK_BYTES` slice with C-level `isascii` and substring searches.
+# @param view Memory-mapped file content.
+# @return `True` when the byte scan gives the same matches as the decoded-text scan.
+# @satisfies REQ-179
+def _is_bytes_scan_safe(view) -> bool:
+    for offset in range(0, len(view), VERSION_BYTES_SCAN_CHUNK_BYTES):
+        chunk = view[offset : offset + VERSION_BYTES_SCAN_CHUNK_BYTES]
+        if not chunk.isascii() or any(
+            unsafe in chunk for unsafe in VERSION_BYTES_SCAN_UNSAFE_BYTES
+        ):
+            return False
+    return True
+
+
+## @brief Compile the byte-pattern twin of a `ver_rules` regex for memory-mapped scanning.
+# @details Only ASCII patterns are converted; case, multiline, dotall and verbose flags are
+#          preserved. `_scan_version_file` uses the twin only on buffers accepted by
+#          `_is_bytes_scan_safe`, where it matches exactly like the text regex.
+# @param compiled_regex Text regex compiled from the rule.
+# @return Bytes regex, or `None` when the rule must be scanned on decoded text.
+# @satisfies REQ-179
+def _compile_version_bytes_regex(compiled_regex: re.Pattern) -> Optional[re.Pattern]:
+    source = compiled_regex.pattern
+    if not source.isascii():
+        return None
+    flags = compiled_regex.flags & (re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE)
+    try:
+        return re.compile(source.encode("ascii"), flags)
+    except re.error:
+        return None
+
+
+## @brief Decode raw version-file bytes to text.
+# @details Decodes UTF-8, retrying in memory with `errors="ignore"` on decode failures, and applies
+#          universal-newline translation like a text-mode read.
+# @param raw File content bytes.
+# @return Decoded text with `\n` line endings.
+def _decode_version_file_bytes(raw: bytes) -> str:
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.decode("utf-8", errors="ignore")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+## @brief Decode UTF-8 text content of a version-managed file.
+# @details Reads the file once and decodes it with `_decode_version_file_bytes`; I/O failures
+#          propagate to the caller.
+# @param file_path Absolute path of the file to read.
+# @return Decoded file text.
+# @throws OSError when the file cannot be read.
+def _load_version_file_text(file_path: Path) -> str:
+    return _decode_version_file_bytes(file_path.read_bytes())
+
+
 ## @brief Read and cache UTF-8 text content for a version-managed file.
 # @details Loads file content with UTF-8 decoding; falls back to `errors="ignore"` on decode failures.
 #          Emits deterministic stderr diagnostics on I/O failure and returns `None` for caller-managed skip logic.
@@ -1951,9 +2914,7 @@ def _read_version_file_text(
     if text_cache is not None and file_path in text_cache:
         return text_cache[file_path]
     try:
-        text = file_path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        text = file_path.read_text(encoding="utf-8", errors="ignore")
+        text = _load_version_file_text(file_path)
     except OSError as exc:
         print(f"Unable to read {file_path}: {exc}", file=sys.stderr)
         return None
@@ -1962,8 +2923,82 @@ def _read_version_file_text(
     return text
 
 
+## @brief Read one version file and scan it with every rule regex that selected it.
+# @details Thread-pool worker for `_prefetch_version_scans`; never writes to stdout or stderr so
+#          diagnostics stay in the deterministic serial pass. Files of at least
+#          `VERSION_SCAN_MMAP_MIN_BYTES` whose rules all have byte regexes are mapped read-only; when
+#          `_is_bytes_scan_safe` accepts the mapping it is scanned without decoding and
+#          only matched spans are decoded. Other files are read once and decoded with
+#          `_decode_version_file_bytes`, so both paths report the same versions.
+# @param file_path Absolute path of the file to read.
+# @param compiled_regexes Rule text regexes selecting the file, in rule order.
+# @param bytes_regexes Byte twins of `compiled_regexes` (`None` entries when not byte-safe).
+# @return Tuple `(text, versions_per_regex)`; `text` is `None` for memory-mapped scans and
+#         `(None, None)` is returned when the file cannot be read.
+# @satisfies REQ-179
+def _scan_version_file(file_path: Path, compiled_regexes, bytes_regexes=()):
+    try:
+        with file_path.open("rb") as handle:
+            if (
+                bytes_regexes
+                and None not in bytes_regexes
+                and os.fstat(handle.fileno()).st_size >= VERSION_SCAN_MMAP_MIN_BYTES
+            ):
+                import mmap
+
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                    if _is_bytes_scan_safe(view):
+                        return None, [
+                            list(_iter_versions_in_bytes(view, regex))
+                            for regex in bytes_regexes
+                        ]
+            raw = handle.read()
+    except (OSError, ValueError):
+        return None, None
+    text = _decode_version_file_bytes(raw)
+    return text, [
+        list(_iter_versions_in_text(text, [regex])) for regex in compiled_regexes
+    ]
+
+
+## @brief Read and scan all files matched by version rules concurrently.
+# @details Each distinct matched file is read once through `_map_version_io` and scanned with the
+#          regex of every rule that selected it. Only successful reads are recorded, so unreadable files are
+#          reported by the serial pass in rule order. Decoded texts are cached; memory-mapped scans
+#          leave the cache untouched.
+# @param contexts Ordered `VersionRuleContext` list.
+# @param text_cache Mutable cache keyed by `Path`; receives the text of every file read.
+# @return Mapping `(rule_index, file_path) -> versions` for every successfully scanned pair.
+# @satisfies REQ-178
+def _prefetch_version_scans(
+    contexts: List[VersionRuleContext], text_cache: Dict[Path, str]
+) -> Dict[Tuple[int, Path], List[str]]:
+    selections: Dict[Path, List[Tuple[int, VersionRuleContext]]] = {}
+    for index, context in enumerate(contexts):
+        for file_path in context.files:
+            if file_path not in text_cache:
+                selections.setdefault(file_path, []).append((index, context))
+    scans: Dict[Tuple[int, Path], List[str]] = {}
+    file_paths = list(selections)
+    results = _map_version_io(
+        _scan_version_file,
+        file_paths,
+        [[ctx.compiled_regex for _, ctx in selections[path]] for path in file_paths],
+        [[ctx.bytes_regex for _, ctx in selections[path]] for path in file_paths],
+    )
+    for file_path, (text, versions_per_regex) in zip(file_paths, results):
+        if versions_per_regex is None:
+            continue
+        if text is not None:
+            text_cache[file_path] = text
+        for (index, _), versions in zip(selections[file_path], versions_per_regex):
+            scans[(index, file_path)] = versions
+    return scans
+
+
 ## @brief Build reusable per-rule contexts for canonical version evaluation workflows.
-# @details Resolves matched files and compiled regex for each `(pattern, regex)` rule exactly once.
+# @details Resolves matched files for all rules in one `VersionRuleMatcher` pass over the inventory,
+#          stats only the matched candidates, and compiles each rule regex exactly once.
 #          Preserves error contracts for unmatched patterns and invalid regex declarations.
 # @param root Repository root path used for relative-path rendering.
 # @param rules Sequence of `(pattern, regex)` tuples.
@@ -1971,11 +3006,19 @@ def _read_version_file_text(
 # @return Ordered list of `VersionRuleContext` objects aligned to input rule order.
 # @throws VersionDetectionError when a rule matches no files or contains an invalid regex.
 def _prepare_version_rule_contexts(
-    root: Path, rules, *, inventory: Optional[List[Tuple[Path, str]]] = None
+    root: Path, rules, *, inventory: Optional[List[VersionInventoryEntry]] = None
 ) -> List[VersionRuleContext]:
     contexts: List[VersionRuleContext] = []
-    for pattern, expression in rules:
-        files = _collect_version_files(root, pattern, inventory=inventory)
+    rules = list(rules)
+    candidates = (
+        inventory if inventory is not None else _build_version_file_inventory(root)
+    )
+    matched_files = _resolve_version_candidates(
+        root,
+        candidates,
+        VersionRuleMatcher([pattern for pattern, _ in rules]).collect(candidates),
+    )
+    for (pattern, expression), files in zip(rules, matched_files):
         relative_map: Dict[Path, str] = {}
         for file_path in files:
             try:
@@ -2000,6 +3043,7 @@ def _prepare_version_rule_contexts(
                 compiled_regex=compiled,
                 files=files,
                 relative_map=relative_map,
+                bytes_regex=_compile_version_bytes_regex(compiled),
             )
         )
     return contexts
@@ -2007,6 +3051,8 @@ def _prepare_version_rule_contexts(
 
 ## @brief Execute `_determine_canonical_version` runtime logic for Git-Alias CLI.
 # @details Executes `_determine_canonical_version` using deterministic CLI control-flow and explicit error propagation.
+#          Matched files are read and scanned concurrently by `_prefetch_version_scans`; results are consumed
+#          in rule order so mismatch and missing-match errors stay deterministic.
 # @param root Input parameter consumed by `_determine_canonical_version`.
 # @param rules Input parameter consumed by `_determine_canonical_version`.
 # @param verbose Input parameter consumed by `_determine_canonical_version`.
@@ -2028,9 +3074,12 @@ def _determine_canonical_version(
         if contexts is not None
         else _prepare_version_rule_contexts(root, rules)
     )
+    if text_cache is None:
+        text_cache = {}
+    scans = _prefetch_version_scans(active_contexts, text_cache)
     canonical = None
     canonical_file = None
-    for context in active_contexts:
+    for index, context in enumerate(active_contexts):
         if debug:
             print(f"Pattern '{context.pattern}' matched files:")
             if context.files:
@@ -2040,10 +3089,14 @@ def _determine_canonical_version(
                 print("  (none)")
         matched_in_rule = False
         for file_path in context.files:
-            text = _read_version_file_text(file_path, text_cache=text_cache)
-            if text is None:
-                continue
-            versions = list(_iter_versions_in_text(text, [context.compiled_regex]))
+            versions = scans.get((index, file_path))
+            if versions is None:
+                text = _read_version_file_text(file_path, text_cache=text_cache)
+                if text is None:
+                    continue
+                versions = list(
+                    _iter_versions_in_text(text, [context.compiled_regex])
+                )
             if verbose:
                 match_state = "yes" if versions else "no"
                 print(
@@ -2103,6 +3156,135 @@ def _replace_versions_in_text(text, compiled_regex, replacement):
     return "".join(pieces), count
 
 
+## @brief Resolve the real file a version-file path writes to.
+# @details Symlinks are followed so the link itself survives `os.replace`; regular paths are
+#          returned unchanged without touching the filesystem beyond one `lstat`.
+# @param file_path Version file path as listed by the rule context.
+# @return Path of the file whose content is replaced.
+def _version_write_target(file_path: Path) -> Path:
+    return file_path.resolve() if file_path.is_symlink() else file_path
+
+
+## @brief Stage one version-file rewrite as a synced temporary sibling file.
+# @details Creates `<target>.<pid>.<slot>.tmp` next to `target` with permission bits `mode`,
+#          writes the UTF-8 payload through unbuffered `os.write` calls, and fsyncs it. Never writes
+#          to stdout or stderr so it can run in `_map_version_io` workers.
+# @param target Resolved real file path (see `_version_write_target`).
+# @param text New file content.
+# @param slot Transaction-unique integer keeping temporary names distinct.
+# @param mode Permission bits of the current file.
+# @return Tuple `(temp_path, error)`; `error` is the `OSError` raised while staging or `None`.
+def _stage_version_file(target: Path, text: str, slot: int, mode: int):
+    temp_path = None
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    payload = memoryview(text.encode("utf-8"))
+    try:
+        path = target.with_name(f"{target.name}.{os.getpid()}.{slot}.tmp")
+        descriptor = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        temp_path = path
+        try:
+            if os.stat(descriptor).st_mode & 0o7777 != mode:
+                os.chmod(temp_path, mode)
+            while payload:
+                payload = payload[os.write(descriptor, payload) :]
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+    except OSError as exc:
+        return temp_path, exc
+    return temp_path, None
+
+
+## @brief Flush one directory entry table after version files were renamed into it.
+# @details Best-effort: directories that cannot be opened or fsynced (for example on platforms
+#          without directory descriptors) are skipped silently.
+# @param directory Directory containing replaced version files.
+# @return None.
+def _fsync_version_directory(directory: Path) -> None:
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+## @brief Write a batch of version-file contents as one staged transaction.
+# @details Resolves every path with `_version_write_target`, stats it once, and rejects the batch
+#          before staging when two entries share a device/inode pair, because the later rename
+#          would silently discard the earlier content. Stages every file with `_stage_version_file`
+#          (concurrently through `_map_version_io`); when any staging step fails all temporary
+#          files are removed and no version file is modified. Otherwise each temporary file is
+#          moved over its target with `os.replace` in input order and the touched directories
+#          are fsynced concurrently with `_fsync_version_directory`. Each file is replaced
+#          atomically; a failure during the replace phase removes the remaining temporary files
+#          and is reported like a staging failure.
+# @param contents Ordered mapping `{file_path: new_text}`.
+# @return `None` on success, otherwise `(file_path, error)` for the first failing file in input order.
+# @satisfies REQ-180
+def _write_version_files_atomically(
+    contents: Dict[Path, str]
+) -> Optional[Tuple[Path, OSError]]:
+    file_paths = list(contents)
+    targets = []
+    modes = []
+    owners: Dict[Tuple[int, int], Path] = {}
+    for file_path in file_paths:
+        try:
+            target = _version_write_target(file_path)
+            info = os.stat(target)
+        except OSError as exc:
+            return file_path, exc
+        identity = (info.st_dev, info.st_ino)
+        if identity in owners:
+            return file_path, OSError(
+                f"resolves to the same file as {owners[identity]} ({target})"
+            )
+        owners[identity] = file_path
+        targets.append(target)
+        modes.append(info.st_mode & 0o7777)
+    staged = _map_version_io(
+        _stage_version_file,
+        targets,
+        [contents[path] for path in file_paths],
+        range(len(file_paths)),
+        modes,
+    )
+    failure = next(
+        (
+            (file_path, error)
+            for file_path, (_, error) in zip(file_paths, staged)
+            if error is not None
+        ),
+        None,
+    )
+    replaced = 0
+    if failure is None:
+        for file_path, target, (temp_path, _) in zip(file_paths, targets, staged):
+            try:
+                os.replace(temp_path, target)
+            except OSError as exc:
+                failure = (file_path, exc)
+                break
+            replaced += 1
+    for temp_path, _ in staged[replaced:]:
+        if temp_path is None:
+            continue
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+    if failure is not None:
+        return failure
+    _map_version_io(_fsync_version_directory, sorted({target.parent for target in targets}))
+    return None
+
+
 ## @brief Execute `_current_branch_name` runtime logic for Git-Alias CLI.
 # @details Executes `_current_branch_name` using deterministic CLI control-flow and explicit error propagation.
 # @return Result emitted by `_current_branch_name` according to command contract.
@@ -2124,7 +3306,11 @@ def _current_branch_name():
 # @param ref_name Input parameter consumed by `_ref_exists`.
 # @return Result emitted by `_ref_exists` according to command contract.
 def _ref_exists(ref_name):
-    proc = subprocess.run(
+    if _GIT_SESSION is not None:
+        exists = _GIT_SESSION.ref_exists(ref_name)
+        if exists is not None:
+            return exists
+    proc = _run_checked(
         ["git", "show-ref", "--verify", "--quiet", ref_name],
         check=False,
         stdout=subprocess.DEVNULL,
@@ -2905,7 +4091,7 @@ def _resolve_rollback_target_commit(target: str) -> str:
 # @param descendant_ref `str` — descendant git reference.
 # @return `True` when `ancestor_commit` is reachable from `descendant_ref`.
 def _is_commit_ancestor(ancestor_commit: str, descendant_ref: str) -> bool:
-    proc = subprocess.run(
+    proc = _run_checked(
         ["git", "merge-base", "--is-ancestor", ancestor_commit, descendant_ref],
         check=False,
         stdout=subprocess.DEVNULL,
@@ -3787,32 +4973,59 @@ def _overview_ref_latest_subject(ref_name: str) -> str:
     return subject if subject else "n/a"
 
 
-## @brief Collect normalized branch refs from `git branch -a` for overview rendering.
-# @details Returns ordered unique branch refs, stripping current-branch marker and
-# `remotes/` prefix and excluding symbolic-ref redirect rows.
-# @return Result emitted by `_overview_discovered_branch_refs` according to command contract.
-def _overview_discovered_branch_refs() -> List[str]:
+## @brief Build one-pass branch-to-subject index for overview section 5.
+# @details Runs a single `git for-each-ref` over `refs/heads` and
+# `refs/remotes`, maps each ref to its short branch name (`refs/heads/` and
+# `refs/remotes/` prefixes removed), skips symbolic refs such as
+# `origin/HEAD`, strips ANSI escapes from subjects, and maps empty subjects to
+# `n/a`. Returns an empty index when the lookup fails.
+# @return Insertion-ordered mapping `{branch_ref: latest_commit_subject}`.
+# @satisfies REQ-159
+def _overview_branch_index() -> Dict[str, str]:
     try:
-        branches_text = run_git_text(["branch", "-a"])
+        refs_text = run_git_text(
+            [
+                "for-each-ref",
+                "--format=%(refname)%00%(symref)%00%(contents:subject)",
+                "refs/heads",
+                "refs/remotes",
+            ]
+        )
     except RuntimeError:
-        return []
-    refs: List[str] = []
-    seen = set()
-    for branch_line in branches_text.splitlines():
-        ref_name = branch_line.strip()
-        if not ref_name:
+        return {}
+    index: Dict[str, str] = {}
+    for record in refs_text.splitlines():
+        fields = record.split("\0", 2)
+        if len(fields) != 3:
+            continue
+        full_ref, symref, subject = fields
+        if symref:
             continue
-        if ref_name.startswith("*"):
-            ref_name = ref_name.lstrip("*").strip()
-        if ref_name.startswith("remotes/"):
-            ref_name = ref_name[len("remotes/") :]
-        if " -> " in ref_name or ref_name.startswith("("):
+        if full_ref.startswith("refs/heads/"):
+            ref_name = full_ref[len("refs/heads/") :]
+        elif full_ref.startswith("refs/remotes/"):
+            ref_name = full_ref[len("refs/remotes/") :]
+        else:
             continue
-        if ref_name in seen:
+        if not ref_name or ref_name in index:
             continue
-        seen.add(ref_name)
-        refs.append(ref_name)
-    return refs
+        subject = ANSI_ESCAPE_RE.sub("", subject).strip()
+        index[ref_name] = subject if subject else "n/a"
+    return index
+
+
+## @brief Collect normalized branch refs for overview rendering.
+# @details Returns ordered unique local and remote branch refs without
+# `refs/heads/` or `refs/remotes/` prefixes, excluding symbolic-ref redirect
+# rows; reuses @p branch_index when provided instead of querying Git again.
+# @param branch_index Optional index produced by `_overview_branch_index`.
+# @return Result emitted by `_overview_discovered_branch_refs` according to command contract.
+def _overview_discovered_branch_refs(
+    branch_index: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    if branch_index is None:
+        branch_index = _overview_branch_index()
+    return list(branch_index)
 
 
 ## @brief Build section-5 aligned branch summary lines for overview output.
@@ -3831,8 +5044,11 @@ def _overview_discovered_branch_refs() -> List[str]:
 # @param remote_develop_display Input parameter consumed by `_overview_branch_summary_lines`.
 # @param remote_master_display Input parameter consumed by `_overview_branch_summary_lines`.
 # @param additional_refs Input parameter consumed by `_overview_branch_summary_lines`.
+# @param branch_subjects Optional `_overview_branch_index` mapping; refs found
+# there reuse the pre-fetched subject, other refs fall back to
+# `_overview_ref_latest_subject`.
 # @return Result emitted by `_overview_branch_summary_lines` according to command contract.
-# @satisfies REQ-094, REQ-096, REQ-115
+# @satisfies REQ-094, REQ-096, REQ-115, REQ-159
 ## @brief Execute `_overview_branch_summary_lines` runtime logic for Git-Alias CLI.
 # @details Executes `_overview_branch_summary_lines` using deterministic CLI control-flow and explicit error propagation.
 # @param work_ref Input parameter consumed by `_overview_branch_summary_lines`.
@@ -3859,6 +5075,7 @@ def _overview_branch_summary_lines(
     remote_develop_display: str,
     remote_master_display: str,
     additional_refs: Optional[List[str]] = None,
+    branch_subjects: Optional[Dict[str, str]] = None,
 ) -> List[str]:
     rows = [
         ("Work", work_ref, work_display),
@@ -3887,7 +5104,10 @@ def _overview_branch_summary_lines(
     for logical_name, ref_name, display in rows:
         label_text = f"{logical_name}(⎇ {ref_name})"
         padding = " " * (label_width - len(label_text))
-        subject = _overview_ref_latest_subject(ref_name)
+        if branch_subjects is not None and ref_name in branch_subjects:
+            subject = branch_subjects[ref_name]
+        else:
+            subject = _overview_ref_latest_subject(ref_name)
         lines.append(
             f"{display}"
             f"{OVERVIEW_COLOR_WHITE}{padding} | {OVERVIEW_COLOR_RESET}"
@@ -3942,31 +5162,140 @@ def _overview_distance_text(is_ahead: bool, count: int) -> str:
     return f"{color}{arrow} {label} {count}{OVERVIEW_COLOR_RESET}"
 
 
+## @brief Resolve overview refs to commit hashes with one Git process.
+# @details Streams `<ref>^{commit}` lines into `git cat-file --batch-check`;
+# refs reported as missing or ambiguous are omitted from the result.
+# @param refs {Sequence[str]} Ref names to resolve.
+# @return {Dict[str, str]} Mapping of available refs to commit hashes.
+def _overview_resolve_ref_hashes(refs: Sequence[str]) -> Dict[str, str]:
+    unique_refs = list(dict.fromkeys(ref for ref in refs if ref))
+    if not unique_refs:
+        return {}
+    try:
+        proc = _run_checked(
+            ["git", "cat-file", "--batch-check=%(objectname)"],
+            input="".join(f"{ref}^{{commit}}\n" for ref in unique_refs),
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+    except OSError:
+        return {}
+    if proc.returncode != 0:
+        return {}
+    hashes: Dict[str, str] = {}
+    for ref, line in zip(unique_refs, proc.stdout.splitlines()):
+        object_name = line.strip()
+        if " " in object_name or not object_name:
+            continue
+        hashes[ref] = object_name
+    return hashes
+
+
+## @brief Build shared ahead/behind and topology data for overview sections 2 and 4.
+# @details Resolves all refs once, computes their octopus merge-base, and walks
+# the commits above that base with a single `git rev-list --parents` call;
+# per-ref reachable sets inside the walk yield every topology position and
+# every requested `(base, target)` ahead/behind pair. Commits below the
+# merge-base are reachable from all refs, so excluding them leaves the set
+# differences unchanged. Without a merge-base (unrelated histories or fewer
+# than two available refs) positions fall back to `0` and each requested pair
+# uses one `git rev-list --left-right --count` call.
+# @param refs {Sequence[str]} Ref names rendered by the overview.
+# @param pairs {Sequence[Tuple[str, str]]} `(base_ref, target_ref)` pairs to measure; both refs must belong to @p refs.
+# @return {OverviewRefGraph} Shared distance data; unavailable refs are absent.
+# @satisfies REQ-160
+def _overview_ref_graph(
+    refs: Sequence[str], pairs: Sequence[Tuple[str, str]] = ()
+) -> OverviewRefGraph:
+    hashes = _overview_resolve_ref_hashes(refs)
+    commit_hashes = list(dict.fromkeys(hashes[ref] for ref in refs if ref in hashes))
+    merge_base: Optional[str] = None
+    if len(commit_hashes) >= 2:
+        try:
+            merge_base = run_git_text(["merge-base", "--octopus", *commit_hashes]).strip()
+        except RuntimeError:
+            merge_base = None
+    elif len(commit_hashes) == 1:
+        merge_base = commit_hashes[0]
+    positions: Dict[str, int] = {ref: 0 for ref in refs if ref in hashes}
+    distances: Dict[Tuple[str, str], Tuple[int, int]] = {}
+    measured_pairs = [
+        (base, target) for base, target in pairs if base in hashes and target in hashes
+    ]
+    reachable: Optional[Dict[str, Set[str]]] = None
+    if merge_base:
+        try:
+            walk_text = run_git_text(
+                ["rev-list", "--parents", *commit_hashes, "--not", merge_base]
+            )
+        except RuntimeError:
+            walk_text = None
+        if walk_text is not None:
+            parents: Dict[str, List[str]] = {}
+            for line in walk_text.splitlines():
+                commit, *commit_parents = line.split()
+                parents[commit] = commit_parents
+            reachable = {}
+            for start in commit_hashes:
+                seen: Set[str] = set()
+                stack = [start] if start in parents else []
+                while stack:
+                    commit = stack.pop()
+                    if commit in seen:
+                        continue
+                    seen.add(commit)
+                    stack.extend(p for p in parents[commit] if p in parents)
+                reachable[start] = seen
+    if reachable is not None:
+        for ref in positions:
+            positions[ref] = len(reachable[hashes[ref]])
+        for base, target in measured_pairs:
+            base_set = reachable[hashes[base]]
+            target_set = reachable[hashes[target]]
+            distances[(base, target)] = (
+                len(base_set - target_set),
+                len(target_set - base_set),
+            )
+        return OverviewRefGraph(hashes=hashes, positions=positions, distances=distances)
+    for base, target in measured_pairs:
+        try:
+            ahead_text, behind_text = run_git_text(
+                [
+                    "rev-list",
+                    "--left-right",
+                    "--count",
+                    f"{hashes[base]}...{hashes[target]}",
+                ]
+            ).split()
+            distances[(base, target)] = (int(ahead_text), int(behind_text))
+        except (RuntimeError, ValueError):
+            continue
+    return OverviewRefGraph(hashes=hashes, positions=positions, distances=distances)
+
+
 ## @brief Execute `_overview_compare_refs` runtime logic for Git-Alias CLI.
-# @details Executes `_overview_compare_refs` using deterministic CLI control-flow and explicit error propagation.
+# @details Prints one section-2 distance row using ahead/behind counts from
+# @p ref_graph; builds a two-ref graph when no shared graph is provided.
 # @param base_ref Input parameter consumed by `_overview_compare_refs`.
 # @param target_ref Input parameter consumed by `_overview_compare_refs`.
 # @param label Input parameter consumed by `_overview_compare_refs`.
+# @param ref_graph {Optional[OverviewRefGraph]} Shared distance data produced by `_overview_ref_graph`.
 # @return Result emitted by `_overview_compare_refs` according to command contract.
-def _overview_compare_refs(base_ref: str, target_ref: str, label: str) -> str:
-    if not _overview_ref_is_available(base_ref) or not _overview_ref_is_available(
-        target_ref
-    ):
-        unavailable = f"{OVERVIEW_COLOR_WHITE}n/a{OVERVIEW_COLOR_RESET}"
-        print(
-            OVERVIEW_DISTANCE_TEMPLATE.format(
-                text_color=OVERVIEW_COLOR_WHITE,
-                label=label,
-                reset=OVERVIEW_COLOR_RESET,
-                ahead=f"{OVERVIEW_COLOR_WHITE}ahead {unavailable}{OVERVIEW_COLOR_RESET}",
-                behind=f"{OVERVIEW_COLOR_WHITE}behind {unavailable}{OVERVIEW_COLOR_RESET}",
-            )
+# @satisfies REQ-160
+def _overview_compare_refs(
+    base_ref: str,
+    target_ref: str,
+    label: str,
+    ref_graph: Optional[OverviewRefGraph] = None,
+) -> str:
+    if ref_graph is None:
+        ref_graph = _overview_ref_graph(
+            [base_ref, target_ref], [(base_ref, target_ref)]
         )
-        return "unknown"
-    try:
-        ahead = int(run_git_text(["rev-list", "--count", f"{target_ref}..{base_ref}"]))
-        behind = int(run_git_text(["rev-list", "--count", f"{base_ref}..{target_ref}"]))
-    except (RuntimeError, ValueError):
+    distance = ref_graph.distances.get((base_ref, target_ref))
+    if distance is None:
         unavailable = f"{OVERVIEW_COLOR_WHITE}n/a{OVERVIEW_COLOR_RESET}"
         print(
             OVERVIEW_DISTANCE_TEMPLATE.format(
@@ -3978,6 +5307,7 @@ def _overview_compare_refs(base_ref: str, target_ref: str, label: str) -> str:
             )
         )
         return "unknown"
+    ahead, behind = distance
     state = _overview_relation_state(ahead, behind)
     print(
         OVERVIEW_DISTANCE_TEMPLATE.format(
@@ -3996,8 +5326,8 @@ def _overview_compare_refs(base_ref: str, target_ref: str, label: str) -> str:
 # octopus merge-base, groups refs sharing the same hash on one output line,
 # and orders nodes from most-ahead (root) to most-behind (deepest child).
 # WorkingTree always occupies a dedicated line above the line that contains
-# Work when tied or dirty. Complexity O(R) git
-# subprocess calls where R is the number of available refs.
+# Work when tied or dirty. Hashes and positions come from @p ref_graph, which
+# is built with `_overview_ref_graph` when not provided.
 # @param work_ref {str} Git ref name for work branch.
 # @param develop_ref {str} Git ref name for develop branch.
 # @param master_ref {str} Git ref name for master branch.
@@ -4009,8 +5339,9 @@ def _overview_compare_refs(base_ref: str, target_ref: str, label: str) -> str:
 # @param remote_develop_display {str} Rendered display string for RemoteDevelop identifier.
 # @param remote_master_display {str} Rendered display string for RemoteMaster identifier.
 # @param worktree_state {str} Working tree state (clean/unstaged/staged/mixed).
+# @param ref_graph {Optional[OverviewRefGraph]} Shared distance data produced by `_overview_ref_graph`.
 # @return {List[str]} Rendered topology lines with ANSI color codes.
-# @satisfies REQ-089, REQ-090, REQ-091, REQ-092, REQ-093, REQ-095
+# @satisfies REQ-089, REQ-090, REQ-091, REQ-092, REQ-093, REQ-095, REQ-160
 ## @brief Execute `_overview_ascii_topology_lines` runtime logic for Git-Alias CLI.
 # @details Executes `_overview_ascii_topology_lines` using deterministic CLI control-flow and explicit error propagation.
 # @param work_ref Input parameter consumed by `_overview_ascii_topology_lines`.
@@ -4037,6 +5368,7 @@ def _overview_ascii_topology_lines(
     remote_develop_display: str,
     remote_master_display: str,
     worktree_state: str,
+    ref_graph: Optional[OverviewRefGraph] = None,
 ) -> List[str]:
     branch_nodes = [
         ("Work", work_ref, work_display),
@@ -4045,41 +5377,13 @@ def _overview_ascii_topology_lines(
         ("RemoteDevelop", remote_develop_ref, remote_develop_display),
         ("RemoteMaster", remote_master_ref, remote_master_display),
     ]
+    if ref_graph is None:
+        ref_graph = _overview_ref_graph([ref for _, ref, _ in branch_nodes])
     ref_hashes: Dict[str, Optional[str]] = {}
-    available_refs: List[str] = []
-    for name, ref, _ in branch_nodes:
-        if _overview_ref_is_available(ref):
-            try:
-                h = run_git_text(["rev-parse", ref]).strip()
-                ref_hashes[name] = h
-                available_refs.append(ref)
-            except RuntimeError:
-                ref_hashes[name] = None
-        else:
-            ref_hashes[name] = None
-    merge_base: Optional[str] = None
-    if len(available_refs) >= 2:
-        try:
-            merge_base = run_git_text(
-                ["merge-base", "--octopus"] + available_refs,
-            ).strip()
-        except RuntimeError:
-            merge_base = None
     positions: Dict[str, int] = {}
     for name, ref, _ in branch_nodes:
-        if ref_hashes.get(name) is None:
-            positions[name] = 0
-            continue
-        if merge_base:
-            try:
-                count = int(
-                    run_git_text(["rev-list", "--count", f"{merge_base}..{ref}"]),
-                )
-                positions[name] = count
-            except (RuntimeError, ValueError):
-                positions[name] = 0
-        else:
-            positions[name] = 0
+        ref_hashes[name] = ref_graph.hashes.get(ref)
+        positions[name] = ref_graph.positions.get(ref, 0)
     work_pos = positions.get("Work", 0)
     wt_sort_key = (
         float(work_pos) + 0.5 if worktree_state != "clean" else float(work_pos)
@@ -4152,7 +5456,7 @@ def _overview_current_branch_state_lines(current_branch_display: str) -> List[st
 # @details Executes `cmd_o` using deterministic CLI control-flow and explicit error propagation.
 # @param extra Input parameter consumed by `cmd_o`.
 # @return Result emitted by `cmd_o` according to command contract.
-# @satisfies REQ-082, REQ-083, REQ-084, REQ-085, REQ-086, REQ-087, REQ-088, REQ-089, REQ-090, REQ-091, REQ-092, REQ-093, REQ-094, REQ-095, REQ-096, REQ-115
+# @satisfies REQ-082, REQ-083, REQ-084, REQ-085, REQ-086, REQ-087, REQ-088, REQ-089, REQ-090, REQ-091, REQ-092, REQ-093, REQ-094, REQ-095, REQ-096, REQ-115, REQ-159, REQ-160
 def cmd_o(extra):
     del extra
     if not is_inside_git_repo():
@@ -4211,15 +5515,26 @@ def cmd_o(extra):
             reset=OVERVIEW_COLOR_RESET,
         )
     )
+    ref_graph = _overview_ref_graph(
+        [work_branch, develop_branch, master_branch, remote_develop, remote_master],
+        [
+            (work_branch, develop_branch),
+            (work_branch, master_branch),
+            (develop_branch, remote_develop),
+            (master_branch, remote_master),
+        ],
+    )
     _overview_compare_refs(
         work_branch,
         develop_branch,
         f"{work_display} vs {develop_display}",
+        ref_graph,
     )
     _overview_compare_refs(
         work_branch,
         master_branch,
         f"{work_display} vs {master_display}",
+        ref_graph,
     )
     print(
         OVERVIEW_SUBSECTION_TEMPLATE.format(
@@ -4232,11 +5547,13 @@ def cmd_o(extra):
         develop_branch,
         remote_develop,
         f"{develop_display} vs {remote_develop_display}",
+        ref_graph,
     )
     _overview_compare_refs(
         master_branch,
         remote_master,
         f"{master_display} vs {remote_master_display}",
+        ref_graph,
     )
     print()
     print(
@@ -4267,6 +5584,7 @@ def cmd_o(extra):
         remote_develop_display=remote_develop_display,
         remote_master_display=remote_master_display,
         worktree_state=worktree_state,
+        ref_graph=ref_graph,
     )
     for line in topology_lines:
         print(line)
@@ -4278,7 +5596,8 @@ def cmd_o(extra):
             reset=OVERVIEW_COLOR_RESET,
         )
     )
-    additional_branch_refs = _overview_discovered_branch_refs()
+    branch_index = _overview_branch_index()
+    additional_branch_refs = _overview_discovered_branch_refs(branch_index)
     branch_rows = _overview_branch_summary_lines(
         work_ref=work_branch,
         develop_ref=develop_branch,
@@ -4291,6 +5610,7 @@ def cmd_o(extra):
         remote_develop_display=remote_develop_display,
         remote_master_display=remote_master_display,
         additional_refs=additional_branch_refs,
+        branch_subjects=branch_index,
     )
     for row in branch_rows:
         print(f"{OVERVIEW_COLOR_WHITE}{row}{OVERVIEW_COLOR_RESET}")
@@ -4472,28 +5792,99 @@ def cmd_lsa(extra):
     return run_git_cmd(["ls-files", "--others", "--exclude-standard"], extra)
 
 
+## @brief Build a tag-to-branch containment index with one history walk.
+# @details Lists branch rows with `git branch -a --format` (same rows and order
+#          as `git branch -a`, symbolic-ref redirects skipped, `refs/heads/` and
+#          `refs/remotes/` prefixes trimmed), peels tags through one
+#          `git for-each-ref refs/tags`, then walks `git rev-list --topo-order
+#          --parents` from all branch tips once. Each branch owns one bit; masks
+#          flow from children to parents in topological order, so the mask found
+#          on a tag commit names every branch that contains the tag.
+#          Complexity O(C + T) for C walked commits and T tags, instead of one
+#          full walk per tag.
+# @param tags {List[str]} Tag names to resolve.
+# @return {Dict[str, List[str]]} Containing branch names per tag, in `git branch -a` order.
+# @satisfies REQ-161
+def _tag_branch_containment_index(tags):
+    branch_rows = []
+    for row in capture_git_output(
+        ["branch", "-a", "--format=%(refname)%00%(objectname)%00%(symref)"]
+    ).splitlines():
+        fields = row.split("\0")
+        if len(fields) != 3 or fields[2] or not fields[1]:
+            continue
+        name = fields[0]
+        for prefix in ("refs/heads/", "refs/remotes/"):
+            if name.startswith(prefix):
+                name = name[len(prefix) :]
+                break
+        branch_rows.append((name, fields[1]))
+    index = {tag: [] for tag in tags}
+    if not branch_rows or not tags:
+        return index
+    tag_commits = {}
+    for row in capture_git_output(
+        [
+            "for-each-ref",
+            "--format=%(refname:strip=2)%00%(objectname)%00%(*objectname)%00%(*objecttype)",
+            "refs/tags",
+        ]
+    ).splitlines():
+        fields = row.split("\0")
+        if len(fields) != 4 or fields[0] not in index:
+            continue
+        if fields[3] == "tag":
+            # Nested annotated tag: peel the remaining levels explicitly.
+            try:
+                tag_commits[fields[0]] = capture_git_output(
+                    ["rev-parse", f"refs/tags/{fields[0]}^{{commit}}"]
+                )
+            except CommandExecutionError:
+                pass
+            continue
+        tag_commits[fields[0]] = fields[2] or fields[1]
+    tip_bits = defaultdict(int)
+    for bit, (_, tip) in enumerate(branch_rows):
+        tip_bits[tip] |= 1 << bit
+    pending = set(tag_commits.values())
+    found = {}
+    masks = {}
+    walk_text = capture_git_output(
+        ["rev-list", "--topo-order", "--parents", *tip_bits]
+    )
+    for line in walk_text.splitlines():
+        if not pending:
+            break
+        commit, *parents = line.split()
+        mask = masks.pop(commit, 0) | tip_bits.get(commit, 0)
+        if commit in pending:
+            pending.discard(commit)
+            found[commit] = mask
+        for parent in parents:
+            masks[parent] = masks.get(parent, 0) | mask
+    for tag, commit in tag_commits.items():
+        mask = found.get(commit, 0)
+        index[tag] = [
+            name for bit, (name, _) in enumerate(branch_rows) if mask >> bit & 1
+        ]
+    return index
+
+
 ## @brief Execute `cmd_lt` runtime logic for Git-Alias CLI.
-# @details Enumerates tags via `git tag -l`, resolves containing refs via `git branch -a --contains <tag>`,
-#          trims branch markers/prefixes from git output, and prints deterministic `<tag>: <branch_1>, <branch_2>, ...` lines.
+# @details Enumerates tags via `git tag -l`, resolves containing refs through
+#          `_tag_branch_containment_index`, and prints deterministic
+#          `<tag>: <branch_1>, <branch_2>, ...` lines.
 # @param extra Input parameter consumed by `cmd_lt`.
 # @return Result emitted by `cmd_lt` according to command contract.
+# @satisfies REQ-161
 def cmd_lt(extra):
     tags_text = capture_git_output(["tag", "-l", *_to_args(extra)])
     tags = [tag.strip() for tag in tags_text.splitlines() if tag.strip()]
+    if not tags:
+        return
+    index = _tag_branch_containment_index(tags)
     for tag in tags:
-        branches_text = capture_git_output(["branch", "-a", "--contains", tag])
-        branches = []
-        for branch_line in branches_text.splitlines():
-            branch = branch_line.strip()
-            if not branch:
-                continue
-            if branch.startswith("*"):
-                branch = branch.lstrip("*").strip()
-            if branch.startswith("remotes/"):
-                branch = branch[len("remotes/") :]
-            if " -> " in branch:
-                continue
-            branches.append(branch)
+        branches = index.get(tag, [])
         print(f"{tag}: {', '.join(branches)}" if branches else f"{tag}:")
 
 
@@ -4750,6 +6141,11 @@ def cmd_ver(extra):
 
 ## @brief Execute `cmd_chver` runtime logic for Git-Alias CLI.
 # @details Executes `cmd_chver` using deterministic CLI control-flow and explicit error propagation.
+#          Computes every replacement in memory on one buffer per resolved target file (symlinks are
+#          followed, so rules reaching the same file through different paths edit the same text),
+#          re-scans every selected file with its rule regex to confirm each rule found at least one
+#          version entry and that all of them now equal the requested version, then writes all changed
+#          files through `_write_version_files_atomically`.
 # @param extra Input parameter consumed by `cmd_chver`.
 # @return Result emitted by `cmd_chver` according to command contract.
 def cmd_chver(extra):
@@ -4794,46 +6190,62 @@ def cmd_chver(extra):
         print(f"The project version is already {current}.")
         return
     action = "Upgrade" if target_tuple > current_tuple else "Downgrade"
-    replacements = 0
+    updated: Dict[Path, str] = {}
+    rule_files = []
     for context in contexts:
+        selected = []
         for file_path in context.files:
-            text = _read_version_file_text(file_path, text_cache=text_cache)
-            if text is None:
+            try:
+                target = _version_write_target(file_path)
+            except OSError as exc:
+                print(f"Unable to read {file_path}: {exc}", file=sys.stderr)
                 continue
+            text = updated.get(target)
+            if text is None:
+                text = _read_version_file_text(file_path, text_cache=text_cache)
+                if text is None:
+                    continue
             new_text, count = _replace_versions_in_text(
                 text, context.compiled_regex, requested
             )
             if count:
-                try:
-                    file_path.write_text(new_text, encoding="utf-8")
-                except OSError as exc:
-                    print(f"Unable to write {file_path}: {exc}", file=sys.stderr)
-                    sys.exit(1)
-                text_cache[file_path] = new_text
-                replacements += count
-    if replacements == 0:
+                updated[target] = new_text
+            selected.append((target, text))
+        rule_files.append(selected)
+    if not updated:
         print(
             "No version entries were updated. Ensure ver_rules match the desired files.",
             file=sys.stderr,
         )
         sys.exit(1)
-    try:
-        confirmed = _determine_canonical_version(
-            root,
-            rules,
-            contexts=contexts,
-            text_cache=text_cache,
-        )
-    except VersionDetectionError as exc:
-        print(f"Fatal error after updating versions: {exc}", file=sys.stderr)
-        sys.exit(1)
-    if confirmed != requested:
-        print(
-            f"Fatal error: the updated files report version {confirmed} instead of {requested}.",
-            file=sys.stderr,
-        )
+    for context, selected in zip(contexts, rule_files):
+        found = [
+            version
+            for target, text in selected
+            for version in _iter_versions_in_text(
+                updated.get(target, text), [context.compiled_regex]
+            )
+        ]
+        if not found:
+            print(
+                f"Fatal error: no version entries matched rule pattern '{context.pattern}' with "
+                f"regex '{context.expression}'; no files were written.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        if any(version != requested for version in found):
+            print(
+                f"Fatal error: rule pattern '{context.pattern}' with regex '{context.expression}' "
+                f"does not resolve to {requested} after the update; no files were written.",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+    failure = _write_version_files_atomically(updated)
+    if failure is not None:
+        file_path, exc = failure
+        print(f"Unable to write {file_path}: {exc}", file=sys.stderr)
         sys.exit(1)
-    print(f"{action} completed: version is now {confirmed}.")
+    print(f"{action} completed: version is now {requested}.")
 
 
 ## @brief CLI entry-point for the `major` release subcommand.
@@ -4903,6 +6315,8 @@ def cmd_backup(extra):
 # @return None; side-effects: writes `CHANGELOG.md` to disk or prints to stdout.
 # @satisfies REQ-018, REQ-040, REQ-041, REQ-043
 def cmd_changelog(extra):
+    import argparse
+
     parser = argparse.ArgumentParser(prog="g changelog", add_help=False)
     parser.add_argument("--force-write", dest="force_write", action="store_true")
     parser.add_argument("--include-patch", dest="include_patch", action="store_true")
@@ -5050,6 +6464,7 @@ def print_all_help():
         print(f"  {flag} - {description}")
     print()
     print("Configuration Parameters:")
+    _ensure_cli_config()
     for key in DEFAULT_CONFIG:
         value = CONFIG.get(key, DEFAULT_CONFIG[key])
         if key == "ver_rules":
@@ -5082,62 +6497,63 @@ def print_all_help():
 # @param argv Input parameter consumed by `main`.
 # @param check_updates Input parameter consumed by `main`.
 # @return Result emitted by `main` according to command contract.
+# @satisfies REQ-030 REQ-033 REQ-156 REQ-174
 def main(argv=None, *, check_updates: bool = True):
-    args = list(argv) if argv is not None else sys.argv[1:]
-    force_online_update_check = bool(args) and args[0] in ("--ver", "--version")
-    git_root = get_git_root()
-    load_cli_config(git_root)
-    if check_updates or force_online_update_check:
-        check_for_newer_version(
-            repo_root=git_root,
-            timeout_seconds=VERSION_CHECK_TIMEOUT_SECONDS,
-            ignore_idle_cache=force_online_update_check,
-        )
-    if not args:
-        print("Please provide a command or --help", file=sys.stderr)
-        print_all_help()
-        sys.exit(1)
-    if args[0] == "--help" and len(args) > 1 and args[1] not in COMMANDS:
-        print(f"Unknown command: {args[1]}", file=sys.stderr)
-        sys.exit(1)
-    if args[0] in ("--ver", "--version"):
-        print(get_cli_version())
-        return
-    if args[0] == "--write-config":
-        write_default_config(git_root)
-        return
-    if args[0] == "--upgrade":
-        upgrade_self(git_root)
-        return
-    if args[0] == "--uninstall":
-        uninstall_self()
-        return
-    if args[0] == "--help":
-        if len(args) == 1:
+    with git_session(), _deferred_cli_config():
+        args = list(argv) if argv is not None else sys.argv[1:]
+        force_online_update_check = bool(args) and args[0] in ("--ver", "--version")
+        if check_updates or force_online_update_check:
+            check_for_newer_version(
+                repo_root=Path.cwd(),
+                timeout_seconds=VERSION_CHECK_TIMEOUT_SECONDS,
+                ignore_idle_cache=force_online_update_check,
+                background_refresh=not force_online_update_check,
+            )
+        if not args:
+            print("Please provide a command or --help", file=sys.stderr)
             print_all_help()
+            sys.exit(1)
+        if args[0] == "--help" and len(args) > 1 and args[1] not in COMMANDS:
+            print(f"Unknown command: {args[1]}", file=sys.stderr)
+            sys.exit(1)
+        if args[0] in ("--ver", "--version"):
+            print(get_cli_version())
             return
-        name = args[1]
-        if name in COMMANDS:
-            print_command_help(name)
-        return
-    name = args[0]
-    extras = args[1:]
-    try:
-        if name not in COMMANDS:
-            run_git_cmd([name], extras)
+        if args[0] == "--write-config":
+            write_default_config(get_git_root())
             return
-        if "--help" in extras:
-            if name in RESET_HELP_COMMANDS:
-                COMMANDS[name](extras)
-            else:
+        if args[0] == "--upgrade":
+            upgrade_self(get_git_root())
+            return
+        if args[0] == "--uninstall":
+            uninstall_self()
+            return
+        if args[0] == "--help":
+            if len(args) == 1:
+                print_all_help()
+                return
+            name = args[1]
+            if name in COMMANDS:
                 print_command_help(name)
             return
-        COMMANDS[name](extras)
-    except CommandExecutionError as exc:
-        err_text = CommandExecutionError._decode_stream(exc.stderr).strip()
-        if err_text:
-            print(err_text, file=sys.stderr)
-        sys.exit(exc.returncode or 1)
-    except RuntimeError as exc:
-        print(str(exc), file=sys.stderr)
-        sys.exit(1)
+        name = args[0]
+        extras = args[1:]
+        try:
+            if name not in COMMANDS:
+                run_git_cmd([name], extras)
+                return
+            if "--help" in extras:
+                if name in RESET_HELP_COMMANDS:
+                    COMMANDS[name](extras)
+                else:
+                    print_command_help(name)
+                return
+            COMMANDS[name](extras)
+        except CommandExecutionError as exc:
+            err_text = CommandExecutionError._decode_stream(exc.stderr).strip()
+            if err_text:
+                print(err_text, file=sys.stderr)
+            sys.exit(exc.returncode or 1)
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
+            sys.exit(1)
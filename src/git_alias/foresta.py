@@ -5,15 +5,25 @@
 # as a Unicode tree with configurable styles, symbols, colors, and margins.
 # Ported from a Perl reference implementation preserving 1:1 algorithmic logic.
 # @satisfies REQ-098, REQ-099, REQ-100, REQ-101, REQ-102, REQ-103, REQ-104,
-# REQ-105, REQ-106, REQ-107, REQ-108, REQ-109, REQ-110, REQ-111
+# REQ-105, REQ-106, REQ-107, REQ-108, REQ-109, REQ-110, REQ-111, REQ-164,
+# REQ-165, REQ-166, REQ-167, REQ-168
 
+import bisect
+import hashlib
+import json
+import mmap
 import os
 import re
 import signal
 import shutil
 import subprocess
 import sys
-from time import localtime, strftime
+import tempfile
+import unicodedata
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from time import gmtime, localtime, strftime, time
 from typing import Dict, List, Optional, Tuple
 
 
@@ -263,12 +273,48 @@ def _git_command_output_pipe(
 # ---------------------------------------------------------------------------
 
 
+def _parse_status_porcelain_v2(output: str) -> Tuple[bool, bool, bool, bool]:
+    """
+    @brief Derive working tree dirty flags from `git status --porcelain=v2` output.
+    @details Reads the index (`X`) and worktree (`Y`) columns of changed (`1`),
+    renamed (`2`) and unmerged (`u`) entries, the `# stash <n>` header, and
+    untracked (`?`) entries in a single pass.
+    @satisfies REQ-106, REQ-158
+    @param output {str} Porcelain v2 status text produced with `--show-stash`.
+    @return {Tuple[bool, bool, bool, bool]} Flags (unstaged, staged, stash, untracked).
+    """
+    has_unstaged = False
+    has_staged = False
+    has_stash = False
+    has_untracked = False
+    for ln in output.splitlines():
+        kind = ln[:2]
+        if kind in ("1 ", "2 "):
+            xy = ln[2:4]
+            if xy[:1] not in ("", "."):
+                has_staged = True
+            if xy[1:2] not in ("", "."):
+                has_unstaged = True
+        elif kind == "u ":
+            has_staged = True
+            has_unstaged = True
+        elif kind == "? ":
+            has_untracked = True
+        elif ln.startswith("# stash "):
+            has_stash = ln[8:].strip() not in ("", "0")
+    return has_unstaged, has_staged, has_stash, has_untracked
+
+
 def _get_status(repo_path: str, git_dir: str) -> str:
     """
     @brief Determine working tree dirty flags and mid-flow state indicators.
-    @details Checks for unstaged, staged, stash, and untracked changes, then
-    probes git internal state files for rebase/merge/cherry-pick/revert/bisect.
-    @satisfies REQ-106, REQ-107
+    @details Derives unstaged, staged, stash, and untracked flags from one
+    `git status --porcelain=v2 --show-stash` tree walk, then probes git internal
+    state files for rebase/merge/cherry-pick/revert/bisect. The walk runs with
+    `--no-optional-locks` so it never takes `index.lock` beside another git
+    command, and with `--untracked-files=normal` so `status.showUntrackedFiles`
+    cannot hide the untracked marker.
+    @satisfies REQ-106, REQ-107, REQ-158
     @param repo_path {str} Path to .git directory (or gitdir for worktrees).
     @param git_dir {str} GIT_DIR value used for git commands.
     @return {str} Status string like " *+$%|REBASE-i" or empty.
@@ -277,27 +323,21 @@ def _get_status(repo_path: str, git_dir: str) -> str:
     mid_flow = ""
 
     try:
-        has_unstaged = bool(
-            _git_command(["diff", "--shortstat"])
-        )
-    except subprocess.CalledProcessError:
-        has_unstaged = False
-    try:
-        has_staged = bool(
-            _git_command(["diff", "--shortstat", "--cached"])
+        status_output = _git_command(
+            [
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--show-stash",
+                "--no-renames",
+                "--untracked-files=normal",
+            ]
         )
     except subprocess.CalledProcessError:
-        has_staged = False
-    try:
-        has_stash = bool(_git_command(["stash", "list"]))
-    except subprocess.CalledProcessError:
-        has_stash = False
-    try:
-        has_untracked = bool(
-            _git_command(["ls-files", "--others", "--exclude-standard"])
-        )
-    except subprocess.CalledProcessError:
-        has_untracked = False
+        status_output = ""
+    has_unstaged, has_staged, has_stash, has_untracked = (
+        _parse_status_porcelain_v2(status_output)
+    )
 
     if has_unstaged:
         dirty += "*"
@@ -360,9 +400,11 @@ def _get_next_pick(lines: List[str], start: int) -> Optional[str]:
 
 
 ## @brief Build a SHA-to-ref mapping from repository references and HEAD state.
-# @details Parses `git show-ref`, resolves annotated tags to target commits, and conditionally
+# @details Parses one `git show-ref --dereference` listing, maps each annotated tag
+#          both to its tag object and to the peeled `^{}` target commit, and conditionally
 #          augments the map with active rebase markers (`rebase/next`, `rebase/onto`, `rebase/new`).
-# @satisfies REQ-108
+#          Ref collection spawns a constant number of git processes regardless of tag count.
+# @satisfies REQ-108, REQ-157
 # @param show_rebase {bool} Enables inclusion of rebase markers when true.
 # @return {Dict[str, List[str]]} Map from full commit SHA to rendered ref labels.
 def _get_refs(
@@ -371,10 +413,11 @@ def _get_refs(
     refs: Dict[str, List[str]] = {}
 
     try:
-        output = _git_command(["show-ref"])
+        output = _git_command(["show-ref", "--dereference"])
     except subprocess.CalledProcessError:
         output = ""
 
+    tag_objects: Dict[str, str] = {}
     for ln in output.splitlines():
         ln = ln.strip()
         if not ln:
@@ -383,22 +426,19 @@ def _get_refs(
         if len(parts) < 2:
             continue
         sha, name = parts
+        if name.endswith("^{}"):
+            # Peeled target of the annotated tag listed on the previous line.
+            name = name[:-3]
+            if tag_objects.get(name, sha) != sha:
+                if sha not in refs:
+                    refs[sha] = []
+                refs[sha].append(name)
+            continue
         if sha not in refs:
             refs[sha] = []
         refs[sha].append(name)
-
         if name.startswith("refs/tags/"):
-            try:
-                sub_sha = _git_command(
-                    ["log", "-1", "--pretty=format:%H", name]
-                )
-                sub_sha = sub_sha.strip()
-                if sha != sub_sha:
-                    if sub_sha not in refs:
-                        refs[sub_sha] = []
-                    refs[sub_sha].append(name)
-            except subprocess.CalledProcessError:
-                pass
+            tag_objects[name] = sha
 
     # Detect active rebase
     try:
@@ -454,156 +494,208 @@ def _get_refs(
 # Vine algorithm: branch, commit, merge
 # ---------------------------------------------------------------------------
 
+## @brief Row-buffer byte for an empty vine column.
+_LANE_EMPTY = 0x20
+
+## @brief Row-buffer byte for an occupied vine column (`I` control code).
+_LANE_BUSY = 0x49
+
+
+class _Vine:
+    """
+    @brief Compact lane state for the vine graph layout.
+    @details Stores the expected parent SHA of every column together with a
+    SHA-to-lanes index and a `bytearray` row buffer holding the `I`/space
+    control code of each column. Rows are rendered by copying the buffer and
+    patching only the lanes touched by the current commit, so per-row Python
+    work is proportional to the touched lanes instead of the vine width.
+    @satisfies REQ-109, REQ-165
+    """
+
+    __slots__ = ("_slots", "_lanes", "row")
+
+    def __init__(self, slots: Optional[List[Optional[str]]] = None):
+        """
+        @brief Initialize lane state.
+        @param slots {Optional[List[Optional[str]]]} Initial column SHAs (None for empty columns).
+        """
+        self._slots: List[Optional[str]] = []
+        self._lanes: Dict[str, List[int]] = {}
+        self.row = bytearray()
+        if slots:
+            self.extend_to(len(slots))
+            for idx, sha in enumerate(slots):
+                self[idx] = sha
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __getitem__(self, idx: int) -> Optional[str]:
+        return self._slots[idx]
+
+    def __setitem__(self, idx: int, sha: Optional[str]) -> None:
+        """
+        @brief Assign one column and keep the lane index and row buffer in sync.
+        @param idx {int} Non-negative column index.
+        @param sha {Optional[str]} Expected parent SHA or None to free the column.
+        """
+        old = self._slots[idx]
+        if old == sha:
+            return
+        if old is not None:
+            lanes = self._lanes[old]
+            lanes.remove(idx)
+            if not lanes:
+                del self._lanes[old]
+        if sha is None:
+            self.row[idx] = _LANE_EMPTY
+        else:
+            bisect.insort(self._lanes.setdefault(sha, []), idx)
+            self.row[idx] = _LANE_BUSY
+        self._slots[idx] = sha
+
+    def __contains__(self, sha: object) -> bool:
+        return sha in self._lanes
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def append(self, sha: Optional[str]) -> None:
+        """
+        @brief Append one column.
+        @param sha {Optional[str]} Expected parent SHA or None.
+        """
+        self._slots.append(None)
+        self.row.append(_LANE_EMPTY)
+        if sha is not None:
+            self[len(self._slots) - 1] = sha
+
+    def pop(self) -> Optional[str]:
+        """
+        @brief Remove and return the last column.
+        @return {Optional[str]} SHA stored in the removed column.
+        """
+        sha = self._slots[-1]
+        if sha is not None:
+            self[len(self._slots) - 1] = None
+        self._slots.pop()
+        self.row.pop()
+        return sha
+
+    def extend_to(self, length: int) -> None:
+        """
+        @brief Pad the vine with empty columns up to `length`.
+        @param length {int} Minimum column count.
+        """
+        missing = length - len(self._slots)
+        if missing > 0:
+            self._slots.extend([None] * missing)
+            self.row.extend(b" " * missing)
+
+    def lanes(self, sha: str) -> List[int]:
+        """
+        @brief Return the ascending column indexes holding `sha`.
+        @param sha {str} Commit SHA.
+        @return {List[int]} Column indexes; empty when `sha` is not on the vine.
+        """
+        return self._lanes.get(sha, [])
+
 
 ## @brief Draw branch fan topology when a commit SHA appears in multiple vine columns.
-# @details Scans vine slots for duplicate commit references, emits a branch fan line when needed,
-#          and preserves branch-color continuity via `_vis_post`.
-# @satisfies REQ-109
-# @param vine {list} Mutable vine columns storing expected parent SHAs.
+# @details Looks up the commit columns through the vine lane index, emits a branch fan line
+#          when needed, and preserves branch-color continuity via `_vis_post`.
+# @satisfies REQ-109, REQ-165
+# @param vine {_Vine} Mutable vine lane state storing expected parent SHAs.
 # @param rev {str} Current commit SHA.
-# @param color {Dict[str,str]} ANSI color token map.
-# @param hash_width {int} Width of abbreviated hash column.
-# @param date_width {int} Width of formatted date column.
-# @param graph_margin_left {int} Left-side graph margin.
-# @param style {int} Active graph style identifier.
-# @param reverse_order {bool} Indicates reverse rendering order.
-# @param graph_symbol_tr {Callable[[str], str]} Graph control-code translator.
-# @param branch_colors_now {List[str]} Current branch color assignments.
-# @param branch_colors_ref {List[str]} Allowed branch color palette.
+# @param ctx {_RenderContext} Per-invocation rendering context.
 # @return {Optional[str]} Rendered branch line or None if no duplicate SHA columns exist.
 ## @brief Execute `_vine_branch` graph-processing logic for Foresta rendering.
 # @details Executes `_vine_branch` as deterministic commit-graph transformation/output logic.
 # @param vine Input parameter consumed by `_vine_branch`.
 # @param rev Input parameter consumed by `_vine_branch`.
-# @param color Input parameter consumed by `_vine_branch`.
-# @param hash_width Input parameter consumed by `_vine_branch`.
-# @param date_width Input parameter consumed by `_vine_branch`.
-# @param graph_margin_left Input parameter consumed by `_vine_branch`.
-# @param style Input parameter consumed by `_vine_branch`.
-# @param reverse_order Input parameter consumed by `_vine_branch`.
-# @param graph_symbol_tr Input parameter consumed by `_vine_branch`.
-# @param branch_colors_now Input parameter consumed by `_vine_branch`.
-# @param branch_colors_ref Input parameter consumed by `_vine_branch`.
+# @param ctx Input parameter consumed by `_vine_branch`.
 # @return Result emitted by `_vine_branch` according to command contract.
-def _vine_branch(
-    vine: list,
-    rev: str,
-    color: Dict[str, str],
-    hash_width: int,
-    date_width: int,
-    graph_margin_left: int,
-    style: int,
-    reverse_order: bool,
-    graph_symbol_tr,
-    branch_colors_now: List[str],
-    branch_colors_ref: List[str],
-) -> Optional[str]:
-    matched = 0
-    master = False
-    ret = ""
+def _vine_branch(vine: _Vine, rev: str, ctx: "_RenderContext") -> Optional[str]:
+    lanes = list(vine.lanes(rev))
+    if len(lanes) == 0:
+        return None
 
-    for idx in range(len(vine)):
-        if vine[idx] is None:
-            ret += " "
-        elif vine[idx] != rev:
-            ret += "I"
+    row = bytearray(vine.row)
+    master = False
+    for idx in lanes:
+        if not master and idx % 2 == 0:
+            row[idx] = ord("S")
+            master = True
         else:
-            if not master and idx % 2 == 0:
-                ret += "S"
-                master = True
-            else:
-                ret += "s"
-                vine[idx] = None
-            matched += 1
+            row[idx] = ord("s")
+            vine[idx] = None
 
-    if matched < 2:
+    if len(lanes) < 2:
         return None
 
     _remove_trailing_blanks(vine)
-    prefix = (
-        f"{'':>{hash_width}.{hash_width}s} {'':>{date_width}s}"
-        f"{'':>{graph_margin_left}s}"
-    )
-    vis = _vis_post(
-        _vis_fan(ret, "branch"),
-        None,
-        style,
-        reverse_order,
-        graph_symbol_tr,
-        color,
-        branch_colors_now,
-        branch_colors_ref,
-    )
-    return prefix + vis + "\n"
+    vis = _vis_post(_vis_fan(row.decode("ascii"), "branch"), None, ctx)
+    return ctx.graph_prefix + vis + "\n"
 
 
-def _vine_commit(vine: list, rev: str, parents: List[str]) -> str:
+def _vine_commit(vine: _Vine, rev: str, parents: List[str]) -> str:
     """
     @brief Draw commit node on the vine graph.
     @details Places the commit at its vine position or allocates a new tip slot.
     Differentiates commit types: 'C' regular, 'r' root (no parents),
     'M' merge (multiple parents), 't' tip (new branch head).
-    @satisfies REQ-109
-    @param vine {list} Column array of expected parent IDs.
+    @satisfies REQ-109, REQ-165
+    @param vine {_Vine} Lane state of expected parent IDs.
     @param rev {str} Current commit SHA.
     @param parents {List[str]} Parent commit SHAs.
     @return {str} Control string representing the commit line.
     """
-    ret = ""
-
-    for i in range(len(vine)):
-        if vine[i] is None:
-            ret += " "
-        elif vine[i] == rev:
-            ret += "C"
+    row = bytearray(vine.row)
+    lanes = vine.lanes(rev)
+
+    if lanes:
+        if len(parents) == 0:
+            mark = ord("r")
+        elif len(parents) > 1:
+            mark = ord("M")
         else:
-            ret += "I"
-
-    if "C" not in ret:
-        # Tip: not yet in vine, find a slot
+            mark = ord("C")
+        for idx in lanes:
+            row[idx] = mark
+    else:
+        # Tip: not yet in vine, take the rightmost free even slot
         placed = False
-        for i in range(_round_down2(len(vine) - 1), -1, -2):
-            if i >= 0 and i < len(ret) and ret[i] == " ":
-                ret = ret[:i] + "t" + ret[i + 1 :]
-                while len(vine) <= i:
-                    vine.append(None)
+        end = _round_down2(len(row) - 1) + 1
+        while end > 0:
+            i = row.rfind(b" ", 0, end)
+            if i < 0:
+                break
+            if i % 2 == 0:
+                row[i] = ord("t")
                 vine[i] = rev
                 placed = True
                 break
+            end = i
         if not placed:
             if len(vine) % 2 != 0:
                 vine.append(None)
-                ret += " "
-            ret += "t"
+                row.append(_LANE_EMPTY)
+            row.append(ord("t"))
             vine.append(rev)
 
     _remove_trailing_blanks(vine)
-
-    if len(parents) == 0:
-        ret = ret.replace("C", "r")
-    elif len(parents) > 1:
-        ret = ret.replace("C", "M")
-
-    return ret
+    return row.decode("ascii")
 
 
 ## @brief Draw merge fan topology and update vine state across commit parents.
 # @details For single-parent commits the vine is only advanced; for merge commits a fan visualization
 #          is generated, using lookahead heuristics to preserve adjacent branch continuity.
-# @satisfies REQ-109
-# @param vine {list} Mutable vine columns storing expected parent SHAs.
+# @satisfies REQ-109, REQ-165
+# @param vine {_Vine} Mutable vine lane state storing expected parent SHAs.
 # @param rev {str} Current commit SHA.
 # @param next_sha {List[Optional[str]]} Lookahead SHAs used for branch-placement heuristics.
 # @param parents {list} Mutable parent SHA list for merge fan rendering.
-# @param color {Dict[str,str]} ANSI color token map.
-# @param hash_width {int} Width of abbreviated hash column.
-# @param date_width {int} Width of formatted date column.
-# @param graph_margin_left {int} Left-side graph margin.
-# @param style {int} Active graph style identifier.
-# @param reverse_order {bool} Indicates reverse rendering order.
-# @param graph_symbol_tr {Callable[[str], str]} Graph control-code translator.
-# @param branch_colors_now {List[str]} Current branch color assignments.
-# @param branch_colors_ref {List[str]} Allowed branch color palette.
+# @param ctx {_RenderContext} Per-invocation rendering context.
 # @return {Optional[str]} Rendered merge line or None when no explicit merge line is emitted.
 ## @brief Execute `_vine_merge` graph-processing logic for Foresta rendering.
 # @details Executes `_vine_merge` as deterministic commit-graph transformation/output logic.
@@ -611,39 +703,19 @@ def _vine_commit(vine: list, rev: str, parents: List[str]) -> str:
 # @param rev Input parameter consumed by `_vine_merge`.
 # @param next_sha Input parameter consumed by `_vine_merge`.
 # @param parents Input parameter consumed by `_vine_merge`.
-# @param color Input parameter consumed by `_vine_merge`.
-# @param hash_width Input parameter consumed by `_vine_merge`.
-# @param date_width Input parameter consumed by `_vine_merge`.
-# @param graph_margin_left Input parameter consumed by `_vine_merge`.
-# @param style Input parameter consumed by `_vine_merge`.
-# @param reverse_order Input parameter consumed by `_vine_merge`.
-# @param graph_symbol_tr Input parameter consumed by `_vine_merge`.
-# @param branch_colors_now Input parameter consumed by `_vine_merge`.
-# @param branch_colors_ref Input parameter consumed by `_vine_merge`.
+# @param ctx Input parameter consumed by `_vine_merge`.
 # @return Result emitted by `_vine_merge` according to command contract.
 def _vine_merge(
-    vine: list,
+    vine: _Vine,
     rev: str,
     next_sha: List[Optional[str]],
     parents: list,
-    color: Dict[str, str],
-    hash_width: int,
-    date_width: int,
-    graph_margin_left: int,
-    style: int,
-    reverse_order: bool,
-    graph_symbol_tr,
-    branch_colors_now: List[str],
-    branch_colors_ref: List[str],
+    ctx: "_RenderContext",
 ) -> Optional[str]:
-    orig_vine = -1
-    for i in range(len(vine)):
-        if vine[i] == rev:
-            orig_vine = i
-            break
-
-    if orig_vine == -1:
+    rev_lanes = vine.lanes(rev)
+    if not rev_lanes:
         return None  # vine_commit did not add this vine
+    orig_vine = rev_lanes[0]
 
     if len(parents) <= 1:
         vine[orig_vine] = parents[0] if parents else None
@@ -651,50 +723,34 @@ def _vine_merge(
         return None
 
     # Put previously seen branches in subvine columns
-    ret = ""
+    fanouts: List[int] = []
     j = 0
     while j <= len(parents) - 1 and len(parents) > 1:
-        spliced = False
-        for idx in range(len(vine)):
-            z = vine[idx]
-            if z is None:
-                continue
-            if vine[idx] != parents[j]:
-                continue
-            if z not in next_sha:
-                continue
-            if idx == orig_vine:
-                continue
-
-            if idx < orig_vine:
-                p = idx + 1
-                if p < len(vine) and vine[p] is not None:
-                    p = idx - 1
-                if p < 0 or (p < len(vine) and vine[p] is not None):
+        parent = parents[j]
+        if parent in next_sha:
+            for idx in vine.lanes(parent):
+                if idx == orig_vine:
                     continue
-                while len(vine) <= p:
-                    vine.append(None)
-                vine[p] = parents[j]
-                ret = _str_expand(ret, p + 1)
-                ret = ret[:p] + "s" + ret[p + 1 :]
-            else:
-                p = idx - 1
-                if p < 0 or (p < len(vine) and vine[p] is not None):
+
+                if idx < orig_vine:
                     p = idx + 1
-                if p < len(vine) and vine[p] is not None:
-                    continue
-                while len(vine) <= p:
-                    vine.append(None)
-                vine[p] = parents[j]
-                ret = _str_expand(ret, p + 1)
-                ret = ret[:p] + "s" + ret[p + 1 :]
-
-            parents.pop(j)
-            j -= 1
-            spliced = True
-            break
-        if not spliced:
-            pass
+                    if p < len(vine) and vine[p] is not None:
+                        p = idx - 1
+                    if p < 0 or (p < len(vine) and vine[p] is not None):
+                        continue
+                else:
+                    p = idx - 1
+                    if p < 0 or (p < len(vine) and vine[p] is not None):
+                        p = idx + 1
+                    if p < len(vine) and vine[p] is not None:
+                        continue
+
+                vine.extend_to(p + 1)
+                vine[p] = parent
+                fanouts.append(p)
+                parents.pop(j)
+                j -= 1
+                break
         j += 1
 
     # Find slots for remaining parents
@@ -717,9 +773,7 @@ def _vine_merge(
     while parent_idx < len(parents) - 1:
         while idx < len(vine) and vine[idx] is not None:
             idx += 2
-        if idx >= len(vine):
-            while len(vine) <= idx:
-                vine.append(None)
+        vine.extend_to(idx + 1)
         if vine[idx] is None:
             slot.append(idx)
             parent_idx += 1
@@ -730,38 +784,16 @@ def _vine_merge(
 
     slot.sort()
     max_len = len(vine) + 2 * len(slot)
+    row = bytearray(vine.row)
+    row.extend(b" " * (max_len - len(row)))
+    for p in fanouts:
+        row[p] = ord("s")
+    for i in slot:
+        vine[i] = parents.pop(0)
+        row[i] = ord("S") if i == orig_vine else ord("s")
 
-    for i in range(max_len):
-        ret = _str_expand(ret, i + 1)
-        if slot and i == slot[0]:
-            slot.pop(0)
-            while len(vine) <= i:
-                vine.append(None)
-            vine[i] = parents.pop(0)
-            ch = "S" if i == orig_vine else "s"
-            ret = ret[:i] + ch + ret[i + 1 :]
-        elif ret[i] == "s":
-            pass  # keep existing fanouts
-        elif i < len(vine) and vine[i] is not None:
-            ret = ret[:i] + "I" + ret[i + 1 :]
-        else:
-            ret = ret[:i] + " " + ret[i + 1 :]
-
-    prefix = (
-        f"{'':>{hash_width}.{hash_width}s} {'':>{date_width}s}"
-        f"{'':>{graph_margin_left}s}"
-    )
-    vis = _vis_post(
-        _vis_fan(ret, "merge"),
-        None,
-        style,
-        reverse_order,
-        graph_symbol_tr,
-        color,
-        branch_colors_now,
-        branch_colors_ref,
-    )
-    return prefix + vis + "\n"
+    vis = _vis_post(_vis_fan(row.decode("ascii"), "merge"), None, ctx)
+    return ctx.graph_prefix + vis + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -911,136 +943,175 @@ _STYLE_MAPS = {
 }
 
 
+## @brief Matcher for the first commit/tip/root marker used by post-commit space fill.
+_COMMIT_MARKER_RE = re.compile(r"[Ctr]")
+
+## @brief Splitter isolating ANSI SGR sequences inside suffix segments.
+_ANSI_SPLIT_RE = re.compile(r"(\x1b\[[\d;]*m)")
+
+## @brief Translation table swapping branch fan codes for reverse-order rendering.
+_REVERSE_FAN_TR = str.maketrans("efgxyz", "xyzefg")
+
+## @brief Control codes rewritten by reverse-order swap, style maps, or graph symbols.
+_CONTROL_CODES = "ABCDIKMOefgmrtxyz"
+
+
+class _RenderContext:
+    """
+    @brief Per-invocation rendering state for the foresta visual pipeline.
+    @details Built once from the options parsed by `run`. Composes reverse-order
+    swap, style map, and graph-symbol substitution into one `str.translate`
+    table, precompiles the branch-symbol matcher, and caches color codes and
+    the blank graph prefix, so per-row rendering performs no regex compilation
+    and a single translation pass.
+    @satisfies REQ-101, REQ-166
+    """
+
+    def __init__(
+        self,
+        style: int,
+        reverse_order: bool,
+        graph_symbol_tr,
+        color: Dict[str, str],
+        branch_colors_now: List[str],
+        branch_colors_ref: List[str],
+        hash_width: int = 0,
+        date_width: int = 0,
+        graph_margin_left: int = 0,
+    ):
+        """
+        @brief Build translation tables and cached codes for one invocation.
+        @param style {int} Style selector (`1`, `2`, `10`, `15`).
+        @param reverse_order {bool} Enables reverse fan transformation when true.
+        @param graph_symbol_tr {Callable[[str], str]} Control-to-symbol translator function.
+        @param color {Dict[str,str]} ANSI color token map (empty in no-color mode).
+        @param branch_colors_now {List[str]} Mutable current branch color assignments.
+        @param branch_colors_ref {List[str]} Allowed branch color palette.
+        @param hash_width {int} Width of abbreviated hash column.
+        @param date_width {int} Width of formatted date column.
+        @param graph_margin_left {int} Left-side graph margin.
+        """
+        self.color = color
+        self.branch_colors_now = branch_colors_now
+        self.branch_colors_ref = branch_colors_ref
+        self.tree_code = color.get("tree", "")
+        self.default_code = color.get("default", "")
+        self.graph_prefix = (
+            f"{'':>{hash_width}.{hash_width}s} {'':>{date_width}s}"
+            f"{'':>{graph_margin_left}s}"
+        )
+
+        # Replacement targets are single characters, so applying the staged
+        # pipeline per control code yields the same result as per line.
+        style_map = _STYLE_MAPS.get(style)
+        table: Dict[int, str] = {}
+        for code in _CONTROL_CODES:
+            out = code
+            if reverse_order:
+                out = out.translate(_REVERSE_FAN_TR)
+            if style_map:
+                out = out.translate(style_map)
+            out = graph_symbol_tr(out)
+            if out != code:
+                table[ord(code)] = out
+        self.table = table
+
+        symbol_chars = "".join(graph_symbol_tr(code) for code in "CMrt")
+        self.symbol_re = (
+            re.compile(r"^(.*?)([" + re.escape(symbol_chars) + r"])")
+            if symbol_chars and color
+            else None
+        )
+        # Optional sink collecting `[control string, color assignments]` per `_vis_post` call.
+        self.trace: Optional[list] = None
+
+
 ## @brief Convert graph control-string tokens into styled Unicode output.
-# @details Applies optional space-filling after commit markers, reverse-order fan transformation,
-#          style-specific Unicode translation, and final graph-symbol replacement.
-# @satisfies REQ-101
+# @details Applies optional space-filling after commit markers, then the precomposed
+#          reverse-order, style, and graph-symbol translation table of the render context.
+# @satisfies REQ-101, REQ-166
 # @param s {str} Graph control-string line.
 # @param spc {bool} Enables post-commit-space fill when true.
-# @param style {int} Style selector (`1`, `2`, `10`, `15`).
-# @param reverse_order {bool} Enables reverse fan transformation when true.
-# @param graph_symbol_tr {Callable[[str], str]} Control-to-symbol translator function.
+# @param ctx {_RenderContext} Per-invocation rendering context.
 # @return {str} Rendered graph line with selected style and symbols.
-def _vis_xfrm(
-    s: str,
-    spc: bool,
-    style: int,
-    reverse_order: bool,
-    graph_symbol_tr,
-) -> str:
+def _vis_xfrm(s: str, spc: bool, ctx: _RenderContext) -> str:
     if spc:
         # Fill spaces after commit/tip/root markers with '*'
-        match = re.search(r"[Ctr]", s)
+        match = _COMMIT_MARKER_RE.search(s)
         if match:
             pos = match.start()
-            tail = s[pos:]
-            tail = tail.replace(" ", "*")
-            s = s[:pos] + tail
+            s = s[:pos] + s[pos:].replace(" ", "*")
 
     # Change branch colors tracking is done externally
-
-    if reverse_order:
-        # Swap efg <-> xyz
-        swap = str.maketrans("efgxyz", "xyzefg")
-        s = s.translate(swap)
-
-    style_map = _STYLE_MAPS.get(style)
-    if style_map:
-        s = s.translate(style_map)
-
-    return graph_symbol_tr(s)
+    return s.translate(ctx.table)
 
 
 ## @brief Post-process graph control strings with style transform and branch coloring.
 # @details Applies `_vis_xfrm` to graph/control suffix segments, preserves ANSI spans, and injects
 #          branch-color-specific commit glyph coloring based on tracked branch state.
+# @satisfies REQ-166
 # @param s {str} Primary graph control string.
 # @param f {Optional[str]} Optional suffix containing refs/message text.
-# @param style {int} Active graph style identifier.
-# @param reverse_order {bool} Indicates reverse rendering order.
-# @param graph_symbol_tr {Callable[[str], str]} Graph control-code translator.
-# @param color {Dict[str,str]} ANSI color token map (empty in no-color mode).
-# @param branch_colors_now {List[str]} Current branch color assignments.
-# @param branch_colors_ref {List[str]} Allowed branch color palette.
+# @param ctx {_RenderContext} Per-invocation rendering context.
 # @return {str} Final rendered line with style transformation and ANSI colors.
-## @brief Execute `_vis_post` graph-processing logic for Foresta rendering.
-# @details Executes `_vis_post` as deterministic commit-graph transformation/output logic.
-# @param s Input parameter consumed by `_vis_post`.
-# @param f Input parameter consumed by `_vis_post`.
-# @param style Input parameter consumed by `_vis_post`.
-# @param reverse_order Input parameter consumed by `_vis_post`.
-# @param graph_symbol_tr Input parameter consumed by `_vis_post`.
-# @param color Input parameter consumed by `_vis_post`.
-# @param branch_colors_now Input parameter consumed by `_vis_post`.
-# @param branch_colors_ref Input parameter consumed by `_vis_post`.
-# @return Result emitted by `_vis_post` according to command contract.
-def _vis_post(
+def _vis_post(s: str, f: Optional[str], ctx: _RenderContext) -> str:
+    # Update branch color assignments before transforming
+    assigned = _update_branch_colors(s, ctx.branch_colors_now, ctx.branch_colors_ref)
+    if ctx.trace is not None:
+        ctx.trace.append([s, assigned or None])
+    return _vis_render(s, f, ctx, ctx.branch_colors_now)
+
+
+## @brief Render one graph control string with a given branch-color assignment state.
+# @details Applies `_vis_xfrm`, suffix handling, and branch-colored commit glyph injection
+#          without mutating color state; shared by live rendering and layout-cache replay.
+# @satisfies REQ-166, REQ-169
+# @param s {str} Primary graph control string.
+# @param f {Optional[str]} Optional suffix containing refs/message text.
+# @param ctx {_RenderContext} Per-invocation rendering context.
+# @param branch_colors_now {List[str]} Branch color assignments in effect for this line.
+# @return {str} Final rendered line with style transformation and ANSI colors.
+def _vis_render(
     s: str,
     f: Optional[str],
-    style: int,
-    reverse_order: bool,
-    graph_symbol_tr,
-    color: Dict[str, str],
+    ctx: _RenderContext,
     branch_colors_now: List[str],
-    branch_colors_ref: List[str],
 ) -> str:
-    # Update branch color assignments before transforming
-    _update_branch_colors(s, branch_colors_now, branch_colors_ref)
-
     has_suffix = f is not None
-    s = _vis_xfrm(s, has_suffix, style, reverse_order, graph_symbol_tr)
+    s = _vis_xfrm(s, has_suffix, ctx)
     if has_suffix:
         # Transform non-ANSI parts of f
-        parts = re.split(r"(\x1b\[[\d;]*m)", f)
+        parts = _ANSI_SPLIT_RE.split(f)
         new_f = ""
-        for i, part in enumerate(parts):
+        for part in parts:
             if part.startswith("\x1b"):
                 new_f += part
             else:
-                new_f += _vis_xfrm(
-                    part, False, style, reverse_order, graph_symbol_tr
-                )
+                new_f += _vis_xfrm(part, False, ctx)
         f = new_f
 
         s = s.replace("*", f or "")
-        if color:
-            default_code = color.get("default", "")
-            tree_code = color.get("tree", "")
-            if default_code:
-                s = s.replace(default_code, default_code + tree_code)
+        if ctx.color and ctx.default_code:
+            s = s.replace(ctx.default_code, ctx.default_code + ctx.tree_code)
         if f:
             s += f
 
     # Color the commit symbol with branch color
-    sym_commit = graph_symbol_tr("C")
-    sym_merge = graph_symbol_tr("M")
-    sym_root = graph_symbol_tr("r")
-    sym_tip = graph_symbol_tr("t")
-    symbol_chars = sym_commit + sym_merge + sym_root + sym_tip
-    if symbol_chars and color:
-        pattern = re.compile(
-            r"^(.*?)([" + re.escape(symbol_chars) + r"])"
-        )
-        match = pattern.match(s)
+    if ctx.symbol_re is not None:
+        match = ctx.symbol_re.match(s)
         if match:
-            prefix_len = len(match.group(1))
-            color_idx = prefix_len // 2
+            color_idx = len(match.group(1)) // 2
             if color_idx < len(branch_colors_now) and branch_colors_now[color_idx]:
-                branch_color_name = branch_colors_now[color_idx]
-                branch_color_code = color.get(branch_color_name, "")
-                tree_code = color.get("tree", "")
-                symbol = match.group(2)
+                branch_color_code = ctx.color.get(branch_colors_now[color_idx], "")
                 s = (
                     s[: match.start(2)]
                     + branch_color_code
-                    + symbol
-                    + tree_code
+                    + match.group(2)
+                    + ctx.tree_code
                     + s[match.end(2) :]
                 )
 
-    tree_code = color.get("tree", "")
-    default_code = color.get("default", "")
-    return tree_code + s + default_code
+    return ctx.tree_code + s + ctx.default_code
 
 
 ## @brief Update branch-color assignments using current vine control-string content.
@@ -1050,12 +1121,14 @@ def _vis_post(
 # @param s {str} Vine control string for the current rendered line.
 # @param branch_colors_now {List[str]} Mutable current branch-color assignments.
 # @param branch_colors_ref {List[str]} Fixed branch-color palette.
-# @return None. Mutates `branch_colors_now` in place.
+# @return {List[int]} Flat `(slot, palette index)` pairs assigned by this call; mutates
+#         `branch_colors_now` in place.
 def _update_branch_colors(
     s: str,
     branch_colors_now: List[str],
     branch_colors_ref: List[str],
-) -> None:
+) -> List[int]:
+    assigned: List[int] = []
     # Extract odd-indexed characters (even vine slots)
     s_arr_odd = [s[i] for i in range(0, len(s), 2)]
 
@@ -1084,36 +1157,142 @@ def _update_branch_colors(
                 j += 1
             if j < len(branch_colors_ref):
                 branch_colors_now[i] = branch_colors_ref[j]
+                assigned.extend((i, j))
+    return assigned
 
 
 # ---------------------------------------------------------------------------
-# Line block reader for subvine lookahead
+# Record stream reader for subvine lookahead
 # ---------------------------------------------------------------------------
 
+## @brief Compiled matcher for `<%H><%h><%P>rest` git-log lines.
+_LOG_LINE_RE = re.compile(r"^<(.*?)><(.*?)><(.*?)>(.*)", re.DOTALL)
+
+
+## @brief Parse one raw git-log line into a commit record.
+# @details Strips the trailing line terminator and splits the `<%H><%h><%P>`
+#          header from the pretty-format payload exactly once per line.
+# @param raw_line {str} Raw git-log line including its newline.
+# @return {Optional[Tuple[str, List[str], str]]} `(sha, parents, payload)`, or
+#         `None` when the line does not carry a commit header.
+def _parse_log_line(raw_line: str) -> Optional[Tuple[str, List[str], str]]:
+    match = _LOG_LINE_RE.match(raw_line.rstrip("\n").rstrip("\r"))
+    if not match:
+        return None
+    return match.group(1), match.group(3).split(), match.group(4)
+
 
-## @brief Read one commit-log line plus bounded lookahead for subvine processing.
-# @details Maintains a rolling prefetch buffer and returns the current line with up to
-#          `max_count - 1` subsequent entries for merge lookahead heuristics.
-# @param lines_iter {Iterator[str]} Iterator yielding raw git-log lines.
-# @param buffer {list} Mutable rolling prefetch buffer.
+## @brief Read one parsed commit record plus bounded SHA lookahead.
+# @details Keeps a rolling `collections.deque` of already-parsed records, so each
+#          git-log line is parsed once and each step costs O(`max_count`) instead
+#          of list `pop(0)` shifts. Lookahead entries are the SHAs of up to
+#          `max_count - 1` following records (`None` for unparsable lines).
+# @param records_iter {Iterator[Optional[Tuple[str, List[str], str]]]} Parsed record stream.
+# @param buffer {collections.deque} Mutable rolling prefetch buffer.
 # @param max_count {int} Maximum total items in returned block.
-# @return {Tuple[Optional[str], List[Optional[str]]]} Current line and lookahead list.
-def _get_line_block(
-    lines_iter, buffer: list, max_count: int
-) -> Tuple[Optional[str], List[Optional[str]]]:
+# @return {Tuple[Optional[Tuple[str, List[str], str]], List[Optional[str]], bool]}
+#         Current record, lookahead SHA list, and `False` once the stream is exhausted.
+# @satisfies REQ-164
+def _get_record_block(
+    records_iter, buffer: deque, max_count: int
+) -> Tuple[Optional[Tuple[str, List[str], str]], List[Optional[str]], bool]:
     while len(buffer) < max_count:
         try:
-            x = next(lines_iter)
-            buffer.append(x)
+            buffer.append(next(records_iter))
         except StopIteration:
             break
 
     if not buffer:
-        return None, []
+        return None, [], False
+
+    current = buffer.popleft()
+    lookahead = [
+        record[0] if record is not None else None
+        for record in islice(buffer, max_count - 1)
+    ]
+    return current, lookahead, True
+
+
+## @brief Matcher for passthrough options that already bound or offset the commit window.
+_LOG_LIMIT_RE = re.compile(r"^(-n.*|-\d+|--max-count(=.*)?|--skip(=.*)?)$")
+
+
+## @brief Tell whether passthrough `git log` arguments already limit the history window.
+# @param argv {List[str]} Passthrough `git log` arguments.
+# @return {bool} `True` when `-n`, `-<n>`, `--max-count`, or `--skip` is present before `--`.
+def _has_log_limit(argv: List[str]) -> bool:
+    for arg in argv:
+        if arg == "--":
+            return False
+        if _LOG_LIMIT_RE.match(arg):
+            return True
+    return False
+
+
+class _LogRecordStream:
+    """
+    @brief Parsed `git log` record stream with optional lazy page windows.
+    @details Without a page size one `git log` pipe is streamed to the end. With
+    a page size commits are requested in `--skip`/`--max-count` windows that
+    start at one page and double, so the first screen costs one page of
+    history while total work stays linear in the rendered commits. `close`
+    terminates the running `git log` as soon as the consumer stops reading.
+    @satisfies REQ-170
+    """
+
+    def __init__(
+        self, log_args: List[str], argv: List[str], page_size: Optional[int] = None
+    ):
+        """
+        @brief Configure the stream without spawning git.
+        @param log_args {List[str]} Leading `git log` sub-command and format tokens.
+        @param argv {List[str]} Passthrough `git log` arguments appended after window options.
+        @param page_size {Optional[int]} First window size in commits; `None` streams unbounded.
+        """
+        self.log_args = log_args
+        self.argv = argv
+        self.page_size = page_size
+        self.returncode = 0
+        self._proc: Optional[subprocess.Popen] = None
 
-    current = buffer.pop(0)
-    lookahead = buffer[:max_count - 1]
-    return current, lookahead
+    def __iter__(self):
+        """
+        @brief Yield parsed records from successive `git log` windows.
+        @return {Iterator[Optional[Tuple[str, List[str], str]]]} Parsed records (`None` for
+                lines without a commit header).
+        """
+        skip = 0
+        size = self.page_size
+        while True:
+            window = [] if size is None else [f"--skip={skip}", f"--max-count={size}"]
+            proc = self._proc = _git_command_output_pipe(self.log_args + window + self.argv)
+            assert proc.stdout is not None
+            commits = 0
+            for raw_line in proc.stdout:
+                record = _parse_log_line(raw_line)
+                if record is not None:
+                    commits += 1
+                yield record
+            proc.stdout.close()
+            self.returncode = proc.wait() or self.returncode
+            self._proc = None
+            if size is None or commits < size or self.returncode:
+                return
+            skip += size
+            size *= 2
+
+    def close(self) -> None:
+        """
+        @brief Terminate the running `git log` window, if any, and reap it.
+        """
+        proc = self._proc
+        if proc is None:
+            return
+        self._proc = None
+        proc.terminate()
+        if proc.stdout is not None:
+            proc.stdout.close()
+        self.returncode = proc.wait() or self.returncode or 1
 
 
 # ---------------------------------------------------------------------------
@@ -1121,27 +1300,45 @@ def _get_line_block(
 # ---------------------------------------------------------------------------
 
 
+## @brief Buffered character count after which `_ReverseOutput` spills to a temporary file.
+_REVERSE_SPILL_THRESHOLD = 8 * 1024 * 1024
+
+## @brief Character budget of one reversed write batch emitted by `_ReverseOutput.close`.
+_REVERSE_WRITE_BATCH = 64 * 1024
+
+
 class _ReverseOutput:
     """
     @brief Buffer that collects output and writes it in reverse line order.
-    @details Used when --reverse is specified. Accumulates all printed output
-    and flushes in reverse order on close().
+    @details Used when --reverse is specified. Accumulates printed output in a
+    chunk list; once the buffered size passes the spill threshold, chunks are
+    moved to an anonymous temporary file so resident memory stays bounded.
+    close() emits lines in reverse order, scanning a spilled file backward
+    through `mmap` in fixed-size write batches.
+    @satisfies REQ-167
     """
 
-    def __init__(self, stream):
+    def __init__(self, stream, spill_threshold: int = _REVERSE_SPILL_THRESHOLD):
         """
         @brief Initialize reverse output buffer.
         @param stream Output stream to write reversed content to.
+        @param spill_threshold {int} Buffered character count that triggers spilling to disk.
         """
         self._stream = stream
-        self._saved = ""
+        self._spill_threshold = spill_threshold
+        self._chunks: List[str] = []
+        self._size = 0
+        self._spill = None
 
     def write(self, text: str) -> None:
         """
         @brief Accumulate text for later reversed output.
         @param text {str} Text to buffer.
         """
-        self._saved += text
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self._spill_threshold:
+            self._spill_chunks()
 
     def flush(self) -> None:
         """
@@ -1149,15 +1346,59 @@ class _ReverseOutput:
         """
         pass
 
+    def _spill_chunks(self) -> None:
+        """
+        @brief Move buffered chunks to the temporary spill file.
+        """
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile()
+        self._spill.write("".join(self._chunks).encode("utf-8", "surrogateescape"))
+        self._chunks = []
+        self._size = 0
+
     def close(self) -> None:
         """
         @brief Write buffered content in reverse line order to the stream.
         """
-        lines = self._saved.split("\n")
-        lines.reverse()
-        self._stream.write("\n".join(lines))
-        if lines:
+        if self._spill is None:
+            lines = "".join(self._chunks).split("\n")
+            lines.reverse()
+            self._stream.write("\n".join(lines))
             self._stream.write("\n")
+            self._stream.flush()
+            return
+
+        self._spill_chunks()
+        spill = self._spill
+        self._spill = None
+        try:
+            spill.flush()
+            if spill.tell() == 0:
+                self._stream.write("\n")
+                self._stream.flush()
+                return
+            with mmap.mmap(spill.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                batch: List[bytes] = []
+                batch_size = 0
+                end = len(data)
+                while True:
+                    idx = data.rfind(b"\n", 0, end)
+                    batch.append(data[idx + 1 : end])
+                    batch_size += end - idx
+                    if idx < 0:
+                        break
+                    batch.append(b"\n")
+                    end = idx
+                    if batch_size >= _REVERSE_WRITE_BATCH:
+                        self._stream.write(
+                            b"".join(batch).decode("utf-8", "surrogateescape")
+                        )
+                        batch = []
+                        batch_size = 0
+                batch.append(b"\n")
+                self._stream.write(b"".join(batch).decode("utf-8", "surrogateescape"))
+        finally:
+            spill.close()
         self._stream.flush()
 
 
@@ -1175,10 +1416,69 @@ def _resolve_terminal_columns() -> int:
     return max(shutil.get_terminal_size(fallback=(120, 24)).columns, 1)
 
 
+## @brief Resolve the first `--page` window from the terminal height.
+# @details Uses `shutil.get_terminal_size`, so output piped to a pager falls back to
+#          24 rows; one window never needs more commits than rendered rows.
+# @satisfies REQ-170
+# @return {int} Commits requested by the first paged `git log` window.
+def _resolve_page_size() -> int:
+    return max(shutil.get_terminal_size(fallback=(120, 24)).lines, 1)
+
+
+## @brief Redirect stdout to the null device after the reader closed the pipe.
+# @details Prevents the interpreter-exit flush of buffered output from reporting a
+#          second `BrokenPipeError`.
+# @return None.
+def _silence_closed_stdout() -> None:
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except (OSError, ValueError, AttributeError):
+        pass
+
+
+## @brief Splitter isolating ANSI SGR sequences as odd-indexed tokens.
+_ANSI_TOKEN_RE = re.compile(r"(\x1b\[[0-9;]*m)")
+
+
+## @brief Return the terminal column width of one character.
+# @details Full-width and wide East Asian characters occupy two columns, combining marks
+#          occupy none, and every other character occupies one column.
+# @satisfies REQ-168
+# @param ch {str} Single character.
+# @return {int} Visible column width (`0`, `1`, or `2`).
+@lru_cache(maxsize=4096)
+def _char_columns(ch: str) -> int:
+    if unicodedata.combining(ch):
+        return 0
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return 2
+    return 1
+
+
+## @brief Matcher for text made only of single-column Latin and box-drawing/geometric glyphs.
+_NARROW_TEXT_RE = re.compile(r"[\x00-\u02ff\u2500-\u25fc]*")
+
+
+## @brief Return the terminal column width of a printable text segment.
+# @details Uses `len` for ASCII, Latin, and graph-glyph segments; other segments are
+#          measured per character with East Asian widths.
+# @satisfies REQ-168
+# @param text {str} Text segment without ANSI escape sequences.
+# @return {int} Visible column width.
+def _text_columns(text: str) -> int:
+    if text.isascii() or _NARROW_TEXT_RE.fullmatch(text):
+        return len(text)
+    return sum(map(_char_columns, text))
+
+
 ## @brief Truncate one rendered line to a visible terminal-width budget.
-# @details Preserves ANSI escape sequences as zero-width tokens, truncates only
-#          printable glyph columns, and preserves trailing newline semantics.
-# @satisfies REQ-100
+# @details Returns the line unchanged when its escape-stripped width already fits. Otherwise
+#          splits it once on ANSI escape boundaries, keeps escape tokens as zero-width,
+#          cuts the first printable segment that overflows using East Asian column widths,
+#          and preserves trailing newline semantics.
+# @satisfies REQ-100, REQ-168
 # @param line {str} Rendered output line with optional ANSI escape sequences.
 # @param terminal_columns {int} Maximum number of visible printable columns.
 # @return {str} Width-bounded line preserving ANSI tokens and newline suffix.
@@ -1187,47 +1487,650 @@ def _truncate_line_to_terminal_width(line: str, terminal_columns: int) -> str:
         terminal_columns = 1
     line_no_nl = line[:-1] if line.endswith("\n") else line
     newline = "\n" if line.endswith("\n") else ""
+    has_escape = "\x1b[" in line_no_nl
+    plain = _ANSI_ESCAPE_RE.sub("", line_no_nl) if has_escape else line_no_nl
+    narrow = plain.isascii() or _NARROW_TEXT_RE.fullmatch(plain) is not None
+    if (len(plain) if narrow else _text_columns(plain)) <= terminal_columns:
+        return line
+    parts = _ANSI_TOKEN_RE.split(line_no_nl) if has_escape else [line_no_nl]
+
     visible_columns = 0
     out: List[str] = []
-    index = 0
     truncated = False
-    while index < len(line_no_nl):
-        escape_match = _ANSI_ESCAPE_RE.match(line_no_nl, index)
-        if escape_match is not None:
-            out.append(escape_match.group(0))
-            index = escape_match.end()
+    for index, part in enumerate(parts):
+        if index % 2:
+            out.append(part)
             continue
-        if visible_columns >= terminal_columns:
-            truncated = True
-            break
-        out.append(line_no_nl[index])
-        visible_columns += 1
-        index += 1
-    if index < len(line_no_nl):
+        width = len(part) if narrow else _text_columns(part)
+        if visible_columns + width <= terminal_columns:
+            out.append(part)
+            visible_columns += width
+            continue
+        if narrow:
+            out.append(part[: terminal_columns - visible_columns])
+        else:
+            cut = 0
+            for ch in part:
+                width = _char_columns(ch)
+                if visible_columns + width > terminal_columns:
+                    break
+                visible_columns += width
+                cut += 1
+            out.append(part[:cut])
         truncated = True
+        break
     rendered = "".join(out)
     if truncated and "\x1b[" in rendered and not rendered.endswith(_COLOR["default"]):
         rendered += _COLOR["default"]
     return rendered + newline
 
 
-## @brief Write one rendered line with optional terminal-width truncation.
-# @details Applies width truncation only when `terminal_columns` is provided;
-#          otherwise writes the full input line.
-# @satisfies REQ-100, REQ-104
-# @param output_stream {IO[str]} Destination stream.
-# @param line {str} Rendered output line.
-# @param terminal_columns {Optional[int]} Width budget or `None` for wrapping.
+# ---------------------------------------------------------------------------
+# Commit row decoration
+# ---------------------------------------------------------------------------
+
+## @brief Matcher locating the `HEAD` decoration where the status marker is injected.
+_HEAD_REF_RE = re.compile(r"([^/])HEAD")
+
+## @brief Matcher for the git color sequence preceding `tag: ` decorations.
+_TAG_COLOR_RE = re.compile(r"\x1b\[\d;\d\dm(?=tag: )")
+
+
+## @brief Distinct commit minutes kept by the date-format cache.
+_DATE_CACHE_SIZE = 4096
+
+
+## @brief Tell whether a date format renders identically across one minute.
+# @details Compares the format at seconds `0` and `59` of the same UTC minute, so any
+#          second-level directive (`%S`, `%T`, `%c`, ...) disables minute caching.
+# @satisfies REQ-172
+# @param date_format {str} `strftime` format string.
+# @return {bool} `True` when the format has at most minute resolution.
+def _has_minute_resolution(date_format: str) -> bool:
+    return strftime(date_format, gmtime(0)) == strftime(date_format, gmtime(59))
+
+
+## @brief Tell whether the local UTC offset is constant and whole-minute across one hour.
+# @satisfies REQ-172
+# @param hour {int} Timestamp divided by 3600 (floor).
+# @return {bool} `True` when every minute of the hour formats from its first second.
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
+def _is_uniform_hour(hour: int) -> bool:
+    offset = localtime(hour * 3600).tm_gmtoff
+    return (
+        offset is not None
+        and offset % 60 == 0
+        and localtime(hour * 3600 + 3599).tm_gmtoff == offset
+    )
+
+
+## @brief Format the local time of one commit minute, memoized per minute.
+# @details Valid for every timestamp inside the minute only when the local UTC offset is a
+#          whole number of minutes and does not change within the hour; returns `None`
+#          otherwise so callers format the exact timestamp.
+# @satisfies REQ-172
+# @param date_format {str} `strftime` format string with at most minute resolution.
+# @param minute {int} Timestamp divided by 60 (floor).
+# @return {Optional[str]} Formatted local time, or `None` when the minute is not uniform.
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
+def _format_minute(date_format: str, minute: int) -> Optional[str]:
+    if not _is_uniform_hour(minute // 60):
+        return None
+    return strftime(date_format, localtime(minute * 60))
+
+
+class _RowFormatter:
+    """
+    @brief Per-invocation decoration of laid-out commit rows.
+    @details Holds everything row decoration needs besides the layout itself:
+    date formatting, hash/date columns, HEAD status and tag-color rewriting
+    of ref decorations, and terminal-width truncation, so the vine layout
+    loop only hands it one tuple per laid-out row. Dates go through a
+    per-minute LRU cache whenever the format has at most minute resolution.
+    @satisfies REQ-100, REQ-171, REQ-172
+    """
+
+    def __init__(
+        self,
+        refs: Dict[str, List[str]],
+        status: str,
+        show_status: bool,
+        color: Dict[str, str],
+        hash_width: int,
+        date_width: int,
+        date_format: str,
+        graph_margin_left: int,
+        graph_margin_right: int,
+        terminal_columns: Optional[int],
+    ):
+        """
+        @brief Capture decoration settings for one invocation.
+        @param refs {Dict[str,List[str]]} SHA-to-reference mapping.
+        @param status {str} Working-tree status token set.
+        @param show_status {bool} Enables status markers in HEAD decorations.
+        @param color {Dict[str,str]} ANSI color token map.
+        @param hash_width {int} Width of hash output column.
+        @param date_width {int} Width of date output column.
+        @param date_format {str} Datetime format string for commit dates.
+        @param graph_margin_left {int} Left graph margin width.
+        @param graph_margin_right {int} Right graph margin width.
+        @param terminal_columns {Optional[int]} Visible-width budget; `None` disables truncation.
+        """
+        self.refs = refs
+        self.status = status
+        self.show_status = show_status
+        self.hash_width = hash_width
+        self.date_width = date_width
+        self.date_format = date_format
+        self.minute_dates = _has_minute_resolution(date_format)
+        self.graph_margin_left = graph_margin_left
+        self.margin_right = " " * graph_margin_right
+        self.terminal_columns = terminal_columns
+        self.hash_color = color.get("hash", "")
+        self.date_color = color.get("date", "")
+        self.default_color = color.get("default", "")
+        self.author_color = color.get("author", "")
+        self.tag_color = color.get("tag", "")
+
+    def format_date(self, time_str: str) -> str:
+        """
+        @brief Format one `%at` commit timestamp with the configured date format.
+        @param time_str {str} Unix timestamp text.
+        @return {str} Formatted local date, or `time_str` when it is not a valid timestamp.
+        """
+        try:
+            timestamp = int(time_str)
+            return (
+                self.minute_dates and _format_minute(self.date_format, timestamp // 60)
+            ) or strftime(self.date_format, localtime(timestamp))
+        except (ValueError, OSError):
+            return time_str
+
+    def format_row(self, row: tuple) -> str:
+        """
+        @brief Render the branch, commit, and merge lines of one laid-out row.
+        @param row {tuple} `(sha, commit_hash, time_str, author, auto_refs, subject,
+               branch_line, vis, merge_line)`.
+        @return {str} Rendered lines, truncated to the terminal width when configured.
+        """
+        (
+            sha,
+            commit_hash,
+            time_str,
+            author,
+            auto_refs,
+            subject,
+            branch_line,
+            vis,
+            merge_line,
+        ) = row
+        date_str = self.format_date(time_str)
+
+        hash_width = self.hash_width
+        default_color = self.default_color
+        prefix = (
+            f"{self.hash_color}"
+            f"{commit_hash:<{hash_width}.{hash_width}s} "
+            f"{self.date_color}"
+            f"{date_str:<{self.date_width}s}"
+            f"{'':>{self.graph_margin_left}s}"
+            f"{default_color}"
+        )
+        author_segment = f"{self.author_color}{author}{default_color}"
+
+        # Annotate refs
+        ref_list = self.refs.get(sha)
+        if ref_list:
+            if self.show_status and "HEAD" in ref_list:
+                # Inject status after HEAD in auto_refs
+                status = self.status
+                auto_refs = _HEAD_REF_RE.sub(lambda m: m.group(0) + status, auto_refs)
+            if self.tag_color and any(r.startswith("refs/tags/") for r in ref_list):
+                auto_refs = _TAG_COLOR_RE.sub(self.tag_color, auto_refs)
+
+        commit_line = (
+            f"{prefix}{vis}{self.margin_right}"
+            f"{author_segment}{auto_refs} {subject}\n"
+        )
+        columns = self.terminal_columns
+        if columns is not None:
+            commit_line = _truncate_line_to_terminal_width(commit_line, columns)
+            if branch_line:
+                branch_line = _truncate_line_to_terminal_width(branch_line, columns)
+            if merge_line:
+                merge_line = _truncate_line_to_terminal_width(merge_line, columns)
+        if branch_line:
+            commit_line = branch_line + commit_line
+        if merge_line:
+            commit_line += merge_line
+        return commit_line
+
+
+class _JsonRowFormatter(_RowFormatter):
+    """
+    @brief Per-invocation JSON Lines serialization of laid-out commit rows.
+    @details Emits one compact JSON object per commit with commit metadata,
+    full reference names, HEAD status, the commit lane and its branch color,
+    and the plain graph glyphs of the branch, commit, and merge lines. Rows
+    are laid out without ANSI colors, so glyph strings carry no escapes.
+    @satisfies REQ-173
+    """
+
+    def format_row(self, row: tuple) -> str:
+        """
+        @brief Serialize one laid-out row as a JSON Lines record.
+        @param row {tuple} Text row fields followed by `(parents, commit lane index,
+               branch colors at the commit line)`.
+        @return {str} One JSON object terminated by a newline.
+        """
+        (
+            sha,
+            _commit_hash,
+            time_str,
+            author,
+            auto_refs,
+            subject,
+            branch_line,
+            vis,
+            merge_line,
+            parents,
+            lane,
+            colors,
+        ) = row
+        ref_list = self.refs.get(sha, [])
+        prefix_len = self.hash_width + 1 + self.date_width + self.graph_margin_left
+        try:
+            timestamp: Optional[int] = int(time_str)
+        except ValueError:
+            timestamp = None
+        record = {
+            "sha": sha,
+            "parents": parents,
+            "time": timestamp,
+            "date": self.format_date(time_str),
+            "author": author,
+            "subject": subject,
+            "refs": ref_list,
+            "decoration": auto_refs.strip().removeprefix("(").removesuffix(")"),
+            "status": self.status if self.show_status and "HEAD" in ref_list else "",
+            "lane": lane,
+            "color": (colors[lane] or None) if lane < len(colors) else None,
+            "colors": _layout_colors_state(colors),
+            "graph": {
+                "branch": branch_line[prefix_len:-1] if branch_line else None,
+                "commit": vis,
+                "merge": merge_line[prefix_len:-1] if merge_line else None,
+            },
+        }
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Persistent layout cache
+# ---------------------------------------------------------------------------
+
+## @brief Layout-cache file version; bump when the file layout or cached row semantics change.
+_LAYOUT_CACHE_VERSION = 3
+
+## @brief Directory name under the git common dir holding git-alias caches.
+_LAYOUT_CACHE_DIR_NAME = "git-alias"
+
+## @brief Regular stride, in rows, of vine-state snapshots stored in the layout cache.
+_LAYOUT_CACHE_SNAPSHOT_STRIDE = 256
+
+## @brief Minimum rendered rows before a layout cache entry is written.
+_LAYOUT_CACHE_MIN_ROWS = 1000
+
+## @brief Maximum total bytes of layout cache files kept per repository.
+_LAYOUT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+## @brief Fixed-width first line of a layout cache file, holding the index offset.
+_LAYOUT_CACHE_HEADER = '{"version":%d,"index":%16d}\n'
+
+## @brief Byte length of `_LAYOUT_CACHE_HEADER`.
+_LAYOUT_CACHE_HEADER_BYTES = len(_LAYOUT_CACHE_HEADER % (_LAYOUT_CACHE_VERSION, 0))
+
+## @brief Maximum age, in seconds, of layout cache files kept per repository.
+_LAYOUT_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+## @brief Resolve the layout cache file for one `git log` argument set.
+# @details Stores entries under `<git-common-dir>/git-alias/`, named by a digest of the
+#          passthrough arguments, working directory, subvine depth, and color palette,
+#          i.e. every input that changes lane assignment or color state.
+# @satisfies REQ-169
+# @param argv {List[str]} Passthrough `git log` arguments.
+# @param subvine_depth {int} Effective lookahead depth.
+# @param branch_colors_ref {List[str]} Branch color palette.
+# @return {Optional[str]} Cache file path, or `None` outside a repository.
+def _layout_cache_path(
+    argv: List[str], subvine_depth: int, branch_colors_ref: List[str]
+) -> Optional[str]:
+    try:
+        common_dir = _git_command(["rev-parse", "--git-common-dir"]).strip()
+    except (subprocess.CalledProcessError, OSError):
+        return None
+    if not common_dir:
+        return None
+    cwd = os.getcwd()
+    key = json.dumps(
+        [_LAYOUT_CACHE_VERSION, argv, cwd, subvine_depth, branch_colors_ref]
+    )
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(
+        cwd, common_dir, _LAYOUT_CACHE_DIR_NAME, f"foresta-layout-{digest}.jsonl"
+    )
+
+
+## @brief Tell whether the vine state before live row `row` is snapshotted.
+# @details Snapshots are dense near the top (powers of two) so a run with a few new
+#          commits re-joins the cached layout quickly, then every
+#          `_LAYOUT_CACHE_SNAPSHOT_STRIDE` rows.
+# @param row {int} Zero-based rendered row index.
+# @return {bool} `True` when a snapshot is taken before the row.
+def _layout_snapshot_due(row: int) -> bool:
+    return row & (row - 1) == 0 or row % _LAYOUT_CACHE_SNAPSHOT_STRIDE == 0
+
+
+## @brief Encode the layout cache header line.
+# @param index_offset {int} File offset of the index line.
+# @return {bytes} Header line of `_LAYOUT_CACHE_HEADER_BYTES` bytes.
+def _layout_cache_header(index_offset: int) -> bytes:
+    return (_LAYOUT_CACHE_HEADER % (_LAYOUT_CACHE_VERSION, index_offset)).encode("ascii")
+
+
+## @brief Encode one layout cache row as a JSON line.
+# @param row {list} `[sha, parents, branch, commit, merge, lane]` row.
+# @return {bytes} UTF-8 JSON line.
+def _layout_cache_row(row: list) -> bytes:
+    return (json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+## @brief Return branch-color state without trailing empty assignments.
+# @details Trailing `""` entries behave like missing entries in coloring decisions.
+# @param branch_colors_now {List[str]} Current branch color assignments.
+# @return {List[str]} Normalized copy.
+def _layout_colors_state(branch_colors_now: List[str]) -> List[str]:
+    colors = list(branch_colors_now)
+    while colors and colors[-1] == "":
+        colors.pop()
+    return colors
+
+
+class _LayoutCache:
+    """
+    @brief Persistent per-row vine layout read lazily from one cache file.
+    @details The file holds a fixed-width header line with the index offset, one
+    JSON line per row `[sha, parents, branch, commit, merge, lane]` (each graph
+    entry is `[control string, color assignments]`, or `None` when no line was
+    emitted, and `lane` is the commit's vine lane), then one index line with
+    the row count and the snapshots `[row, offset, sha, vine slots, branch
+    colors]`. Only the index is kept in memory; rows are read on demand from
+    the byte offset of the snapshot where replay starts, which is also where
+    live layout resumes after a mismatch.
+    @satisfies REQ-169
+    """
+
+    def __init__(self, path: str):
+        """
+        @brief Initialize an empty cache bound to `path`.
+        @param path {str} Cache file path.
+        """
+        self.path = path
+        self.file = None
+        self.row_count = 0
+        self.snapshots: Dict[int, list] = {}
+        self.offsets: Dict[int, int] = {}
+        self.snapshot_rows: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> "_LayoutCache":
+        """
+        @brief Open a cache file and read its index, returning an empty cache when missing or invalid.
+        @param path {str} Cache file path.
+        @return {_LayoutCache} Loaded cache; its file stays open until `close`.
+        """
+        cache = cls(path)
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return cache
+        try:
+            header = json.loads(f.readline())
+            if header.get("version") != _LAYOUT_CACHE_VERSION:
+                raise ValueError(path)
+            f.seek(header["index"])
+            index = json.loads(f.readline())
+            row_count = index["rows"]
+            for row, offset, sha, slots, colors in index["snapshots"]:
+                if row < row_count:
+                    cache.snapshots[row] = [slots, colors]
+                    cache.offsets[row] = offset
+                    cache.snapshot_rows[sha] = row
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            f.close()
+            return cls(path)
+        cache.file = f
+        cache.row_count = row_count
+        return cache
+
+    def rows_from(self, row: int):
+        """
+        @brief Yield cached rows in render order starting at snapshot row `row`.
+        @details Seeks before every read so row reads may interleave with
+        `copy_rows` on the same handle; stops early on an unreadable row.
+        @param row {int} Snapshot row index.
+        @return {Iterator[Tuple[bytes, list]]} Raw row line and decoded row pairs.
+        """
+        offset = self.offsets[row]
+        for _ in range(row, self.row_count):
+            try:
+                self.file.seek(offset)
+                line = self.file.readline()
+                decoded = json.loads(line)
+            except (OSError, ValueError):
+                return
+            offset += len(line)
+            yield line, decoded
+
+    def copy_rows(self, target, end: int) -> None:
+        """
+        @brief Copy the row bytes before file offset `end` into `target`.
+        @param target {BinaryIO} Destination positioned after its header line.
+        @param end {int} File offset where the copied prefix stops.
+        """
+        self.file.seek(_LAYOUT_CACHE_HEADER_BYTES)
+        remaining = end - _LAYOUT_CACHE_HEADER_BYTES
+        while remaining > 0:
+            chunk = self.file.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise OSError(f"truncated layout cache: {self.path}")
+            target.write(chunk)
+            remaining -= len(chunk)
+
+    def close(self) -> None:
+        """
+        @brief Close the cache file handle.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class _LayoutCacheWriter:
+    """
+    @brief Stream the rows of one run into a temporary layout cache file.
+    @details While the run replays the loaded entry from row 0 nothing is
+    written; the matching byte prefix is copied from that entry only when the
+    run first differs, so an unchanged history merely refreshes the entry
+    modification time. Writing stops for good once the entry would exceed
+    `_LAYOUT_CACHE_MAX_BYTES`, because pruning would evict it right away.
+    @satisfies REQ-169
+    """
+
+    def __init__(self, cache: _LayoutCache):
+        """
+        @brief Initialize a writer replacing the entry of `cache`.
+        @param cache {_LayoutCache} Loaded entry, also the source of copied prefixes.
+        """
+        self.cache = cache
+        self.temp_path = f"{cache.path}.{os.getpid()}.tmp"
+        self.file = None
+        self.size = _LAYOUT_CACHE_HEADER_BYTES
+        self.rows = 0
+        self.snapshots: List[list] = []
+        self.failed = False
+
+    def snapshot(self, sha: str, state: list) -> None:
+        """
+        @brief Record the vine state before the next row.
+        @param sha {str} Commit of the next row.
+        @param state {list} `[vine slots, branch colors]` pair.
+        """
+        self.snapshots.append([self.rows, self.size, sha] + state)
+
+    def write(self, line: bytes, source_row: int = -1) -> None:
+        """
+        @brief Append one encoded row.
+        @param line {bytes} Row as one JSON line.
+        @param source_row {int} Row index of `line` in the loaded entry, or `-1` for a live row.
+        """
+        if self.failed:
+            return
+        if self.size + len(line) > _LAYOUT_CACHE_MAX_BYTES:
+            self.discard()
+            return
+        if self.file is None:
+            if source_row == self.rows:
+                self.size += len(line)
+                self.rows += 1
+                return
+            if not self._open():
+                return
+        try:
+            self.file.write(line)
+        except OSError:
+            self.discard()
+            return
+        self.size += len(line)
+        self.rows += 1
+
+    def _open(self) -> bool:
+        """
+        @brief Create the temporary file and copy the rows shared with the loaded entry.
+        @return {bool} `True` when the file is ready for appends.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.cache.path), exist_ok=True)
+            self.file = open(self.temp_path, "wb")
+            self.file.write(_layout_cache_header(0))
+            if self.size > _LAYOUT_CACHE_HEADER_BYTES:
+                self.cache.copy_rows(self.file, self.size)
+        except OSError:
+            self.discard()
+            return False
+        return True
+
+    def commit(self) -> None:
+        """
+        @brief Publish the streamed entry atomically, then evict old entries.
+        @details Only refreshes the modification time when every row was replayed
+        unchanged. I/O failures are ignored because the cache is an optimization.
+        """
+        if self.failed:
+            return
+        if self.file is None and self.rows == self.cache.row_count:
+            try:
+                os.utime(self.cache.path)
+            except OSError:
+                pass
+            return
+        if self.file is None and not self._open():
+            return
+        index = {"rows": self.rows, "snapshots": self.snapshots}
+        line = (json.dumps(index, separators=(",", ":")) + "\n").encode("utf-8")
+        if self.size + len(line) > _LAYOUT_CACHE_MAX_BYTES:
+            self.discard()
+            return
+        try:
+            self.file.write(line)
+            self.file.seek(0)
+            self.file.write(_layout_cache_header(self.size))
+            self.file.close()
+            self.file = None
+            os.replace(self.temp_path, self.cache.path)
+        except OSError:
+            self.discard()
+            return
+        _prune_layout_cache(os.path.dirname(self.cache.path))
+
+    def discard(self) -> None:
+        """
+        @brief Stop writing and remove the temporary file.
+        """
+        self.failed = True
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+            try:
+                os.unlink(self.temp_path)
+            except OSError:
+                pass
+
+
+## @brief Evict layout cache files by age and total size.
+# @details Removes entries older than `_LAYOUT_CACHE_MAX_AGE`, then keeps the most
+#          recently written entries whose sizes fit together within
+#          `_LAYOUT_CACHE_MAX_BYTES`; evicted entries do not count toward the total.
+# @satisfies REQ-169
+# @param directory {str} Layout cache directory.
 # @return None.
-def _write_rendered_line(
-    output_stream,
-    line: str,
-    terminal_columns: Optional[int],
-) -> None:
-    if terminal_columns is None:
-        output_stream.write(line)
+def _prune_layout_cache(directory: str) -> None:
+    now = time()
+    entries = []
+    try:
+        names = os.listdir(directory)
+    except OSError:
         return
-    output_stream.write(_truncate_line_to_terminal_width(line, terminal_columns))
+    for name in names:
+        if not (name.startswith("foresta-layout-") and name.endswith((".json", ".jsonl"))):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    entries.sort(reverse=True)
+    total = 0
+    for mtime, size, path in entries:
+        if now - mtime > _LAYOUT_CACHE_MAX_AGE or total + size > _LAYOUT_CACHE_MAX_BYTES:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        else:
+            total += size
+
+
+## @brief Render one cached graph entry, applying its recorded color assignments.
+# @param entry {list} Cached `[control string, color assignments]` pair.
+# @param ctx {_RenderContext} Per-invocation rendering context.
+# @param branch_colors_now {List[str]} Replay color state, mutated in place.
+# @return {str} Rendered graph segment.
+def _vis_replay(entry: list, ctx: _RenderContext, branch_colors_now: List[str]) -> str:
+    assigned = entry[1]
+    if assigned:
+        palette = ctx.branch_colors_ref
+        for k in range(0, len(assigned), 2):
+            slot = assigned[k]
+            while len(branch_colors_now) <= slot:
+                branch_colors_now.append("")
+            branch_colors_now[slot] = palette[assigned[k + 1]]
+    return _vis_render(entry[0], None, ctx, branch_colors_now)
 
 
 # ---------------------------------------------------------------------------
@@ -1237,8 +2140,11 @@ def _write_rendered_line(
 
 ## @brief Stream git log commits, render vine graph lines, and emit final output.
 # @details Opens a `git log` pipe, iterates commits, executes vine_branch/vine_commit/vine_merge
-#          rendering stages, and writes normalized lines to the configured output stream.
-# @satisfies REQ-099, REQ-100, REQ-109
+#          rendering stages through one per-invocation `_RenderContext`, and writes
+#          normalized lines to the configured output stream. With a layout cache, rows
+#          below a verified snapshot are replayed from recorded control strings and
+#          color assignments instead of being laid out again.
+# @satisfies REQ-099, REQ-100, REQ-109, REQ-166, REQ-169
 # @param refs {Dict[str,List[str]]} SHA-to-reference mapping.
 # @param status {str} Working-tree status token set.
 # @param show_status {bool} Enables status markers in HEAD decorations.
@@ -1258,6 +2164,9 @@ def _write_rendered_line(
 # @param branch_colors_now {List[str]} Mutable current branch-color state.
 # @param branch_colors_ref {List[str]} Fixed branch-color palette.
 # @param terminal_columns {Optional[int]} Visible-width budget; `None` disables truncation.
+# @param layout_cache_path {Optional[str]} Persistent layout cache file; `None` disables caching.
+# @param page_size {Optional[int]} First lazy `git log` window in commits; `None` streams unbounded.
+# @param json_output {bool} Emit one JSON Lines record per commit instead of text rows.
 # @return None.
 ## @brief Execute `_process` graph-processing logic for Foresta rendering.
 # @details Executes `_process` as deterministic commit-graph transformation/output logic.
@@ -1280,6 +2189,9 @@ def _write_rendered_line(
 # @param branch_colors_now Input parameter consumed by `_process`.
 # @param branch_colors_ref Input parameter consumed by `_process`.
 # @param terminal_columns Input parameter consumed by `_process`.
+# @param layout_cache_path Input parameter consumed by `_process`.
+# @param page_size Input parameter consumed by `_process`.
+# @param json_output Input parameter consumed by `_process`.
 # @return Result emitted by `_process` according to command contract.
 def _process(
     refs: Dict[str, List[str]],
@@ -1301,162 +2213,206 @@ def _process(
     branch_colors_now: List[str],
     branch_colors_ref: List[str],
     terminal_columns: Optional[int],
+    layout_cache_path: Optional[str] = None,
+    page_size: Optional[int] = None,
+    json_output: bool = False,
 ) -> None:
-    vine: list = []
-    proc = _git_command_output_pipe(
+    vine = _Vine()
+    ctx = _RenderContext(
+        style,
+        reverse_order,
+        graph_symbol_tr,
+        color,
+        branch_colors_now,
+        branch_colors_ref,
+        hash_width=hash_width,
+        date_width=date_width,
+        graph_margin_left=graph_margin_left,
+    )
+    formatter = (_JsonRowFormatter if json_output else _RowFormatter)(
+        refs,
+        status,
+        show_status,
+        color,
+        hash_width,
+        date_width,
+        date_format,
+        graph_margin_left,
+        graph_margin_right,
+        terminal_columns,
+    )
+    log_stream = _LogRecordStream(
         [
             "log",
             "--date-order",
             f"--pretty=format:<%H><%h><%P>{pretty_fmt}",
-        ]
-        + argv
+        ],
+        argv,
+        # The lookahead reads past the last visible commit of a page.
+        page_size + subvine_depth if page_size is not None else None,
     )
 
-    buffer: list = []
-
-    ## @brief Yield streamed git-log lines from subprocess stdout.
-    # @details Wraps `proc.stdout` iteration to keep generator creation local to `_process`.
-    # @return {Iterator[str]} Iterator emitting raw log lines including trailing newlines.
-    def _lines_iter():
-        assert proc.stdout is not None
-        for raw_line in proc.stdout:
-            yield raw_line
+    buffer: deque = deque()
+    records_iter = iter(log_stream)
+
+    cache = _LayoutCache.load(layout_cache_path) if layout_cache_path else None
+    writer = _LayoutCacheWriter(cache) if cache is not None else None
+    cacheable = cache is not None
+    completed = False
+    # Cached row index being replayed (-1 while laying out live), the snapshot row
+    # replay started from, the records replayed since that snapshot, and the
+    # cached rows read ahead for the lookahead check.
+    replay_row = -1
+    replay_base = -1
+    replay_records: List[tuple] = []
+    replay_source = None
+    replay_window: deque = deque()
 
-    line_iter = _lines_iter()
-
-    while True:
-        line, next_lines = _get_line_block(line_iter, buffer, subvine_depth)
-        if line is None:
-            break
-
-        line = line.rstrip("\n").rstrip("\r")
-        # Parse: <SHA><short_sha><parents>rest
-        match = re.match(r"^<(.*?)><(.*?)><(.*?)>(.*)", line, re.DOTALL)
-        if not match:
-            continue
+    try:
+        while True:
+            record, next_sha_list, has_more = _get_record_block(
+                records_iter, buffer, subvine_depth
+            )
+            if not has_more:
+                break
+            if record is None:
+                cacheable = False
+                continue
 
-        sha = match.group(1)
-        _mini_sha = match.group(2)
-        parents_str = match.group(3)
-        msg = match.group(4)
-
-        # Extract next SHAs from lookahead lines
-        next_sha_list: List[Optional[str]] = []
-        for nl in next_lines:
-            if nl is not None:
-                nl = nl.rstrip("\n").rstrip("\r")
-                nm = re.match(r"^<(.*?)>", nl)
-                if nm:
-                    next_sha_list.append(nm.group(1))
-                else:
-                    next_sha_list.append(None)
+            sha, parents, msg = record
+            parts = msg.split("\t", 4)
+            if len(parts) < 5:
+                parts.extend([""] * (5 - len(parts)))
+            commit_hash, time_str, author, auto_refs, subject = parts
+
+            cached_row = None
+            if cache is not None:
+                if replay_row < 0:
+                    j = cache.snapshot_rows.get(sha)
+                    if j is not None and cache.snapshots[j] == [
+                        list(vine),
+                        _layout_colors_state(branch_colors_now),
+                    ]:
+                        replay_row = replay_base = j
+                        replay_records = []
+                        replay_source = cache.rows_from(j)
+                        replay_window.clear()
+                if replay_row >= 0:
+                    if replay_row in cache.snapshots:
+                        replay_base = replay_row
+                        replay_records = []
+                    while len(replay_window) < subvine_depth:
+                        item = next(replay_source, None)
+                        if item is None:
+                            break
+                        replay_window.append(item)
+                    if (
+                        replay_window
+                        and replay_window[0][1][0] == sha
+                        and replay_window[0][1][1] == " ".join(parents)
+                        and next_sha_list
+                        == [r[0] for _, r in islice(replay_window, 1, None)]
+                    ):
+                        cached_line, cached_row = replay_window.popleft()
+                    else:
+                        # History diverged: rebuild live state from the last snapshot.
+                        slots, colors = cache.snapshots[replay_base]
+                        vine = _Vine(list(slots))
+                        branch_colors_now[:] = colors
+                        for r_sha, r_parents, r_next in replay_records:
+                            _vine_branch(vine, r_sha, ctx)
+                            _update_branch_colors(
+                                _vis_commit(_vine_commit(vine, r_sha, r_parents)),
+                                branch_colors_now,
+                                branch_colors_ref,
+                            )
+                            _vine_merge(vine, r_sha, r_next, list(r_parents), ctx)
+                        replay_row = -1
+                        replay_source = None
+                        replay_window.clear()
+
+            if writer is not None and not writer.failed:
+                if cached_row is not None:
+                    if replay_row in cache.snapshots:
+                        writer.snapshot(sha, cache.snapshots[replay_row])
+                elif _layout_snapshot_due(writer.rows):
+                    writer.snapshot(sha, [list(vine), _layout_colors_state(branch_colors_now)])
+
+            if cached_row is not None:
+                replay_records.append((sha, parents, next_sha_list))
+                writer.write(cached_line, replay_row)
+                replay_row += 1
+                branch_entry, commit_entry, merge_entry = cached_row[2:5]
+                branch_line = (
+                    ctx.graph_prefix + _vis_replay(branch_entry, ctx, branch_colors_now) + "\n"
+                    if branch_entry
+                    else None
+                )
+                lane = cached_row[5]
+                vis = _vis_replay(commit_entry, ctx, branch_colors_now)
+                commit_colors = list(branch_colors_now) if json_output else None
+                merge_line = (
+                    ctx.graph_prefix + _vis_replay(merge_entry, ctx, branch_colors_now) + "\n"
+                    if merge_entry
+                    else None
+                )
             else:
-                next_sha_list.append(None)
-
-        parents = parents_str.split() if parents_str.strip() else []
-        parts = msg.split("\t", 4)
-        if len(parts) < 5:
-            parts.extend([""] * (5 - len(parts)))
-        commit_hash, time_str, author, auto_refs, subject = parts
-
-        try:
-            timestamp = int(time_str)
-            date_str = strftime(date_format, localtime(timestamp))
-        except (ValueError, OSError):
-            date_str = time_str
-
-        # vine_branch
-        branch_line = _vine_branch(
-            vine,
-            sha,
-            color,
-            hash_width,
-            date_width,
-            graph_margin_left,
-            style,
-            reverse_order,
-            graph_symbol_tr,
-            branch_colors_now,
-            branch_colors_ref,
-        )
-        if branch_line:
-            _write_rendered_line(output_stream, branch_line, terminal_columns)
-
-        # Print hash and date prefix
-        hash_color = color.get("hash", "")
-        date_color = color.get("date", "")
-        default_color = color.get("default", "")
-        author_color = color.get("author", "")
-        tag_color = color.get("tag", "")
-
-        prefix = (
-            f"{hash_color}"
-            f"{commit_hash:<{hash_width}.{hash_width}s} "
-            f"{date_color}"
-            f"{date_str:<{date_width}s}"
-            f"{'':>{graph_margin_left}s}"
-            f"{default_color}"
-        )
-        # vine_commit
-        commit_str = _vine_commit(vine, sha, parents)
-        vis = _vis_post(
-            _vis_commit(commit_str),
-            None,
-            style,
-            reverse_order,
-            graph_symbol_tr,
-            color,
-            branch_colors_now,
-            branch_colors_ref,
-        )
-        author_segment = f"{author_color}{author}{default_color}"
-
-        # Annotate refs
-        if sha in refs:
-            ref_list = refs[sha]
-            if show_status and "HEAD" in ref_list:
-                # Inject status after HEAD in auto_refs
-                auto_refs = re.sub(
-                    r"([^/])HEAD",
-                    lambda m: m.group(0) + status,
-                    auto_refs,
+                trace = ctx.trace = [] if writer is not None and not writer.failed else None
+                # vine_branch
+                branch_line = _vine_branch(vine, sha, ctx)
+                branch_entry = trace[-1] if trace and branch_line else None
+                # vine_commit
+                commit_ctrl = _vis_commit(_vine_commit(vine, sha, parents))
+                # Branch colors are tracked per even vine slot.
+                lane = vine.lanes(sha)[0] // 2
+                vis = _vis_post(commit_ctrl, None, ctx)
+                commit_colors = list(branch_colors_now) if json_output else None
+                commit_entry = trace[-1] if trace else None
+                # vine_merge
+                merge_line = _vine_merge(
+                    vine,
+                    sha,
+                    next_sha_list,
+                    list(parents),
+                    ctx,
                 )
-            if any(r.startswith("refs/tags/") for r in ref_list):
-                if tag_color:
-                    auto_refs = re.sub(
-                        r"\x1b\[\d;\d\dm(?=tag: )",
-                        tag_color,
-                        auto_refs,
+                if trace is not None:
+                    merge_entry = trace[-1] if merge_line else None
+                    writer.write(
+                        _layout_cache_row(
+                            [sha, " ".join(parents), branch_entry, commit_entry, merge_entry, lane]
+                        )
                     )
-
-        rendered_commit_line = (
-            f"{prefix}{vis}{' ' * graph_margin_right}"
-            f"{author_segment}{auto_refs} {subject}\n"
-        )
-        _write_rendered_line(output_stream, rendered_commit_line, terminal_columns)
-
-        # vine_merge
-        merge_line = _vine_merge(
-            vine,
-            sha,
-            next_sha_list,
-            list(parents),
-            color,
-            hash_width,
-            date_width,
-            graph_margin_left,
-            style,
-            reverse_order,
-            graph_symbol_tr,
-            branch_colors_now,
-            branch_colors_ref,
-        )
-        if merge_line:
-            _write_rendered_line(output_stream, merge_line, terminal_columns)
-
-    if proc.stdout is not None:
-        proc.stdout.close()
-    proc.wait()
+                ctx.trace = None
+
+            row = (
+                sha,
+                commit_hash,
+                time_str,
+                author,
+                auto_refs,
+                subject,
+                branch_line,
+                vis,
+                merge_line,
+            )
+            if json_output:
+                row += (parents, lane, commit_colors)
+            output_stream.write(formatter.format_row(row))
+        completed = True
+    finally:
+        log_stream.close()
+        if writer is not None:
+            if (
+                completed
+                and cacheable
+                and log_stream.returncode == 0
+                and writer.rows >= _LAYOUT_CACHE_MIN_ROWS
+            ):
+                writer.commit()
+            else:
+                writer.discard()
+            cache.close()
 
 
 # ---------------------------------------------------------------------------
@@ -1474,10 +2430,6 @@ def run(extra_args: Optional[List[str]] = None) -> None:
     @param extra_args {Optional[List[str]]} CLI arguments from the dispatcher.
     @return None. Output written to stdout.
     """
-    # Ignore SIGPIPE
-    if hasattr(signal, "SIGPIPE"):
-        signal.signal(signal.SIGPIPE, signal.SIG_DFL)  # pyright: ignore[reportAttributeAccessIssue]
-
     args = list(extra_args) if extra_args else []
 
     # Mutable config state
@@ -1485,6 +2437,8 @@ def run(extra_args: Optional[List[str]] = None) -> None:
     show_status = _SHOW_STATUS
     reverse_order = _REVERSE_ORDER
     wrap_lines = False
+    page_size: Optional[int] = None
+    json_output = False
     style = _STYLE
     subvine_depth = _SUBVINE_DEPTH
     hash_min_width = _HASH_MIN_WIDTH
@@ -1513,6 +2467,15 @@ def run(extra_args: Optional[List[str]] = None) -> None:
             reverse_order = True
         elif arg == "--wrap":
             wrap_lines = True
+        elif arg == "--json":
+            json_output = True
+        elif arg == "--page":
+            page_size = _resolve_page_size()
+        elif arg.startswith("--page="):
+            try:
+                page_size = max(1, int(arg.split("=", 1)[1]))
+            except ValueError:
+                pass
         elif arg.startswith("--pretty=") or arg.startswith("--format="):
             pass  # ignore
         elif arg.startswith("--pretty") and i + 1 < len(args) and not args[i + 1].startswith("-"):
@@ -1558,6 +2521,18 @@ def run(extra_args: Optional[List[str]] = None) -> None:
             passthrough.append(arg)
         i += 1
 
+    # Paged mode lets a closed pipe surface as BrokenPipeError so git can be stopped;
+    # otherwise exit on SIGPIPE
+    if page_size is not None and _has_log_limit(passthrough):
+        page_size = None
+    if page_size is None and hasattr(signal, "SIGPIPE"):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)  # pyright: ignore[reportAttributeAccessIssue]
+
+    # JSON Lines carry plain text and full-width graph glyphs
+    if json_output:
+        color = {}
+        wrap_lines = True
+
     # Build translation function
     graph_symbol_tr = _trgen(sym_commit, sym_merge, sym_overpass, sym_root, sym_tip)
 
@@ -1628,12 +2603,17 @@ def run(extra_args: Optional[List[str]] = None) -> None:
             branch_colors_now=branch_colors_now,
             branch_colors_ref=branch_colors_ref,
             terminal_columns=terminal_columns,
+            layout_cache_path=_layout_cache_path(
+                passthrough, subvine_depth, branch_colors_ref
+            ),
+            page_size=page_size,
+            json_output=json_output,
         )
     except BrokenPipeError:
-        pass
+        _silence_closed_stdout()
     finally:
         if reverse_order and isinstance(output, _ReverseOutput):
             try:
                 output.close()
             except BrokenPipeError:
-                pass
+                _silence_closed_stdout()
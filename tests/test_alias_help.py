@@ -161,6 +161,7 @@ class AliasHelpTest(unittest.TestCase):
                 )
                 self.assertIsNotNone(kwargs.get("repo_root"))
                 self.assertTrue(kwargs.get("ignore_idle_cache"))
+                self.assertFalse(kwargs.get("background_refresh"))
 
     def test_upgrade_flag_invokes_upgrade_self(self):
         with mock.patch.object(core, "upgrade_self") as upgrade_self:
@@ -183,8 +184,9 @@ class AliasHelpTest(unittest.TestCase):
             repo_root=None,
             timeout_seconds: float = 1.0,
             ignore_idle_cache: bool = False,
+            background_refresh: bool = False,
         ):
-            del repo_root, timeout_seconds, ignore_idle_cache
+            del repo_root, timeout_seconds, ignore_idle_cache, background_refresh
             events.append("update")
 
         def _record_help():
@@ -213,3 +215,4 @@ class AliasHelpTest(unittest.TestCase):
             core.VERSION_CHECK_TIMEOUT_SECONDS,
         )
         self.assertIsNotNone(kwargs.get("repo_root"))
+        self.assertTrue(kwargs.get("background_refresh"))
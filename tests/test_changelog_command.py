@@ -11,6 +11,12 @@ from git_alias import core
 class ChangelogCommandTest(unittest.TestCase):
     def setUp(self):
         core.CONFIG.update(core.DEFAULT_CONFIG)
+        range_patcher = mock.patch.object(core, "git_log_subjects_by_range", return_value={})
+        self.git_log_subjects_by_range = range_patcher.start()
+        self.addCleanup(range_patcher.stop)
+        cache_patcher = mock.patch.object(core, "_changelog_cache_path", return_value=None)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
 
     def test_creates_file_when_missing(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -124,7 +130,7 @@ class ChangelogCommandTest(unittest.TestCase):
         ]
         calls = []
 
-        def record_range(_root, _title, _date, rev_range, expected_version=None):
+        def record_range(_root, _title, _date, rev_range, expected_version=None, subjects=None):
             calls.append(rev_range)
             return f"sec-{rev_range}"
 
@@ -158,7 +164,7 @@ class ChangelogCommandTest(unittest.TestCase):
         ]
         calls = []
 
-        def record_range(_root, _title, _date, rev_range, expected_version=None):
+        def record_range(_root, _title, _date, rev_range, expected_version=None, subjects=None):
             calls.append(rev_range)
             return "sec"
 
@@ -181,7 +187,7 @@ class ChangelogCommandTest(unittest.TestCase):
         ]
         calls = []
 
-        def record_range(_root, _title, _date, rev_range, expected_version=None):
+        def record_range(_root, _title, _date, rev_range, expected_version=None, subjects=None):
             calls.append(rev_range)
             return f"sec-{rev_range}"
 
@@ -377,6 +383,32 @@ class ChangelogCommandTest(unittest.TestCase):
             check=False,
         )
 
+    def test_generate_document_reads_all_ranges_with_one_history_walk(self):
+        tags = [
+            core.TagInfo(name="v0.1.0", iso_date="2024-01-01", object_name="a"),
+            core.TagInfo(name="v0.1.1", iso_date="2024-02-01", object_name="b"),
+            core.TagInfo(name="v0.2.0", iso_date="2024-03-01", object_name="c"),
+            core.TagInfo(name="v0.2.3", iso_date="2024-04-01", object_name="d"),
+        ]
+        self.git_log_subjects_by_range.return_value = {
+            ("v0.2.0", "v0.2.3"): ["fix: patch"],
+            (None, "v0.1.0"): ["new: first"],
+            ("v0.1.0", "v0.2.0"): ["new: second"],
+        }
+        with mock.patch.object(core, "list_tags_sorted_by_date", return_value=tags), mock.patch.object(
+            core, "_canonical_origin_base", return_value=None
+        ), mock.patch.object(core, "git_log_subjects") as git_log_subjects:
+            document = core.generate_changelog_document(
+                Path("/tmp"), include_patch=True, disable_history=True
+            )
+        git_log_subjects.assert_not_called()
+        self.git_log_subjects_by_range.assert_called_once_with(
+            Path("/tmp"),
+            [("v0.2.0", "v0.2.3"), (None, "v0.1.0"), ("v0.1.0", "v0.2.0")],
+        )
+        self.assertLess(document.index("- patch"), document.index("- second"))
+        self.assertLess(document.index("- second"), document.index("- first"))
+
     def test_generate_section_renders_implementations_header_with_icon(self):
         with mock.patch.object(
             core,
@@ -404,6 +436,169 @@ class ChangelogCommandTest(unittest.TestCase):
         self.assertIsNone(section)
 
 
+class GitLogSubjectsByRangeTest(unittest.TestCase):
+    def _walk_payload(self, rows):
+        return "\n".join(core.DELIM.join(row) + core.RECORD for row in rows)
+
+    def test_partitions_one_walk_into_tag_ranges(self):
+        # c1 <- c2 (v0.1.0) <- m3 (merge of c2 and s1) <- c4 (v0.2.0); s1 branches from c1.
+        payload = self._walk_payload(
+            [
+                ["c4", "m3", "40", "tag: v0.2.0", "new: four"],
+                ["m3", "c2 s1", "30", "", "Merge branch side"],
+                ["s1", "c1", "25", "", "fix: side"],
+                ["c2", "c1", "20", "tag: v0.1.0, tag: v0.1.0-rc", "docs: two"],
+                ["c1", "", "10", "", "new: one"],
+            ]
+        )
+        with mock.patch.object(core, "run_git_text", return_value=payload) as run_git_text:
+            ranges = core.git_log_subjects_by_range(
+                Path("/tmp"), [(None, "v0.1.0"), ("v0.1.0", "v0.2.0"), ("v9.9.9", "v0.2.0")]
+            )
+        run_git_text.assert_called_once_with(
+            [
+                "log",
+                "--tags",
+                "--decorate=short",
+                "--decorate-refs=refs/tags/",
+                f"--pretty=format:%H{core.DELIM}%P{core.DELIM}%ct{core.DELIM}%D{core.DELIM}%B{core.RECORD}",
+            ],
+            cwd=Path("/tmp"),
+            check=False,
+        )
+        self.assertEqual(ranges[(None, "v0.1.0")], ["docs: two", "new: one"])
+        self.assertEqual(ranges[("v0.1.0", "v0.2.0")], ["new: four", "fix: side"])
+        self.assertIsNone(ranges[("v9.9.9", "v0.2.0")])
+
+    def test_unresolved_ranges_fall_back_to_per_range_log(self):
+        payload = self._walk_payload([["c1", "", "10", "tag: v0.1.0", "new: one"]])
+        with mock.patch.object(core, "run_git_text", return_value=payload):
+            ranges = core.git_log_subjects_by_range(
+                Path("/tmp"), [(None, "v0.1.0"), ("v0.1.0", "v0.2.0")]
+            )
+        self.assertEqual(ranges[(None, "v0.1.0")], ["new: one"])
+        self.assertIsNone(ranges[("v0.1.0", "v0.2.0")])
+        with mock.patch.object(
+            core, "git_log_subjects", return_value=["fix: late"]
+        ) as git_log_subjects:
+            section = core.generate_section_for_range(
+                Path("/tmp"),
+                "0.2.0",
+                "2024-02-01",
+                "v0.1.0..v0.2.0",
+                subjects=ranges[("v0.1.0", "v0.2.0")],
+            )
+        git_log_subjects.assert_called_once_with(Path("/tmp"), "v0.1.0..v0.2.0")
+        self.assertIn("- late", section)
+
+    def test_replays_date_order_with_insertion_ties(self):
+        # Two branches with equal commit dates: git pops ties in insertion order.
+        payload = self._walk_payload(
+            [
+                ["m", "a2 b2", "50", "tag: v0.2.0", "Merge"],
+                ["b2", "b1", "40", "", "fix: b2"],
+                ["a2", "a1", "40", "", "fix: a2"],
+                ["a1", "r", "30", "", "fix: a1"],
+                ["b1", "r", "30", "", "fix: b1"],
+                ["r", "", "10", "tag: v0.1.0", "new: root"],
+            ]
+        )
+        with mock.patch.object(core, "run_git_text", return_value=payload):
+            ranges = core.git_log_subjects_by_range(Path("/tmp"), [("v0.1.0", "v0.2.0")])
+        self.assertEqual(
+            ranges[("v0.1.0", "v0.2.0")],
+            ["fix: a2", "fix: b2", "fix: a1", "fix: b1"],
+        )
+
+
+class ChangelogSectionCacheTest(unittest.TestCase):
+    def setUp(self):
+        core.CONFIG.update(core.DEFAULT_CONFIG)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache_path = Path(self.tmpdir.name) / "git-alias" / core.CHANGELOG_CACHE_FILE_NAME
+
+    def _generate(self, tags, sections):
+        with mock.patch.object(core, "list_tags_sorted_by_date", return_value=tags), mock.patch.object(
+            core, "_canonical_origin_base", return_value=None
+        ), mock.patch.object(
+            core, "_changelog_cache_path", return_value=self.cache_path
+        ), mock.patch.object(
+            core, "git_log_subjects_by_range", return_value={}
+        ) as by_range, mock.patch.object(
+            core, "generate_section_for_range", side_effect=sections
+        ) as generate_section:
+            document = core.generate_changelog_document(
+                Path("/tmp"), include_patch=False, disable_history=True
+            )
+        return document, by_range, generate_section
+
+    def test_reuses_cached_sections_keyed_by_tag_objects(self):
+        tags = [
+            core.TagInfo(name="v0.1.0", iso_date="2024-01-01", object_name="a"),
+            core.TagInfo(name="v0.2.0", iso_date="2024-02-01", object_name="b"),
+        ]
+        first, by_range, _ = self._generate(
+            tags,
+            ["## 0.1.0 - 2024-01-01\n- one\n", "## 0.2.0 - 2024-02-01\n- two\n"],
+        )
+        by_range.assert_called_once_with(Path("/tmp"), [(None, "v0.1.0"), ("v0.1.0", "v0.2.0")])
+        second, by_range, generate_section = self._generate(tags, [])
+        by_range.assert_not_called()
+        generate_section.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_recomputes_only_ranges_with_changed_tag_objects(self):
+        tags = [
+            core.TagInfo(name="v0.1.0", iso_date="2024-01-01", object_name="a"),
+            core.TagInfo(name="v0.2.0", iso_date="2024-02-01", object_name="b"),
+        ]
+        self._generate(
+            tags,
+            ["## 0.1.0 - 2024-01-01\n- one\n", "## 0.2.0 - 2024-02-01\n- two\n"],
+        )
+        retagged = [
+            tags[0],
+            core.TagInfo(name="v0.2.0", iso_date="2024-02-01", object_name="b2"),
+        ]
+        document, by_range, generate_section = self._generate(
+            retagged, ["## 0.2.0 - 2024-02-01\n- rewritten\n"]
+        )
+        by_range.assert_called_once_with(Path("/tmp"), [("v0.1.0", "v0.2.0")])
+        self.assertEqual(1, generate_section.call_count)
+        self.assertIn("- rewritten", document)
+        self.assertIn("- one", document)
+
+    def test_renamed_tag_on_same_commit_misses_cache(self):
+        tags = [
+            core.TagInfo(name="v0.1.0", iso_date="2024-01-01", object_name="a"),
+            core.TagInfo(name="v0.2.0", iso_date="2024-02-01", object_name="b"),
+        ]
+        self._generate(
+            tags,
+            ["## 0.1.0 - 2024-01-01\n- one\n", "## 0.2.0 - 2024-02-01\n- two\n"],
+        )
+        renamed = [
+            tags[0],
+            core.TagInfo(name="v0.3.0", iso_date="2024-02-01", object_name="b"),
+        ]
+        document, by_range, _ = self._generate(
+            renamed, ["## 0.3.0 - 2024-02-01\n- three\n"]
+        )
+        by_range.assert_called_once_with(Path("/tmp"), [("v0.1.0", "v0.3.0")])
+        self.assertIn("- three", document)
+        self.assertNotIn("- two", document)
+        stored = core._load_changelog_cache(self.cache_path)
+        self.assertEqual(2, len(stored))
+
+    def test_ignores_unreadable_or_foreign_cache_payloads(self):
+        self.cache_path.parent.mkdir(parents=True)
+        self.cache_path.write_text("not json", encoding="utf-8")
+        self.assertEqual({}, core._load_changelog_cache(self.cache_path))
+        self.cache_path.write_text('{"format": -1, "sections": {"k": "v"}}', encoding="utf-8")
+        self.assertEqual({}, core._load_changelog_cache(self.cache_path))
+
+
 class MinorReleaseTagPredicateTest(unittest.TestCase):
     def test_minor_release_tags(self):
         for tag in ("v0.1.0", "0.1.0", "v0.2.0", "v1.0.0", "v1.1.0", "v2.3.0"):
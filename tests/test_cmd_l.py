@@ -119,6 +119,28 @@ class TestForestaTerminalWidth(unittest.TestCase):
         visible = re.sub(r"\x1b\[[0-9;]*m", "", truncated.rstrip("\n"))
         self.assertEqual(visible, "abcd")
 
+    def test_truncate_line_returns_fitting_line_unchanged(self):
+        rendered = "\033[0;31m│ ●\033[0m abc\033[0m\n"
+        self.assertIs(foresta._truncate_line_to_terminal_width(rendered, 7), rendered)
+
+    def test_truncate_line_counts_east_asian_wide_columns(self):
+        """
+        @brief Wide glyphs MUST consume two columns and never be split.
+        @satisfies REQ-168
+        """
+        self.assertEqual(
+            foresta._truncate_line_to_terminal_width("ab漢字cd\n", 5),
+            "ab漢\n",
+        )
+        self.assertEqual(
+            foresta._truncate_line_to_terminal_width("\033[1m漢字漢\033[0m\n", 5),
+            "\033[1m漢字" + foresta._COLOR["default"] + "\n",
+        )
+        self.assertEqual(
+            foresta._truncate_line_to_terminal_width("e\u0301e\u0301x\n", 2),
+            "e\u0301e\u0301\n",
+        )
+
     @patch("git_alias.foresta._process")
     @patch("git_alias.foresta._get_refs")
     @patch("git_alias.foresta._git_command")
@@ -278,27 +300,65 @@ class TestVineCommit(unittest.TestCase):
     """
 
     def test_tip_placement(self):
-        vine = []
+        vine = foresta._Vine()
         result = foresta._vine_commit(vine, "abc123", ["parent1"])
         self.assertIn("t", result)
         self.assertIn("abc123", vine)
 
     def test_existing_in_vine(self):
-        vine = ["abc123", None]
+        vine = foresta._Vine(["abc123", None])
         result = foresta._vine_commit(vine, "abc123", ["parent1"])
         self.assertIn("C", result)
 
     def test_root_commit(self):
-        vine = ["abc123"]
+        vine = foresta._Vine(["abc123"])
         result = foresta._vine_commit(vine, "abc123", [])
         self.assertIn("r", result)
 
     def test_merge_commit(self):
-        vine = ["abc123"]
+        vine = foresta._Vine(["abc123"])
         result = foresta._vine_commit(vine, "abc123", ["p1", "p2"])
         self.assertIn("M", result)
 
 
+class TestVineLanes(unittest.TestCase):
+    """
+    @brief Level 0: Test lane index and row buffer kept in sync with vine columns.
+    @satisfies REQ-165
+    """
+
+    def test_lane_index_and_row_buffer_follow_assignments(self):
+        vine = foresta._Vine(["a", None, "b", None, "a"])
+        self.assertEqual(vine.lanes("a"), [0, 4])
+        self.assertEqual(bytes(vine.row), b"I I I")
+        vine[0] = None
+        vine[1] = "b"
+        self.assertEqual(vine.lanes("a"), [4])
+        self.assertEqual(vine.lanes("b"), [1, 2])
+        self.assertEqual(bytes(vine.row), b" II I")
+        vine[4] = None
+        foresta._remove_trailing_blanks(vine)
+        self.assertEqual(list(vine), [None, "b", "b"])
+        self.assertNotIn("a", vine)
+        self.assertEqual(bytes(vine.row), b" II")
+
+    def test_branch_collapses_duplicate_lanes(self):
+        vine = foresta._Vine(["x", None, "y", None, "x"])
+        ctx = foresta._RenderContext(1, False, lambda s: s, {}, [], [])
+        line = foresta._vine_branch(vine, "x", ctx)
+        self.assertIsNotNone(line)
+        self.assertEqual(list(vine), ["x", None, "y"])
+        self.assertEqual(vine.lanes("x"), [0])
+
+    def test_merge_assigns_parent_lanes(self):
+        vine = foresta._Vine(["m"])
+        ctx = foresta._RenderContext(1, False, lambda s: s, {}, [], [])
+        line = foresta._vine_merge(vine, "m", [], ["p1", "p2"], ctx)
+        self.assertIsNotNone(line)
+        self.assertEqual(list(vine), ["p1", None, "p2"])
+        self.assertEqual(bytes(vine.row), b"I I")
+
+
 class TestVisCommit(unittest.TestCase):
     """
     @brief Level 0: Test vis_commit control string processing.
@@ -336,33 +396,125 @@ class TestVisFan(unittest.TestCase):
         @return None.
         """
         graph_symbol_tr = foresta._trgen("\u25cf", "\u25ce", "\u2550", "\u25a0", "\u25cb")
+        ctx = foresta._RenderContext(1, False, graph_symbol_tr, {}, [], [])
 
         merge_vis = foresta._vis_xfrm(
             foresta._vis_fan("S s  ", "merge"),
             False,
-            1,
-            False,
-            graph_symbol_tr,
+            ctx,
         )
         self.assertEqual(merge_vis, "\u251c\u2500\u2510  ")
 
         branch_vis = foresta._vis_xfrm(
             foresta._vis_fan("S sDs", "branch"),
             False,
-            1,
-            False,
-            graph_symbol_tr,
+            ctx,
         )
         self.assertEqual(branch_vis, "\u251c\u2500\u2534\u2500\u2518")
 
         prefixed_merge_vis = foresta._vis_xfrm(
             foresta._vis_fan("I S s    ", "merge"),
             False,
+            ctx,
+        )
+        self.assertEqual(prefixed_merge_vis, "\u2502 \u251c\u2500\u2510    ")
+
+
+class TestRenderContext(unittest.TestCase):
+    """
+    @brief Level 0: Test per-invocation render context tables.
+    @satisfies REQ-166
+    """
+
+    def test_composed_table_matches_staged_pipeline(self):
+        graph_symbol_tr = foresta._trgen("M", "t", "O", "■", "xx")
+        row = "ABCDIKMOefgmrtxyz *"
+        for style in (1, 2, 10, 15, 99):
+            for reverse_order in (False, True):
+                staged = row.translate(
+                    foresta._REVERSE_FAN_TR if reverse_order else {}
+                )
+                staged = graph_symbol_tr(
+                    staged.translate(foresta._STYLE_MAPS.get(style) or {})
+                )
+                ctx = foresta._RenderContext(
+                    style, reverse_order, graph_symbol_tr, {}, [], []
+                )
+                self.assertEqual(foresta._vis_xfrm(row, False, ctx), staged)
+
+    def test_vis_post_does_not_compile_per_row(self):
+        ctx = foresta._RenderContext(
             1,
             False,
-            graph_symbol_tr,
+            foresta._trgen("●", "◎", "═", "■", "○"),
+            dict(foresta._COLOR),
+            [],
+            list(foresta._BRANCH_COLORS_REF),
         )
-        self.assertEqual(prefixed_merge_vis, "\u2502 \u251c\u2500\u2510    ")
+        with patch("git_alias.foresta.re.compile") as mock_compile:
+            line = foresta._vis_post("I C", None, ctx)
+        mock_compile.assert_not_called()
+        self.assertIn("●", line)
+
+
+@unittest.skipUnless(
+    os.environ.get("GIT_ALIAS_BENCHMARK"), "set GIT_ALIAS_BENCHMARK=1 to run"
+)
+class TestRenderBenchmark(unittest.TestCase):
+    """
+    @brief Level 2: Micro-benchmark foresta rendering over a synthetic 100k-row history.
+    @details Opt-in via `GIT_ALIAS_BENCHMARK=1`; prints rendered rows per second.
+    @satisfies REQ-166
+    """
+
+    def test_render_100k_rows(self):
+        import io
+        import time
+
+        rows = 100_000
+        lines = []
+        for i in range(rows):
+            parents = [f"{i + 1:040x}"] if i + 1 < rows else []
+            if i % 20 == 0 and i + 5 < rows:
+                parents.append(f"{i + 5:040x}")
+            lines.append(
+                f"<{i:040x}><{i:07x}><{' '.join(parents)}>"
+                f"{i:07x}\t{1700000000 - i}\tdev\t\tsubject {i}\n"
+            )
+
+        class _Proc:
+            stdout = io.StringIO("".join(lines))
+
+            def wait(self):
+                return 0
+
+        output = io.StringIO()
+        with patch("git_alias.foresta._git_command_output_pipe", return_value=_Proc()):
+            started = time.perf_counter()
+            foresta._process(
+                refs={},
+                status="",
+                show_status=False,
+                pretty_fmt="",
+                argv=[],
+                color=dict(foresta._COLOR),
+                hash_width=7,
+                date_width=foresta._DATE_WIDTH,
+                date_format=foresta._DATE_FORMAT,
+                graph_margin_left=foresta._GRAPH_MARGIN_LEFT,
+                graph_margin_right=foresta._GRAPH_MARGIN_RIGHT,
+                subvine_depth=foresta._SUBVINE_DEPTH + 1,
+                style=foresta._STYLE,
+                reverse_order=False,
+                graph_symbol_tr=foresta._trgen("●", "◎", "═", "■", "○"),
+                output_stream=output,
+                branch_colors_now=[],
+                branch_colors_ref=list(foresta._BRANCH_COLORS_REF),
+                terminal_columns=None,
+            )
+            elapsed = time.perf_counter() - started
+        self.assertGreaterEqual(output.getvalue().count("\n"), rows)
+        print(f"\nforesta render: {rows} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s)")
 
 
 class TestGetStatus(unittest.TestCase):
@@ -379,23 +531,54 @@ class TestGetStatus(unittest.TestCase):
 
     @patch("git_alias.foresta._git_command")
     def test_dirty_unstaged(self, mock_cmd):
-        def side_effect(args):
-            if args == ["diff", "--shortstat"]:
-                return " 1 file changed"
-            return ""
-        mock_cmd.side_effect = side_effect
+        mock_cmd.return_value = "1 .M N... 100644 100644 100644 a b f"
         result = foresta._get_status("/tmp/fake/.git", "/tmp/fake/.git")
-        self.assertIn("*", result)
+        self.assertEqual(result, " *")
 
     @patch("git_alias.foresta._git_command")
     def test_dirty_staged(self, mock_cmd):
-        def side_effect(args):
-            if args == ["diff", "--shortstat", "--cached"]:
-                return " 1 file changed"
-            return ""
-        mock_cmd.side_effect = side_effect
+        mock_cmd.return_value = "1 A. N... 000000 100644 100644 a b f"
+        result = foresta._get_status("/tmp/fake/.git", "/tmp/fake/.git")
+        self.assertEqual(result, " +")
+
+    @patch("git_alias.foresta._git_command")
+    def test_all_flags_from_single_status_call(self, mock_cmd):
+        mock_cmd.return_value = "\n".join(
+            [
+                "# stash 2",
+                "1 AM N... 000000 100644 100644 a b f",
+                "? untracked",
+            ]
+        )
         result = foresta._get_status("/tmp/fake/.git", "/tmp/fake/.git")
-        self.assertIn("+", result)
+        self.assertEqual(result, " *+$%")
+        mock_cmd.assert_called_once_with(
+            [
+                "--no-optional-locks",
+                "status",
+                "--porcelain=v2",
+                "--show-stash",
+                "--no-renames",
+                "--untracked-files=normal",
+            ]
+        )
+
+    def test_untracked_marker_ignores_show_untracked_files_config(self):
+        git_command = foresta._git_command
+        with tempfile.TemporaryDirectory() as tmpdir:
+            git_command(["init", "-q"], cwd=tmpdir)
+            git_command(["config", "status.showUntrackedFiles", "no"], cwd=tmpdir)
+            with open(os.path.join(tmpdir, "new.txt"), "w") as f:
+                f.write("x\n")
+            with patch(
+                "git_alias.foresta._git_command",
+                side_effect=lambda args: git_command(args, cwd=tmpdir),
+            ):
+                result = foresta._get_status(
+                    os.path.join(tmpdir, ".git"), os.path.join(tmpdir, ".git")
+                )
+            self.assertEqual(result, " %")
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, ".git", "index.lock")))
 
     @patch("git_alias.foresta._git_command")
     def test_mid_flow_merging(self, mock_cmd):
@@ -408,9 +591,164 @@ class TestGetStatus(unittest.TestCase):
             self.assertIn("|MERGING", result)
 
 
+class TestGetRefs(unittest.TestCase):
+    """
+    @brief Level 1: Test bulk ref collection with mocked git commands.
+    @satisfies REQ-108, REQ-157
+    """
+
+    @patch("git_alias.foresta._git_command")
+    def test_annotated_tags_are_peeled_from_single_show_ref(self, mock_cmd):
+        show_ref = "\n".join(
+            [
+                "c1 refs/heads/master",
+                "t1 refs/tags/v1.0.0",
+                "c1 refs/tags/v1.0.0^{}",
+                "c2 refs/tags/light",
+            ]
+        )
+
+        def side_effect(args):
+            if args == ["show-ref", "--dereference"]:
+                return show_ref
+            if args == ["rev-parse", "--git-dir"]:
+                return "/nonexistent/.git"
+            if args == ["rev-parse", "HEAD"]:
+                return "c1"
+            raise AssertionError(f"unexpected git call: {args}")
+
+        mock_cmd.side_effect = side_effect
+        refs = foresta._get_refs()
+        self.assertEqual(refs["c1"], ["HEAD", "refs/heads/master", "refs/tags/v1.0.0"])
+        self.assertEqual(refs["t1"], ["refs/tags/v1.0.0"])
+        self.assertEqual(refs["c2"], ["refs/tags/light"])
+        self.assertEqual(mock_cmd.call_count, 3)
+
+
+class TestRecordStream(unittest.TestCase):
+    """
+    @brief Level 0: Test parsed git-log record stream and deque lookahead.
+    @satisfies REQ-164
+    """
+
+    def test_parse_log_line(self):
+        record = foresta._parse_log_line("<abc><p><p1 p2>msg\ttail\n")
+        self.assertEqual(record, ("abc", ["p1", "p2"], "msg\ttail"))
+        self.assertIsNone(foresta._parse_log_line("garbage\n"))
+
+    def test_record_block_lookahead_and_exhaustion(self):
+        from collections import deque
+
+        records = iter([("a", [], ""), None, ("c", [], ""), ("d", [], "")])
+        buffer = deque()
+        current, lookahead, has_more = foresta._get_record_block(records, buffer, 3)
+        self.assertEqual(current, ("a", [], ""))
+        self.assertEqual(lookahead, [None, "c"])
+        self.assertTrue(has_more)
+        seen = [current]
+        while True:
+            current, lookahead, has_more = foresta._get_record_block(records, buffer, 3)
+            if not has_more:
+                break
+            seen.append(current)
+        self.assertEqual(len(seen), 4)
+        self.assertEqual(lookahead, [])
+
+
+class TestPagedLogStream(unittest.TestCase):
+    """
+    @brief Level 1: Test lazy `--page` git-log windows and early git termination.
+    @satisfies REQ-170
+    """
+
+    class _Proc:
+        def __init__(self, lines):
+            import io
+
+            self.stdout = io.StringIO("".join(lines))
+            self.terminated = False
+
+        def wait(self):
+            return -15 if self.terminated else 0
+
+        def terminate(self):
+            self.terminated = True
+
+    def _windows(self, total):
+        lines = [f"<{i:040x}><{i:07x}><>{i}\t0\tdev\t\ts\n" for i in range(total)]
+        calls = []
+
+        def pipe(args):
+            calls.append(args)
+            skip = int(args[2].split("=", 1)[1])
+            count = int(args[3].split("=", 1)[1])
+            return self._Proc(lines[skip : skip + count])
+
+        return lines, calls, pipe
+
+    def test_windows_double_and_stop_on_short_window(self):
+        lines, calls, pipe = self._windows(20)
+        with patch("git_alias.foresta._git_command_output_pipe", side_effect=pipe):
+            stream = foresta._LogRecordStream(["log", "--date-order"], ["--all"], 3)
+            records = list(stream)
+        self.assertEqual(records, [foresta._parse_log_line(line) for line in lines])
+        self.assertEqual(
+            [call[2:] for call in calls],
+            [
+                ["--skip=0", "--max-count=3", "--all"],
+                ["--skip=3", "--max-count=6", "--all"],
+                ["--skip=9", "--max-count=12", "--all"],
+            ],
+        )
+        self.assertEqual(stream.returncode, 0)
+
+    def test_close_terminates_running_git(self):
+        _, calls, pipe = self._windows(100)
+        procs = []
+
+        def tracking_pipe(args):
+            procs.append(pipe(args))
+            return procs[-1]
+
+        with patch("git_alias.foresta._git_command_output_pipe", side_effect=tracking_pipe):
+            stream = foresta._LogRecordStream(["log", "--date-order"], [], 10)
+            records = iter(stream)
+            for _ in range(12):
+                next(records)
+            stream.close()
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(procs[-1].terminated)
+        self.assertFalse(procs[0].terminated)
+        self.assertNotEqual(stream.returncode, 0)
+
+    def test_has_log_limit(self):
+        self.assertTrue(foresta._has_log_limit(["-n", "5"]))
+        self.assertTrue(foresta._has_log_limit(["-10"]))
+        self.assertTrue(foresta._has_log_limit(["--max-count=4"]))
+        self.assertTrue(foresta._has_log_limit(["--skip", "2"]))
+        self.assertFalse(foresta._has_log_limit(["--all", "--no-merges"]))
+        self.assertFalse(foresta._has_log_limit(["--", "-n"]))
+
+    @patch("git_alias.foresta._process")
+    @patch("git_alias.foresta._get_refs", return_value={})
+    @patch("git_alias.foresta._git_command", return_value="abcd1234\n")
+    @patch("git_alias.foresta.shutil.get_terminal_size")
+    def test_run_page_option(self, mock_size, _git, _refs, mock_process):
+        mock_size.return_value = os.terminal_size((80, 40))
+        foresta.run(["--no-status", "--page"])
+        self.assertEqual(mock_process.call_args.kwargs["page_size"], 40)
+        foresta.run(["--no-status", "--page=7"])
+        self.assertEqual(mock_process.call_args.kwargs["page_size"], 7)
+        foresta.run(["--no-status", "--page", "-n", "5"])
+        self.assertIsNone(mock_process.call_args.kwargs["page_size"])
+        foresta.run(["--no-status"])
+        self.assertIsNone(mock_process.call_args.kwargs["page_size"])
+
+
 class TestReverseOutput(unittest.TestCase):
     """
     @brief Level 0: Test reverse output buffer.
+    @satisfies REQ-167
     """
 
     def test_reverse_order(self):
@@ -425,6 +763,315 @@ class TestReverseOutput(unittest.TestCase):
         self.assertEqual(lines[1], "line2")
         self.assertEqual(lines[2], "line1")
 
+    def test_spilled_buffer_matches_in_memory_reversal(self):
+        import io
+
+        text = "".join(
+            f"row {i} \u25cf \u2502{'' if i % 7 else chr(10)}\n" for i in range(500)
+        )
+        expected = io.StringIO()
+        in_memory = foresta._ReverseOutput(expected)
+        spilled_stream = io.StringIO()
+        spilled = foresta._ReverseOutput(spilled_stream, spill_threshold=64)
+        for start in range(0, len(text), 37):
+            in_memory.write(text[start : start + 37])
+            spilled.write(text[start : start + 37])
+        self.assertIsNotNone(spilled._spill)
+        self.assertLess(spilled._size, 64)
+        in_memory.close()
+        spilled.close()
+        self.assertEqual(spilled_stream.getvalue(), expected.getvalue())
+        self.assertTrue(expected.getvalue().startswith("\nrow 499"))
+
+
+class TestLayoutCache(unittest.TestCase):
+    """
+    @brief Level 1: Test persistent foresta layout cache replay and eviction.
+    @satisfies REQ-169
+    """
+
+    @staticmethod
+    def _history(start, end):
+        lines = []
+        for i in range(start, end):
+            parents = [f"{i + 1:040x}"] if i + 1 < end else []
+            if i % 20 == 0 and i + 7 < end:
+                parents.append(f"{i + 7:040x}")
+            lines.append(
+                f"<{i:040x}><{i:07x}><{' '.join(parents)}>"
+                f"{i:07x}\t{1700000000 - i}\tdev\t\tsubject {i}\n"
+            )
+        return lines
+
+    @staticmethod
+    def _render(lines, cache_path, **kwargs):
+        import io
+
+        class _Proc:
+            stdout = io.StringIO("".join(lines))
+
+            def wait(self):
+                return 0
+
+        output = io.StringIO()
+        options = dict(
+            refs={},
+            status="",
+            show_status=False,
+            pretty_fmt="",
+            argv=[],
+            color=dict(foresta._COLOR),
+            hash_width=7,
+            date_width=foresta._DATE_WIDTH,
+            date_format=foresta._DATE_FORMAT,
+            graph_margin_left=foresta._GRAPH_MARGIN_LEFT,
+            graph_margin_right=foresta._GRAPH_MARGIN_RIGHT,
+            subvine_depth=foresta._SUBVINE_DEPTH + 1,
+            style=foresta._STYLE,
+            reverse_order=False,
+            graph_symbol_tr=foresta._trgen("●", "◎", "═", "■", "○"),
+            output_stream=output,
+            branch_colors_now=[],
+            branch_colors_ref=list(foresta._BRANCH_COLORS_REF),
+            terminal_columns=None,
+            layout_cache_path=cache_path,
+        )
+        options.update(kwargs)
+        with patch("git_alias.foresta._git_command_output_pipe", return_value=_Proc()):
+            foresta._process(**options)
+        return output.getvalue()
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_path = os.path.join(tmp.name, "git-alias", "foresta-layout-test.jsonl")
+        min_rows = patch.object(foresta, "_LAYOUT_CACHE_MIN_ROWS", 10)
+        min_rows.start()
+        self.addCleanup(min_rows.stop)
+
+    def test_warm_run_replays_without_layout(self):
+        lines = self._history(100, 400)
+        expected = self._render(lines, None)
+        self.assertEqual(self._render(lines, self.cache_path), expected)
+        self.assertTrue(os.path.exists(self.cache_path))
+        with patch("git_alias.foresta._vine_commit", wraps=foresta._vine_commit) as commit:
+            self.assertEqual(self._render(lines, self.cache_path), expected)
+        commit.assert_not_called()
+
+    def test_new_commits_lay_out_only_above_cached_frontier(self):
+        self._render(self._history(100, 400), self.cache_path)
+        lines = self._history(95, 400)
+        expected = self._render(lines, None)
+        with patch("git_alias.foresta._vine_commit", wraps=foresta._vine_commit) as commit:
+            self.assertEqual(self._render(lines, self.cache_path), expected)
+        self.assertLess(commit.call_count, 50)
+
+    def test_diverged_history_falls_back_to_live_layout(self):
+        self._render(self._history(100, 400), self.cache_path)
+        lines = self._history(100, 400)
+        lines[160] = lines[160].replace(f" {267:040x}>", ">")
+        expected = self._render(lines, None)
+        with patch("git_alias.foresta._vine_commit", wraps=foresta._vine_commit) as commit:
+            self.assertEqual(self._render(lines, self.cache_path), expected)
+        self.assertGreater(commit.call_count, 0)
+        self.assertLess(commit.call_count, 300)
+        self.assertEqual(self._render(lines, self.cache_path), expected)
+
+    def test_unchanged_history_keeps_cache_file(self):
+        lines = self._history(100, 400)
+        self._render(lines, self.cache_path)
+        inode = os.stat(self.cache_path).st_ino
+        self._render(lines, self.cache_path)
+        self.assertEqual(os.stat(self.cache_path).st_ino, inode)
+        self.assertEqual(os.listdir(os.path.dirname(self.cache_path)), ["foresta-layout-test.jsonl"])
+
+    def test_entry_above_size_cap_is_not_stored(self):
+        directory = os.path.dirname(self.cache_path)
+        os.makedirs(directory)
+        with open(os.path.join(directory, "foresta-layout-old.jsonl"), "w", encoding="utf-8") as f:
+            f.write("x" * 100)
+        lines = self._history(100, 400)
+        with patch.object(foresta, "_LAYOUT_CACHE_MAX_BYTES", 4096):
+            self.assertEqual(self._render(lines, self.cache_path), self._render(lines, None))
+        self.assertEqual(os.listdir(directory), ["foresta-layout-old.jsonl"])
+
+    def test_invalid_cache_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.cache_path))
+        with open(self.cache_path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        lines = self._history(100, 200)
+        self.assertEqual(self._render(lines, self.cache_path), self._render(lines, None))
+
+    def test_prune_evicts_by_age_then_size(self):
+        import time
+
+        directory = os.path.dirname(self.cache_path)
+        os.makedirs(directory)
+        now = time.time()
+        for name, age in (("a", 0), ("b", 10), ("c", 20), ("d", 30 * 24 * 3600)):
+            path = os.path.join(directory, f"foresta-layout-{name}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("x" * 100)
+            os.utime(path, (now - age, now - age))
+        with patch.object(foresta, "_LAYOUT_CACHE_MAX_BYTES", 250):
+            foresta._prune_layout_cache(directory)
+        self.assertEqual(
+            sorted(os.listdir(directory)),
+            ["foresta-layout-a.json", "foresta-layout-b.json"],
+        )
+
+    def test_prune_counts_only_kept_entries(self):
+        import time
+
+        directory = os.path.dirname(self.cache_path)
+        os.makedirs(directory)
+        now = time.time()
+        for name, age, size in (("a", 0, 100), ("b", 10, 300), ("c", 20, 100)):
+            path = os.path.join(directory, f"foresta-layout-{name}.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("x" * size)
+            os.utime(path, (now - age, now - age))
+        with patch.object(foresta, "_LAYOUT_CACHE_MAX_BYTES", 250):
+            foresta._prune_layout_cache(directory)
+        self.assertEqual(
+            sorted(os.listdir(directory)),
+            ["foresta-layout-a.jsonl", "foresta-layout-c.jsonl"],
+        )
+
+
+class TestRowFormatter(unittest.TestCase):
+    """
+    @brief Level 0: Test per-row decoration of laid-out rows.
+    @satisfies REQ-100, REQ-171
+    """
+
+    def test_format_row_decorates_refs(self):
+        formatter = foresta._RowFormatter(
+            refs={"a" * 40: ["HEAD", "refs/heads/master"]},
+            status="*",
+            show_status=True,
+            color={},
+            hash_width=4,
+            date_width=3,
+            date_format="%Y",
+            graph_margin_left=0,
+            graph_margin_right=1,
+            terminal_columns=None,
+        )
+        row = ("a" * 40, "abcdef", "bad", "dev", " (HEAD -> master)", "msg", "b\n", "*", None)
+        self.assertEqual(
+            formatter.format_row(row),
+            "b\nabcd bad* dev (HEAD* -> master) msg\n",
+        )
+
+
+class TestDateCache(unittest.TestCase):
+    """
+    @brief Level 0: Test per-minute memoized commit date formatting.
+    @satisfies REQ-172
+    """
+
+    def test_minute_resolution_detection(self):
+        self.assertTrue(foresta._has_minute_resolution(foresta._DATE_FORMAT))
+        self.assertTrue(foresta._has_minute_resolution("%d %b %Y"))
+        self.assertFalse(foresta._has_minute_resolution("%H:%M:%S"))
+        self.assertFalse(foresta._has_minute_resolution("%c"))
+
+    def test_cached_dates_match_strftime(self):
+        from time import localtime, strftime
+
+        fmt = foresta._DATE_FORMAT
+        for timestamp in list(range(1711846800 - 4000, 1711846800 + 4000, 7)) + [0, 59, 60]:
+            cached = foresta._format_minute(fmt, timestamp // 60)
+            self.assertIn(cached, (None, strftime(fmt, localtime(timestamp))))
+
+    def test_format_row_uses_minute_cache_only_for_minute_formats(self):
+        def formatter(date_format):
+            return foresta._RowFormatter({}, "", False, {}, 4, 8, date_format, 0, 0, None)
+
+        row = ("a" * 40, "abcd", "1700000030", "dev", "", "msg", None, "*", None)
+        with patch("git_alias.foresta._format_minute", return_value="cached") as cached:
+            self.assertIn("cached", formatter("%H:%M").format_row(row))
+            self.assertNotIn("cached", formatter("%H:%M:%S").format_row(row))
+        cached.assert_called_once_with("%H:%M", 1700000030 // 60)
+
+
+class TestJsonOutput(unittest.TestCase):
+    """
+    @brief Level 1: Test `--json` JSON Lines rows emitted from the layout engine.
+    @satisfies REQ-173
+    """
+
+    def test_json_rows_follow_text_layout(self):
+        import json
+
+        lines = TestLayoutCache._history(100, 300)
+        text = TestLayoutCache._render(lines, None, color={})
+        records = [
+            json.loads(line)
+            for line in TestLayoutCache._render(
+                lines, None, color={}, json_output=True
+            ).splitlines()
+        ]
+        self.assertEqual(len(records), 200)
+        self.assertEqual(records[0]["sha"], f"{100:040x}")
+        self.assertEqual(records[0]["parents"], [f"{101:040x}", f"{107:040x}"])
+        self.assertEqual(records[0]["time"], 1700000000 - 100)
+        graph_lines = []
+        for record in records:
+            graph = record["graph"]
+            self.assertIn(graph["commit"][record["lane"] * 2], "●◎■○")
+            graph_lines.extend(
+                part
+                for part in (graph["branch"], graph["commit"], graph["merge"])
+                if part is not None
+            )
+        self.assertEqual(len(graph_lines), len(text.splitlines()))
+        for graph_line, text_line in zip(graph_lines, text.splitlines()):
+            self.assertIn(graph_line, text_line)
+
+    def test_cached_rows_keep_vine_lanes(self):
+        lines = TestLayoutCache._history(100, 400)
+        expected = TestLayoutCache._render(lines, None, color={}, json_output=True)
+        with tempfile.TemporaryDirectory() as tmp, patch.object(
+            foresta, "_LAYOUT_CACHE_MIN_ROWS", 10
+        ):
+            cache_path = os.path.join(tmp, "git-alias", "foresta-layout-test.jsonl")
+            TestLayoutCache._render(lines, cache_path, color={}, json_output=True)
+            with patch("git_alias.foresta._vine_commit") as commit:
+                warm = TestLayoutCache._render(lines, cache_path, color={}, json_output=True)
+        commit.assert_not_called()
+        self.assertEqual(warm, expected)
+
+    def test_json_row_refs_status_and_color(self):
+        import json
+
+        formatter = foresta._JsonRowFormatter(
+            {"a" * 40: ["HEAD", "refs/heads/master"]}, "*", True, {}, 4, 3, "%Y", 0, 0, None
+        )
+        row = (
+            "a" * 40, "a" * 40, "x", "dev", " (HEAD -> master)", "msg",
+            "        ├─┐\n", "│ ●", None, ["b" * 40], 1, ["", "green"],
+        )
+        record = json.loads(formatter.format_row(row))
+        self.assertEqual(record["refs"], ["HEAD", "refs/heads/master"])
+        self.assertEqual(record["decoration"], "HEAD -> master")
+        self.assertEqual(record["status"], "*")
+        self.assertEqual((record["lane"], record["color"]), (1, "green"))
+        self.assertIsNone(record["time"])
+        self.assertEqual(record["graph"], {"branch": "├─┐", "commit": "│ ●", "merge": None})
+
+    @patch("git_alias.foresta._process")
+    @patch("git_alias.foresta._get_refs", return_value={})
+    @patch("git_alias.foresta._git_command", return_value="abcd1234\n")
+    def test_run_json_disables_color_and_truncation(self, _git, _refs, mock_process):
+        foresta.run(["--no-status", "--json"])
+        kwargs = mock_process.call_args.kwargs
+        self.assertTrue(kwargs["json_output"])
+        self.assertEqual(kwargs["color"], {})
+        self.assertIsNone(kwargs["terminal_columns"])
+        self.assertIn("--no-color", kwargs["argv"])
+
 
 if __name__ == "__main__":
     unittest.main()
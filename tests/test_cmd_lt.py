@@ -13,7 +13,12 @@ class CmdLtTest(unittest.TestCase):
             "capture_git_output",
             side_effect=[
                 "v0.0.4",
-                "* work\n  master\n  remotes/origin/master\n  remotes/origin/HEAD -> origin/master",
+                "refs/heads/work\0c3\0\n"
+                "refs/heads/master\0c2\0\n"
+                "refs/remotes/origin/HEAD\0c2\0refs/remotes/origin/master\n"
+                "refs/remotes/origin/master\0c2\0",
+                "v0.0.4\0t1\0c2\0commit",
+                "c3 c2\nc2 c1\nc1",
             ],
         ) as capture:
             stdout = io.StringIO()
@@ -23,18 +28,31 @@ class CmdLtTest(unittest.TestCase):
         capture.assert_has_calls(
             [
                 mock.call(["tag", "-l"]),
-                mock.call(["branch", "-a", "--contains", "v0.0.4"]),
+                mock.call(["branch", "-a", "--format=%(refname)%00%(objectname)%00%(symref)"]),
+                mock.call(
+                    [
+                        "for-each-ref",
+                        "--format=%(refname:strip=2)%00%(objectname)%00%(*objectname)%00%(*objecttype)",
+                        "refs/tags",
+                    ]
+                ),
+                mock.call(["rev-list", "--topo-order", "--parents", "c3", "c2"]),
             ]
         )
+        self.assertEqual(4, capture.call_count)
 
     def test_cmd_lt_prints_multiple_tags(self):
+        # c1 <- c2 (work); c1 <- d1 (develop, origin/develop); v0.0.40 on c2, v0.0.41 on c1.
         with mock.patch.object(
             core,
             "capture_git_output",
             side_effect=[
                 "v0.0.40\nv0.0.41",
-                "* work",
-                "  work\n  develop\n  remotes/origin/develop",
+                "refs/heads/develop\0d1\0\n"
+                "refs/heads/work\0c2\0\n"
+                "refs/remotes/origin/develop\0d1\0",
+                "v0.0.40\0c2\0\0\nv0.0.41\0c1\0\0",
+                "d1 c1\nc2 c1\nc1",
             ],
         ):
             stdout = io.StringIO()
@@ -42,9 +60,27 @@ class CmdLtTest(unittest.TestCase):
                 core.cmd_lt([])
         self.assertEqual(
             stdout.getvalue().strip().splitlines(),
-            ["v0.0.40: work", "v0.0.41: work, develop, origin/develop"],
+            ["v0.0.40: work", "v0.0.41: develop, work, origin/develop"],
         )
 
+    def test_cmd_lt_peels_nested_annotated_tags(self):
+        with mock.patch.object(
+            core,
+            "capture_git_output",
+            side_effect=[
+                "nested",
+                "refs/heads/work\0c1\0",
+                "nested\0t2\0t1\0tag",
+                "c1",
+                "c1",
+            ],
+        ) as capture:
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                core.cmd_lt([])
+        self.assertEqual(stdout.getvalue().strip(), "nested: work")
+        capture.assert_any_call(["rev-parse", "refs/tags/nested^{commit}"])
+
     def test_cmd_lt_forwards_extra_filters_to_tag_list(self):
         with mock.patch.object(core, "capture_git_output", return_value="") as capture:
             stdout = io.StringIO()
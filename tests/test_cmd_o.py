@@ -10,6 +10,21 @@ from unittest.mock import ANY
 
 from git_alias import core
 
+## @brief Ordered configured refs used by topology tests.
+TOPOLOGY_REFS = ["work", "develop", "master", "origin/develop", "origin/master"]
+
+
+## @brief Build an overview ref graph from per-ref hashes and merge-base positions.
+# @param hashes Commit hashes ordered like `TOPOLOGY_REFS`.
+# @param positions Merge-base commit counts ordered like `TOPOLOGY_REFS`.
+# @return {core.OverviewRefGraph} Graph consumed by `_overview_ascii_topology_lines`.
+def _topology_graph(hashes, positions):
+    return core.OverviewRefGraph(
+        hashes=dict(zip(TOPOLOGY_REFS, hashes)),
+        positions=dict(zip(TOPOLOGY_REFS, positions)),
+        distances={},
+    )
+
 
 ## @brief Test suite for `cmd_o` and overview helpers.
 class CmdOverviewTest(unittest.TestCase):
@@ -43,6 +58,7 @@ class CmdOverviewTest(unittest.TestCase):
              mock.patch.object(core, "get_branch", side_effect=["work", "develop", "master"]), \
              mock.patch.object(core, "_git_status_lines", return_value=[]), \
              mock.patch.object(core, "run_git_text", return_value="work") as run_git_text, \
+             mock.patch.object(core, "_overview_ref_graph") as ref_graph, \
              mock.patch.object(core, "_overview_compare_refs") as compare, \
              mock.patch.object(
                  core,
@@ -66,10 +82,10 @@ class CmdOverviewTest(unittest.TestCase):
         run_git.assert_called_once_with(["worktree", "list", "--verbose"])
         compare.assert_has_calls(
             [
-                mock.call("work", "develop", ANY),
-                mock.call("work", "master", ANY),
-                mock.call("develop", "origin/develop", ANY),
-                mock.call("master", "origin/master", ANY),
+                mock.call("work", "develop", ANY, ref_graph.return_value),
+                mock.call("work", "master", ANY, ref_graph.return_value),
+                mock.call("develop", "origin/develop", ANY, ref_graph.return_value),
+                mock.call("master", "origin/master", ANY, ref_graph.return_value),
             ]
         )
         run_git_text.assert_has_calls(
@@ -89,6 +105,7 @@ class CmdOverviewTest(unittest.TestCase):
             remote_develop_display=ANY,
             remote_master_display=ANY,
             additional_refs=["feature/alpha", "origin/release/1.2.0"],
+            branch_subjects=ANY,
         )
         output = out.getvalue()
         normalized_output = re.sub(r"\x1b\[[0-9;]*m", "", output)
@@ -135,6 +152,7 @@ class CmdOverviewTest(unittest.TestCase):
             remote_develop_display=ANY,
             remote_master_display=ANY,
             worktree_state="clean",
+            ref_graph=ref_graph.return_value,
         )
 
     ## @brief Verify section-6 status renders only for non-clean worktree and normalizes branch header.
@@ -152,6 +170,7 @@ class CmdOverviewTest(unittest.TestCase):
                      "## work\n M tracked.py",
                  ],
              ), \
+             mock.patch.object(core, "_overview_ref_graph"), \
              mock.patch.object(core, "_overview_compare_refs"), \
              mock.patch.object(core, "_overview_branch_summary_lines", return_value=[]), \
              mock.patch.object(core, "_overview_ascii_topology_lines", return_value=[]), \
@@ -193,6 +212,7 @@ class CmdOverviewTest(unittest.TestCase):
              mock.patch.object(core, "get_branch", side_effect=["wrk", "dev", "mst"]), \
              mock.patch.object(core, "_git_status_lines", return_value=[]), \
              mock.patch.object(core, "run_git_text", return_value="wrk"), \
+             mock.patch.object(core, "_overview_ref_graph") as ref_graph, \
              mock.patch.object(core, "_overview_compare_refs") as compare, \
              mock.patch.object(core, "_overview_branch_summary_lines", return_value=[]), \
              mock.patch.object(core, "_overview_ascii_topology_lines", return_value=[]), \
@@ -201,10 +221,10 @@ class CmdOverviewTest(unittest.TestCase):
             core.cmd_o([])
         compare.assert_has_calls(
             [
-                mock.call("wrk", "dev", ANY),
-                mock.call("wrk", "mst", ANY),
-                mock.call("dev", "origin/dev", ANY),
-                mock.call("mst", "origin/mst", ANY),
+                mock.call("wrk", "dev", ANY, ref_graph.return_value),
+                mock.call("wrk", "mst", ANY, ref_graph.return_value),
+                mock.call("dev", "origin/dev", ANY, ref_graph.return_value),
+                mock.call("mst", "origin/mst", ANY, ref_graph.return_value),
             ]
         )
         self.assertEqual(compare.call_count, 4)
@@ -212,33 +232,96 @@ class CmdOverviewTest(unittest.TestCase):
     ## @brief Verify `_overview_compare_refs` formats and prints divergence rows.
     # @return None.
     def test_overview_compare_refs_prints_distance_row(self):
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), mock.patch.object(
-            core, "run_git_text", side_effect=["2", "1"]
-        ):
+        graph = core.OverviewRefGraph(
+            hashes={"HEAD": "aaa", "develop": "bbb"},
+            positions={"HEAD": 2, "develop": 1},
+            distances={("HEAD", "develop"): (2, 1)},
+        )
+        with mock.patch.object(core, "run_git_text") as run_git_text:
             out = io.StringIO()
             with contextlib.redirect_stdout(out):
-                state = core._overview_compare_refs("HEAD", "develop", "Current vs Develop")
+                state = core._overview_compare_refs(
+                    "HEAD", "develop", "Current vs Develop", graph
+                )
         line = out.getvalue().strip()
         self.assertIn("Current vs Develop", line)
         self.assertIn("↑ ahead 2", line)
         self.assertIn("↓ behind 1", line)
         self.assertEqual(state, "diverged")
+        run_git_text.assert_not_called()
 
     ## @brief Verify `_overview_compare_refs` prints explicit n/a values when refs are unavailable.
     # @return None.
     def test_overview_compare_refs_marks_missing_refs(self):
-        with mock.patch.object(core, "_overview_ref_is_available", side_effect=[True, False]), mock.patch.object(
-            core, "run_git_text"
-        ) as run_git_text:
+        graph = core.OverviewRefGraph(
+            hashes={"HEAD": "aaa"}, positions={"HEAD": 0}, distances={}
+        )
+        with mock.patch.object(core, "run_git_text") as run_git_text:
             out = io.StringIO()
             with contextlib.redirect_stdout(out):
-                state = core._overview_compare_refs("HEAD", "develop", "Current vs Develop")
+                state = core._overview_compare_refs(
+                    "HEAD", "develop", "Current vs Develop", graph
+                )
         self.assertIn("ahead", out.getvalue())
         self.assertIn("n/a", out.getvalue())
         self.assertIn("behind", out.getvalue())
         self.assertEqual(state, "unknown")
         run_git_text.assert_not_called()
 
+    ## @brief Verify `_overview_ref_graph` derives positions and pair distances from one walk.
+    # @return None.
+    def test_overview_ref_graph_uses_single_commit_walk(self):
+        # base <- c1 <- c2 (work), base <- d1 (develop), master at base, remotes missing.
+        cat_file = mock.Mock(
+            returncode=0,
+            stdout="c2\nd1\nbase\norigin/develop^{commit} missing\norigin/master^{commit} missing\n",
+        )
+        with mock.patch.object(core, "_run_checked", return_value=cat_file) as run_checked, \
+             mock.patch.object(
+                 core,
+                 "run_git_text",
+                 side_effect=["base", "c2 c1\nc1 base\nd1 base"],
+             ) as run_git_text:
+            graph = core._overview_ref_graph(
+                TOPOLOGY_REFS,
+                [("work", "develop"), ("work", "master"), ("develop", "origin/develop")],
+            )
+        run_checked.assert_called_once()
+        self.assertEqual(
+            ["git", "cat-file", "--batch-check=%(objectname)"],
+            run_checked.call_args.args[0],
+        )
+        run_git_text.assert_has_calls(
+            [
+                mock.call(["merge-base", "--octopus", "c2", "d1", "base"]),
+                mock.call(["rev-list", "--parents", "c2", "d1", "base", "--not", "base"]),
+            ]
+        )
+        self.assertEqual(2, run_git_text.call_count)
+        self.assertEqual({"work": "c2", "develop": "d1", "master": "base"}, graph.hashes)
+        self.assertEqual({"work": 2, "develop": 1, "master": 0}, graph.positions)
+        self.assertEqual(
+            {("work", "develop"): (2, 1), ("work", "master"): (2, 0)},
+            graph.distances,
+        )
+
+    ## @brief Verify `_overview_ref_graph` falls back to left-right counts without a merge-base.
+    # @return None.
+    def test_overview_ref_graph_without_merge_base_uses_left_right_counts(self):
+        cat_file = mock.Mock(returncode=0, stdout="aaa\nbbb\n")
+        with mock.patch.object(core, "_run_checked", return_value=cat_file), \
+             mock.patch.object(
+                 core,
+                 "run_git_text",
+                 side_effect=[RuntimeError("no merge base"), "3\t5"],
+             ) as run_git_text:
+            graph = core._overview_ref_graph(["work", "develop"], [("work", "develop")])
+        run_git_text.assert_called_with(
+            ["rev-list", "--left-right", "--count", "aaa...bbb"]
+        )
+        self.assertEqual({"work": 0, "develop": 0}, graph.positions)
+        self.assertEqual({("work", "develop"): (3, 5)}, graph.distances)
+
     ## @brief Verify current branch identifier uses red logical prefix and yellow tuple.
     # @return None.
     def test_overview_current_branch_display_uses_expected_colors(self):
@@ -297,24 +380,86 @@ class CmdOverviewTest(unittest.TestCase):
     ## @brief Verify `_overview_discovered_branch_refs` normalizes and deduplicates refs.
     # @return None.
     def test_overview_discovered_branch_refs_normalizes_deduplicates_and_skips_redirects(self):
-        branches_output = "\n".join(
+        refs_output = "\n".join(
             [
-                "* work",
-                "  develop",
-                "  remotes/origin/HEAD -> origin/master",
-                "  remotes/origin/master",
-                "  remotes/origin/feature/x",
-                "  remotes/origin/feature/x",
-                "  (HEAD detached at abc1234)",
+                "refs/heads/work\0\0work subject",
+                "refs/heads/develop\0\0develop subject",
+                "refs/remotes/origin/HEAD\0refs/remotes/origin/master\0master subject",
+                "refs/remotes/origin/master\0\0master subject",
+                "refs/remotes/origin/feature/x\0\0feature subject",
+                "refs/remotes/origin/feature/x\0\0feature subject",
             ],
         )
-        with mock.patch.object(core, "run_git_text", return_value=branches_output):
+        with mock.patch.object(core, "run_git_text", return_value=refs_output):
             refs = core._overview_discovered_branch_refs()
         self.assertEqual(
             ["work", "develop", "origin/master", "origin/feature/x"],
             refs,
         )
 
+    ## @brief Verify `_overview_branch_index` resolves all subjects with one Git call.
+    # @return None.
+    def test_overview_branch_index_maps_subjects_in_one_pass(self):
+        refs_output = "\n".join(
+            [
+                "refs/heads/work\0\0\x1b[31mfix: colored\x1b[0m",
+                "refs/heads/empty\0\0",
+                "refs/remotes/origin/develop\0\0release version: 0.0.4",
+            ],
+        )
+        with mock.patch.object(
+            core, "run_git_text", return_value=refs_output
+        ) as run_git_text:
+            index = core._overview_branch_index()
+        run_git_text.assert_called_once_with(
+            [
+                "for-each-ref",
+                "--format=%(refname)%00%(symref)%00%(contents:subject)",
+                "refs/heads",
+                "refs/remotes",
+            ]
+        )
+        self.assertEqual(
+            {
+                "work": "fix: colored",
+                "empty": "n/a",
+                "origin/develop": "release version: 0.0.4",
+            },
+            index,
+        )
+
+    ## @brief Verify section-5 rows reuse indexed subjects and fall back for unknown refs.
+    # @return None.
+    def test_overview_branch_summary_lines_uses_branch_subjects_index(self):
+        with mock.patch.object(
+            core, "_overview_ref_latest_subject", return_value="n/a"
+        ) as latest_subject:
+            lines = core._overview_branch_summary_lines(
+                work_ref="work",
+                develop_ref="develop",
+                master_ref="master",
+                remote_develop_ref="origin/develop",
+                remote_master_ref="origin/master",
+                work_display="Work(⎇ work)",
+                develop_display="Develop(⎇ develop)",
+                master_display="Master(⎇ master)",
+                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+                remote_master_display="RemoteMaster(⎇ origin/master)",
+                additional_refs=["feature/foo"],
+                branch_subjects={
+                    "work": "work-subject",
+                    "develop": "develop-subject",
+                    "master": "master-subject",
+                    "origin/develop": "remote-develop-subject",
+                    "feature/foo": "feature-subject",
+                },
+            )
+        latest_subject.assert_called_once_with("origin/master")
+        normalized = [re.sub(r"\x1b\[[0-9;]*m", "", line) for line in lines]
+        self.assertTrue(normalized[0].endswith("| work-subject"))
+        self.assertTrue(normalized[4].endswith("| n/a"))
+        self.assertTrue(normalized[5].endswith("| feature-subject"))
+
     ## @brief Verify section-5 branch rows are aligned and subject text is uncolored.
     # @return None.
     def test_overview_branch_summary_lines_align_and_keep_subject_uncolored(self):
@@ -394,25 +539,20 @@ class CmdOverviewTest(unittest.TestCase):
     # @return None.
     def test_topology_all_in_sync_clean(self):
         same_hash = "aaa111"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 same_hash, same_hash, same_hash, same_hash, same_hash,
-                 same_hash,
-                 "0", "0", "0", "0", "0",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="clean",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="clean",
+            ref_graph=_topology_graph([same_hash, same_hash, same_hash, same_hash, same_hash], [0, 0, 0, 0, 0]),
+        )
         rendered = "\n".join(lines)
         normalized = re.sub(r"\x1b\[[0-9;]*m", "", rendered)
         self.assertIn("WorkingTree [clean]", normalized)
@@ -443,25 +583,20 @@ class CmdOverviewTest(unittest.TestCase):
     def test_topology_groups_work_with_aligned_develop_refs(self):
         aligned_hash = "lll222"
         master_hash = "mmm333"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 aligned_hash, aligned_hash, master_hash, aligned_hash, master_hash,
-                 "nnn000",
-                 "2", "2", "0", "2", "0",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="clean",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="clean",
+            ref_graph=_topology_graph([aligned_hash, aligned_hash, master_hash, aligned_hash, master_hash], [2, 2, 0, 2, 0]),
+        )
         norm_lines = [re.sub(r"\x1b\[[0-9;]*m", "", line_text) for line_text in lines]
         work_group_idx = next(
             i
@@ -478,25 +613,20 @@ class CmdOverviewTest(unittest.TestCase):
     def test_topology_dirty_worktree_above_work(self):
         work_hash = "bbb222"
         other_hash = "ccc333"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 work_hash, other_hash, other_hash, other_hash, other_hash,
-                 work_hash,
-                 "3", "1", "1", "1", "1",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="unstaged",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="unstaged",
+            ref_graph=_topology_graph([work_hash, other_hash, other_hash, other_hash, other_hash], [3, 1, 1, 1, 1]),
+        )
         norm_lines = [re.sub(r"\x1b\[[0-9;]*m", "", line_text) for line_text in lines]
         wt_idx = next(i for i, line_text in enumerate(norm_lines) if "WorkingTree" in line_text)
         work_idx = next(i for i, line_text in enumerate(norm_lines) if "Work(⎇ work)" in line_text)
@@ -510,25 +640,20 @@ class CmdOverviewTest(unittest.TestCase):
         dev_hash = "eee555"
         remote_dev_hash = "fff666"
         master_hash = "ggg777"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 work_hash, dev_hash, master_hash, remote_dev_hash, master_hash,
-                 "aaa000",
-                 "2", "1", "0", "4", "0",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="unstaged",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="unstaged",
+            ref_graph=_topology_graph([work_hash, dev_hash, master_hash, remote_dev_hash, master_hash], [2, 1, 0, 4, 0]),
+        )
         norm_lines = [re.sub(r"\x1b\[[0-9;]*m", "", line_text) for line_text in lines]
         self.assertIn("RemoteDevelop(⎇ origin/develop)", norm_lines[0])
         wt_idx = next(i for i, line_text in enumerate(norm_lines) if "WorkingTree" in line_text)
@@ -540,25 +665,20 @@ class CmdOverviewTest(unittest.TestCase):
     def test_topology_groups_same_hash_refs(self):
         same_hash = "hhh888"
         work_hash = "iii999"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 work_hash, same_hash, same_hash, same_hash, same_hash,
-                 "jjj000",
-                 "3", "1", "1", "1", "1",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="clean",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="clean",
+            ref_graph=_topology_graph([work_hash, same_hash, same_hash, same_hash, same_hash], [3, 1, 1, 1, 1]),
+        )
         norm_lines = [re.sub(r"\x1b\[[0-9;]*m", "", line_text) for line_text in lines]
         grouped_line = next(
             line_text
@@ -572,25 +692,20 @@ class CmdOverviewTest(unittest.TestCase):
     # @return None.
     def test_topology_no_qualitative_state_labels(self):
         same_hash = "kkk111"
-        with mock.patch.object(core, "_overview_ref_is_available", return_value=True), \
-             mock.patch.object(core, "run_git_text", side_effect=[
-                 same_hash, same_hash, same_hash, same_hash, same_hash,
-                 same_hash,
-                 "0", "0", "0", "0", "0",
-             ]):
-            lines = core._overview_ascii_topology_lines(
-                work_ref="work",
-                develop_ref="develop",
-                master_ref="master",
-                remote_develop_ref="origin/develop",
-                remote_master_ref="origin/master",
-                work_display="Work(⎇ work)",
-                develop_display="Develop(⎇ develop)",
-                master_display="Master(⎇ master)",
-                remote_develop_display="RemoteDevelop(⎇ origin/develop)",
-                remote_master_display="RemoteMaster(⎇ origin/master)",
-                worktree_state="clean",
-            )
+        lines = core._overview_ascii_topology_lines(
+            work_ref="work",
+            develop_ref="develop",
+            master_ref="master",
+            remote_develop_ref="origin/develop",
+            remote_master_ref="origin/master",
+            work_display="Work(⎇ work)",
+            develop_display="Develop(⎇ develop)",
+            master_display="Master(⎇ master)",
+            remote_develop_display="RemoteDevelop(⎇ origin/develop)",
+            remote_master_display="RemoteMaster(⎇ origin/master)",
+            worktree_state="clean",
+            ref_graph=_topology_graph([same_hash, same_hash, same_hash, same_hash, same_hash], [0, 0, 0, 0, 0]),
+        )
         rendered = "\n".join(lines)
         normalized = re.sub(r"\x1b\[[0-9;]*m", "", rendered)
         for label in ["in_sync", "ahead", "behind", "diverged", "unknown"]:
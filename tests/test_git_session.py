@@ -0,0 +1,121 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from git_alias import core
+
+
+def _completed(args, returncode=0, stdout="", stderr=""):
+    return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
+
+class GitSessionClassifyTest(unittest.TestCase):
+    def test_classifies_queries_reads_and_mutations(self):
+        classify = core.GitSession.classify
+        self.assertEqual(classify(["git", "rev-parse", "--show-toplevel"]), "stable")
+        self.assertEqual(classify(["git", "rev-parse", "HEAD"]), "cache")
+        self.assertEqual(classify(["git", "config", "--get", "user.name"]), "cache")
+        self.assertEqual(classify(["git", "remote", "get-url", "origin"]), "cache")
+        self.assertEqual(classify(["git", "ls-files"]), "cache")
+        self.assertEqual(classify(["git", "ls-files", "--others"]), "read")
+        self.assertEqual(classify(["git", "cat-file", "--batch-check"]), "read")
+        self.assertEqual(classify(["git", "status", "--porcelain"]), "read")
+        self.assertEqual(classify(["git", "worktree", "list"]), "read")
+        self.assertEqual(classify(["git", "config", "user.name", "x"]), "mutate")
+        self.assertEqual(classify(["git", "remote", "-v", "update"]), "mutate")
+        self.assertEqual(classify(["git", "commit", "-m", "x"]), "mutate")
+        self.assertEqual(classify(["git", "-C", "/tmp", "rev-parse"]), "mutate")
+        self.assertEqual(classify(["gh", "pr", "list"]), "mutate")
+        self.assertEqual(classify("git rev-parse HEAD"), "mutate")
+
+
+class GitSessionMemoTest(unittest.TestCase):
+    def setUp(self):
+        session = core.git_session()
+        session.__enter__()
+        self.addCleanup(session.__exit__, None, None, None)
+
+    def test_memoizes_read_only_queries_until_mutation(self):
+        def fake_run(args, **kwargs):
+            return _completed(args, stdout="abc\n")
+
+        with mock.patch.object(core.subprocess, "run", side_effect=fake_run) as run:
+            self.assertEqual(core.run_git_text(["rev-parse", "HEAD"]), "abc")
+            self.assertEqual(core.run_git_text(["rev-parse", "HEAD"]), "abc")
+            self.assertEqual(run.call_count, 1)
+            core.run_git_cmd(["commit", "-m", "x"])
+            self.assertEqual(core.run_git_text(["rev-parse", "HEAD"]), "abc")
+        self.assertEqual(run.call_count, 3)
+
+    def test_memoized_failures_still_raise(self):
+        def fake_run(args, **kwargs):
+            return _completed(args, returncode=1, stderr="fatal: bad ref\n")
+
+        with mock.patch.object(core.subprocess, "run", side_effect=fake_run) as run:
+            for _ in range(2):
+                with self.assertRaisesRegex(RuntimeError, "fatal: bad ref"):
+                    core.run_git_text(["rev-parse", "missing"])
+        run.assert_called_once()
+
+    def test_stable_queries_survive_mutations(self):
+        def fake_run(args, **kwargs):
+            return _completed(args, stdout="/repo\n")
+
+        with mock.patch.object(core.subprocess, "run", side_effect=fake_run) as run:
+            core.get_git_root()
+            core.run_git_cmd(["checkout", "develop"])
+            core.get_git_root()
+        self.assertEqual(run.call_count, 2)
+
+    def test_uncaptured_and_worktree_commands_are_not_memoized(self):
+        with mock.patch.object(
+            core.subprocess, "run", side_effect=lambda args, **kwargs: _completed(args)
+        ) as run:
+            core.run_git_cmd(["rev-parse", "HEAD"])
+            core.run_git_cmd(["rev-parse", "HEAD"])
+            core._git_status_lines()
+            core._git_status_lines()
+        self.assertEqual(run.call_count, 4)
+
+
+class GitSessionRefLookupTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        previous = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.addCleanup(os.chdir, previous)
+        env = dict(
+            os.environ,
+            GIT_AUTHOR_NAME="t",
+            GIT_AUTHOR_EMAIL="t@example.com",
+            GIT_COMMITTER_NAME="t",
+            GIT_COMMITTER_EMAIL="t@example.com",
+        )
+        for args in (
+            ["git", "init", "-q", "-b", "master"],
+            ["git", "commit", "-q", "--allow-empty", "-m", "init"],
+        ):
+            subprocess.run(args, check=True, env=env)
+
+    def test_batch_lookup_matches_show_ref_and_invalidates(self):
+        with core.git_session() as session:
+            self.assertTrue(core._local_branch_exists("master"))
+            self.assertFalse(core._local_branch_exists("develop"))
+            batch = session._batch
+            self.assertIsNotNone(batch)
+            self.assertTrue(core._local_branch_exists("master"))
+            self.assertIs(session._batch, batch)
+            core.run_git_cmd(["branch", "develop"])
+            self.assertIsNone(session._batch)
+            self.assertTrue(core._local_branch_exists("develop"))
+            self.assertFalse(core._ref_exists("refs/heads/master^{commit}"))
+        self.assertIsNone(core._GIT_SESSION)
+        self.assertIsNone(session._batch)
+        self.assertTrue(core._local_branch_exists("develop"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from git_alias import core
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+DEFERRED_MODULES = (
+    "argparse",
+    "concurrent.futures",
+    "dataclasses",
+    "git_alias.foresta",
+    "http.client",
+    "mmap",
+    "pathspec",
+    "urllib.error",
+    "urllib.request",
+)
+DISPATCH_BUDGET_MS = os.environ.get("GIT_ALIAS_DISPATCH_BUDGET_MS")
+DISPATCH_SCRIPT = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "from git_alias import core\n"
+    "core.main(['--help', 'st'], check_updates=False)\n"
+    "print(f'{(time.perf_counter() - start) * 1000:.3f}', file=sys.stderr)\n"
+)
+
+
+def _run_dispatch(*python_flags):
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *python_flags, "-c", DISPATCH_SCRIPT],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    ).stderr
+
+
+class StartupImportTest(unittest.TestCase):
+    def test_alias_dispatch_does_not_import_command_specific_modules(self):
+        report = _run_dispatch("-X", "importtime")
+        imported = {
+            line.rsplit("|", 1)[1].strip()
+            for line in report.splitlines()
+            if line.startswith("import time:")
+        }
+        self.assertIn("git_alias.core", imported)
+        for module in DEFERRED_MODULES:
+            self.assertNotIn(module, imported)
+
+    def test_passthrough_alias_skips_repository_discovery(self):
+        completed = subprocess.CompletedProcess(["git", "status"], 0)
+        with mock.patch.object(
+            core.subprocess, "run", return_value=completed
+        ) as run, mock.patch.object(core, "load_cli_config") as load_config:
+            core.main(["st"], check_updates=False)
+        run.assert_called_once()
+        self.assertEqual(run.call_args.args[0], ["git", "status"])
+        load_config.assert_not_called()
+
+    def test_configuration_loads_once_on_first_access(self):
+        with mock.patch.object(
+            core, "get_git_root", return_value=Path("/repo")
+        ), mock.patch.object(core, "load_cli_config") as load_config:
+            core.get_config_value("master")
+            load_config.assert_not_called()
+            with core._deferred_cli_config():
+                core.get_config_value("master")
+                core.get_branch("develop")
+            core.get_config_value("work")
+        load_config.assert_called_once_with(Path("/repo"))
+
+
+@unittest.skipUnless(
+    os.environ.get("GIT_ALIAS_BENCHMARK"), "set GIT_ALIAS_BENCHMARK=1 to run"
+)
+class StartupBenchmark(unittest.TestCase):
+    """
+    @brief Benchmark interpreter-side overhead of alias dispatch.
+    @details Opt-in via `GIT_ALIAS_BENCHMARK=1`; measures package import plus `main`
+    dispatch of `g --help st` in a fresh interpreter (best of 7) and prints it with the
+    heaviest `python -X importtime` entries. The number is host-dependent, so it is only
+    asserted when a budget is given through `GIT_ALIAS_DISPATCH_BUDGET_MS`.
+    @satisfies REQ-175
+    """
+
+    def test_report_dispatch_overhead(self):
+        best = min(float(_run_dispatch().splitlines()[-1]) for _ in range(7))
+        report = _run_dispatch("-X", "importtime")
+        entries = [
+            line
+            for line in report.splitlines()
+            if line.startswith("import time:") and line.split("|")[1].strip().isdigit()
+        ]
+        heaviest = sorted(entries, key=lambda line: int(line.split("|")[1]))[-10:]
+        print(f"\ndispatch overhead: {best:.1f} ms")
+        print("\n".join(heaviest))
+        if DISPATCH_BUDGET_MS:
+            self.assertLess(best, float(DISPATCH_BUDGET_MS))
+
+
+if __name__ == "__main__":
+    unittest.main()
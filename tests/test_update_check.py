@@ -1,7 +1,9 @@
 import contextlib
 import io
 import json
+import os
 import tempfile
+import time
 import unittest
 from email.message import Message
 from pathlib import Path
@@ -181,8 +183,10 @@ class UpdateCheckTest(unittest.TestCase):
                 "idle_until_unix",
                 "last_check_human",
                 "last_check_unix",
+                "latest_version",
             ],
         )
+        self.assertEqual(data["latest_version"], "0.0.2")
         self.assertIsInstance(data["last_check_unix"], int)
         self.assertIsInstance(data["idle_until_unix"], int)
         self.assertGreaterEqual(data["last_check_unix"], before_unix)
@@ -222,6 +226,96 @@ class UpdateCheckTest(unittest.TestCase):
         )
         self.assertEqual(data["last_check_unix"], 0)
 
+    def _write_cache(self, **fields):
+        cache_data = {
+            "last_check_unix": 1,
+            "last_check_human": "1970-01-01 00:00:01",
+            "idle_until_unix": 4_000_000_000,
+            "idle_until_human": "2096-10-02 07:06:40",
+        }
+        cache_data.update(fields)
+        core.VERSION_CHECK_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        core.VERSION_CHECK_CACHE_FILE.write_text(
+            json.dumps(cache_data),
+            encoding="utf-8",
+        )
+
+    def test_background_refresh_spawns_detached_check_without_network(self):
+        err = io.StringIO()
+        before_unix = int(core.datetime.now().timestamp())
+        with self._isolated_cache():
+            self._write_cache(idle_until_unix=1, latest_version="0.0.2")
+            with contextlib.redirect_stderr(err):
+                with mock.patch.object(core, "get_cli_version", return_value="0.0.1"):
+                    with mock.patch.object(core, "urlopen") as urlopen_mock:
+                        with mock.patch.object(core.subprocess, "Popen") as popen_mock:
+                            core.check_for_newer_version(
+                                timeout_seconds=0.01,
+                                background_refresh=True,
+                            )
+            data = json.loads(core.VERSION_CHECK_CACHE_FILE.read_text(encoding="utf-8"))
+        urlopen_mock.assert_not_called()
+        popen_mock.assert_called_once()
+        command = popen_mock.call_args.args[0]
+        self.assertIn("_run_background_version_check(0.01)", command[-1])
+        self.assertEqual(popen_mock.call_args.kwargs["stdout"], core.subprocess.DEVNULL)
+        self.assertIn("Update available: 0.0.2 (installed: 0.0.1)", err.getvalue())
+        self.assertEqual(data["latest_version"], "0.0.2")
+        self.assertGreaterEqual(
+            data["idle_until_unix"],
+            before_unix + core.VERSION_CHECK_REFRESH_LEASE_SECONDS,
+        )
+
+    def test_background_refresh_is_silent_when_idle_time_is_not_expired(self):
+        err = io.StringIO()
+        with self._isolated_cache():
+            self._write_cache(latest_version="99.0.0")
+            with contextlib.redirect_stderr(err):
+                with mock.patch.object(core.subprocess, "Popen") as popen_mock:
+                    core.check_for_newer_version(background_refresh=True)
+        popen_mock.assert_not_called()
+        self.assertEqual(err.getvalue(), "")
+
+    def test_background_worker_runs_forced_online_check(self):
+        with mock.patch.object(core, "check_for_newer_version") as check_update:
+            core._run_background_version_check(0.5)
+        kwargs = check_update.call_args.kwargs
+        self.assertEqual(kwargs["timeout_seconds"], 0.5)
+        self.assertTrue(kwargs["ignore_idle_cache"])
+        self.assertFalse(kwargs.get("background_refresh", False))
+
+    def test_error_state_preserves_cached_latest_version(self):
+        with self._isolated_cache():
+            with contextlib.redirect_stderr(io.StringIO()):
+                with mock.patch.object(core, "urlopen", side_effect=OSError("down")):
+                    core._write_version_check_state(
+                        last_check_unix=5,
+                        idle_until_unix=6,
+                        latest_version="1.2.3",
+                    )
+                    core.check_for_newer_version(timeout_seconds=0.01)
+            data = json.loads(core.VERSION_CHECK_CACHE_FILE.read_text(encoding="utf-8"))
+        self.assertEqual(data["latest_version"], "1.2.3")
+        self.assertEqual(data["last_check_unix"], 5)
+
+    @unittest.skipUnless(
+        os.environ.get("GIT_ALIAS_BENCHMARK"), "set GIT_ALIAS_BENCHMARK=1 to run"
+    )
+    def test_warm_cache_background_check_costs_under_one_millisecond(self):
+        iterations = 200
+        with self._isolated_cache():
+            self._write_cache(latest_version="0.0.1")
+            with mock.patch.object(core, "urlopen") as urlopen_mock:
+                with mock.patch.object(core.subprocess, "Popen") as popen_mock:
+                    core.check_for_newer_version(background_refresh=True)
+                    started = time.perf_counter()
+                    for _ in range(iterations):
+                        core.check_for_newer_version(background_refresh=True)
+                    elapsed = time.perf_counter() - started
+        urlopen_mock.assert_not_called()
+        popen_mock.assert_not_called()
+        self.assertLess(elapsed / iterations, 0.001)
+
     def test_resolve_release_api_url_uses_fixed_constant(self):
         api_url = core._resolve_release_api_url(Path("/repo"))
         self.assertEqual(api_url, core.GITHUB_LATEST_RELEASE_API)
@@ -26,10 +26,17 @@ class VerCommandTest(unittest.TestCase):
                 for path in root.rglob("*")
                 if path.is_file()
             )
-        payload = "\n".join(files)
+        payload = "".join(
+            "{} {} 0\t{}\0".format(
+                "120000" if (root / relative).is_symlink() else "100644",
+                "0" * 40,
+                relative,
+            )
+            for relative in files
+        )
 
         def _fake_run_git_text(args, cwd=None, check=True):
-            if args != ["ls-files"]:
+            if args != ["ls-files", "-z", "--stage"]:
                 raise AssertionError(f"Unexpected git args: {args}")
             if cwd != root:
                 raise AssertionError(f"Unexpected cwd: {cwd}")
@@ -138,6 +145,39 @@ class VerCommandTest(unittest.TestCase):
                     self.assertIn("module.py", message)
                     self.assertIn("second.py", message)
 
+    def test_cmd_ver_parallel_scan_reports_first_mismatch_in_rule_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pkg").mkdir()
+            versions = ["1.2.3"] * 40
+            versions[7] = "2.0.0"
+            versions[31] = "3.0.0"
+            for position, version in enumerate(versions):
+                (root / "pkg" / f"f{position:02d}.txt").write_text(
+                    f'version = "{version}"\n', encoding="utf-8"
+                )
+            (root / "VERSION").write_text('version = "1.2.3"\n', encoding="utf-8")
+            self._set_rules(
+                [
+                    {"pattern": "VERSION", "regex": r'version = "(\d+\.\d+\.\d+)"'},
+                    {"pattern": "pkg/*.txt", "regex": r'version = "(\d+\.\d+\.\d+)"'},
+                ]
+            )
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with self._mock_ls_files(root), mock.patch.object(
+                    core, "_scan_version_file", wraps=core._scan_version_file
+                ) as scan:
+                    err = io.StringIO()
+                    with contextlib.redirect_stderr(err):
+                        with self.assertRaises(SystemExit):
+                            core.cmd_ver([])
+            self.assertEqual(scan.call_count, 41)
+            self.assertEqual(
+                err.getvalue().strip(),
+                f"Version mismatch between {root / 'VERSION'} (1.2.3) and "
+                f"{root / 'pkg' / 'f07.txt'} (2.0.0)",
+            )
+
     def test_cmd_ver_errors_on_rule_without_matches(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -272,6 +312,61 @@ class VerCommandTest(unittest.TestCase):
             self.assertIn('1.2.4', module_path.read_text(encoding="utf-8"))
             self.assertIn('1.2.4', readme_path.read_text(encoding="utf-8"))
 
+    def test_cmd_chver_writes_atomically_and_confirms_in_memory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            script_path = root / "tool.sh"
+            script_path.write_text('VERSION="1.2.3"\n', encoding="utf-8")
+            script_path.chmod(0o755)
+            (root / "link.sh").symlink_to("tool.sh")
+            self._set_rules([{"pattern": "link.sh", "regex": r'VERSION="(\d+\.\d+\.\d+)"'}])
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with self._mock_ls_files(root, tracked_files=["link.sh"]), mock.patch.object(
+                    core,
+                    "_determine_canonical_version",
+                    wraps=core._determine_canonical_version,
+                ) as determine:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        core.cmd_chver(["1.3.0"])
+            determine.assert_called_once()
+            self.assertTrue((root / "link.sh").is_symlink())
+            self.assertEqual(script_path.read_text(encoding="utf-8"), 'VERSION="1.3.0"\n')
+            self.assertEqual(script_path.stat().st_mode & 0o777, 0o755)
+            self.assertEqual(sorted(path.name for path in root.iterdir()), ["link.sh", "tool.sh"])
+
+    def test_cmd_chver_leaves_files_untouched_when_staging_fails(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            module_path = root / "module.py"
+            readme_path = root / "README.md"
+            module_path.write_text('__version__ = "1.2.3"\n', encoding="utf-8")
+            readme_path.write_text('Current version "1.2.3"\n', encoding="utf-8")
+            self._set_rules(
+                [
+                    {"pattern": "module.py", "regex": r'__version__\s*=\s*"(\d+\.\d+\.\d+)"'},
+                    {"pattern": "README.md", "regex": r'"(\d+\.\d+\.\d+)"'},
+                ]
+            )
+            stage = core._stage_version_file
+
+            def failing_stage(target, text, slot, mode):
+                if target == readme_path:
+                    return None, OSError(28, "No space left on device")
+                return stage(target, text, slot, mode)
+
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with self._mock_ls_files(root), mock.patch.object(
+                    core, "_stage_version_file", side_effect=failing_stage
+                ):
+                    err = io.StringIO()
+                    with contextlib.redirect_stderr(err):
+                        with self.assertRaises(SystemExit):
+                            core.cmd_chver(["1.2.4"])
+            self.assertIn(f"Unable to write {readme_path}:", err.getvalue())
+            self.assertEqual(module_path.read_text(encoding="utf-8"), '__version__ = "1.2.3"\n')
+            self.assertEqual(readme_path.read_text(encoding="utf-8"), 'Current version "1.2.3"\n')
+            self.assertEqual(sorted(path.name for path in root.iterdir()), ["README.md", "module.py"])
+
     def test_cmd_chver_errors_when_pattern_matches_no_repository_files(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             root = Path(tmpdir)
@@ -314,3 +409,255 @@ class VerCommandTest(unittest.TestCase):
                     ) as build_inventory:
                         core.cmd_chver(["1.2.4"])
                     self.assertEqual(build_inventory.call_count, 1)
+
+    def test_inventory_stats_only_rule_candidates_and_dedups_symlinks(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "module.py").write_text('__version__ = "1.2.3"\n', encoding="utf-8")
+            (root / "README.md").write_text("readme\n", encoding="utf-8")
+            (root / "link.py").symlink_to("module.py")
+            payload = (
+                f"120000 {'0' * 40} 0\tlink.py\0"
+                f"100644 {'0' * 40} 0\tmissing.py\0"
+                f"100644 {'0' * 40} 1\tmodule.py\0"
+                f"100644 {'0' * 40} 2\tmodule.py\0"
+                f"100644 {'0' * 40} 0\tREADME.md\0"
+                f"160000 {'0' * 40} 0\tvendor.py\0"
+            )
+            with mock.patch.object(core, "run_git_text", return_value=payload):
+                with mock.patch.object(
+                    Path, "is_file", autospec=True, side_effect=lambda path: path.exists()
+                ) as is_file:
+                    inventory = core._build_version_file_inventory(root)
+                    self.assertEqual(is_file.call_count, 0)
+                    contexts = core._prepare_version_rule_contexts(
+                        root, [("*.py", r"(\d+\.\d+\.\d+)")], inventory=inventory
+                    )
+            self.assertEqual(
+                [entry.relative for entry in inventory],
+                ["link.py", "missing.py", "module.py", "README.md"],
+            )
+            self.assertEqual([entry.symlink for entry in inventory], [True, False, False, False])
+            self.assertEqual(
+                [call.args[0].name for call in is_file.call_args_list],
+                ["link.py", "missing.py", "module.py"],
+            )
+            self.assertEqual(contexts[0].files, [root / "link.py"])
+
+    def test_symlink_dedup_is_global_across_rules(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "docs").mkdir()
+            (root / "docs" / "info.txt").write_text('alpha = "1.0.0"\n', encoding="utf-8")
+            (root / "info.txt").symlink_to("docs/info.txt")
+            with self._mock_ls_files(root, tracked_files=["docs/info.txt", "info.txt"]):
+                inventory = core._build_version_file_inventory(root)
+            contexts = core._prepare_version_rule_contexts(
+                root,
+                [("*.txt", r"(\d+\.\d+\.\d+)"), ("/docs/info.txt", r"(\d+\.\d+\.\d+)")],
+                inventory=inventory,
+            )
+            self.assertEqual([context.files for context in contexts], [[root / "docs" / "info.txt"]] * 2)
+            with self.assertRaisesRegex(
+                core.VersionDetectionError, "No files matched the version rule pattern '/info.txt'"
+            ):
+                core._prepare_version_rule_contexts(
+                    root, [("/info.txt", r"(\d+\.\d+\.\d+)")], inventory=inventory
+                )
+
+    def test_cmd_chver_symlink_and_target_rules_never_drop_a_bump(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "docs").mkdir()
+            info_path = root / "docs" / "info.txt"
+            info_path.write_text('alpha = "1.0.0"\nbeta: 1.0.0\n', encoding="utf-8")
+            (root / "info.txt").symlink_to("docs/info.txt")
+            self._set_rules(
+                [
+                    {"pattern": "/info.txt", "regex": r'alpha = "(\d+\.\d+\.\d+)"'},
+                    {"pattern": "/docs/info.txt", "regex": r"beta: (\d+\.\d+\.\d+)"},
+                ]
+            )
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with self._mock_ls_files(root, tracked_files=["docs/info.txt", "info.txt"]):
+                    err = io.StringIO()
+                    with contextlib.redirect_stderr(err):
+                        with self.assertRaises(SystemExit):
+                            core.cmd_chver(["1.1.0"])
+            self.assertIn("No files matched the version rule pattern '/info.txt'", err.getvalue())
+            self.assertEqual(info_path.read_text(encoding="utf-8"), 'alpha = "1.0.0"\nbeta: 1.0.0\n')
+            self.assertEqual(sorted(path.name for path in info_path.parent.iterdir()), ["info.txt"])
+
+    def test_cmd_chver_rules_sharing_a_file_edit_one_buffer(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "docs").mkdir()
+            info_path = root / "docs" / "info.txt"
+            info_path.write_text('alpha = "1.0.0"\nbeta: 1.0.0\n', encoding="utf-8")
+            (root / "info.txt").symlink_to("docs/info.txt")
+            self._set_rules(
+                [
+                    {"pattern": "*.txt", "regex": r'alpha = "(\d+\.\d+\.\d+)"'},
+                    {"pattern": "/docs/info.txt", "regex": r"beta: (\d+\.\d+\.\d+)"},
+                ]
+            )
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with self._mock_ls_files(root, tracked_files=["docs/info.txt", "info.txt"]):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        core.cmd_chver(["1.1.0"])
+            self.assertTrue((root / "info.txt").is_symlink())
+            self.assertEqual(info_path.read_text(encoding="utf-8"), 'alpha = "1.1.0"\nbeta: 1.1.0\n')
+
+    def test_atomic_write_rejects_entries_resolving_to_the_same_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            target = root / "info.txt"
+            target.write_text("1.0.0\n", encoding="utf-8")
+            link = root / "link.txt"
+            link.symlink_to("info.txt")
+            failure = core._write_version_files_atomically({target: "1.1.0\n", link: "1.2.0\n"})
+            self.assertIsNotNone(failure)
+            self.assertEqual(failure[0], link)
+            self.assertIn("resolves to the same file as", str(failure[1]))
+            self.assertEqual(target.read_text(encoding="utf-8"), "1.0.0\n")
+            self.assertEqual(sorted(path.name for path in root.iterdir()), ["info.txt", "link.txt"])
+
+
+class VersionRuleMatcherTest(unittest.TestCase):
+    PATTERNS = [
+        "README.md",
+        "./pyproject.toml",
+        "src/**/*.py",
+        "packages/*/package.json",
+        "package.json",
+        "/pkg/package.json",
+        "docs/",
+        "lib",
+        "**/setup.cfg",
+        "*.toml",
+        "!README.md",
+        "# comment",
+        "",
+        "a\\*b.txt",
+        "[ab].txt",
+    ]
+    PATHS = [
+        "README.md",
+        "docs/README.md",
+        "docs",
+        "pyproject.toml",
+        "sub/pyproject.toml",
+        "src/git_alias/core.py",
+        "src/core.py",
+        "tests/src/core.py",
+        "packages/web/package.json",
+        "packages/web/nested/package.json",
+        "package.json",
+        "pkg/package.json",
+        "pkg/package.json/inner.txt",
+        "lib",
+        "lib/module.py",
+        "app/lib/module.py",
+        "library/module.py",
+        "tools/setup.cfg",
+        "a*b.txt",
+        "a.txt",
+        "c.txt",
+    ]
+
+    def test_matches_per_rule_pathspec_semantics(self):
+        import pathspec
+
+        root = Path("/repo")
+        inventory = [(root / relative, relative) for relative in self.PATHS]
+        combined = core.VersionRuleMatcher(self.PATTERNS).collect(inventory)
+        for pattern, files in zip(self.PATTERNS, combined):
+            normalized = core._normalize_version_rule_pattern(pattern)
+            if normalized:
+                spec = pathspec.PathSpec.from_lines("gitignore", [normalized])
+                expected = [root / relative for relative in self.PATHS if spec.match_file(relative)]
+            else:
+                expected = []
+            self.assertEqual([entry[0] for entry in files], expected, msg=pattern)
+
+    def test_literal_patterns_use_fast_index(self):
+        matcher = core.VersionRuleMatcher(["README.md", "pkg/version.txt", "docs/", "*.py"])
+        self.assertEqual([index for index, _ in matcher._wildcards], [3])
+        self.assertEqual(matcher.classify("a/README.md"), [0])
+        self.assertEqual(matcher.classify("pkg/version.txt"), [1])
+        self.assertEqual(matcher.classify("docs/README.md"), [0, 2])
+        self.assertEqual(matcher.classify("docs"), [])
+        self.assertEqual(matcher.classify("docs/x.py"), [2, 3])
+
+
+class VersionFileScanTest(unittest.TestCase):
+    REGEX = r'"version":\s*"(\d+\.\d+\.\d+)"'
+    FILLER_LINES = core.VERSION_SCAN_MMAP_MIN_BYTES // 20
+
+    def _scan_both_ways(self, path, expression):
+        compiled = core.re.compile(expression)
+        bytes_regex = core._compile_version_bytes_regex(compiled)
+        self.assertIsNotNone(bytes_regex)
+        expected = list(core._iter_versions_in_text(core._load_version_file_text(path), [compiled]))
+        text, versions = core._scan_version_file(path, [compiled], [bytes_regex])
+        self.assertEqual(versions, [expected])
+        return text
+
+    def test_large_ascii_file_is_scanned_by_mmap_without_full_decode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "package-lock.json"
+            filler = b'{"junk": "abcdefg"}\n' * self.FILLER_LINES
+            path.write_bytes(filler + b'"version": "4.5.6"\n' + filler)
+            with mock.patch.object(
+                core, "_decode_version_file_bytes", wraps=core._decode_version_file_bytes
+            ) as decode:
+                compiled = core.re.compile(self.REGEX)
+                text, versions = core._scan_version_file(
+                    path, [compiled], [core._compile_version_bytes_regex(compiled)]
+                )
+            decode.assert_not_called()
+            self.assertIsNone(text)
+            self.assertEqual(versions, [["4.5.6"]])
+
+    def test_large_crlf_or_non_ascii_files_match_text_semantics(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            crlf_path = Path(tmpdir) / "crlf.txt"
+            crlf_path.write_bytes(b"filler line\r\n" * self.FILLER_LINES + b"version: 1.2.3\r\n")
+            self.assertIsNotNone(self._scan_both_ways(crlf_path, r"version: (.+)"))
+            utf8_path = Path(tmpdir) / "utf8.txt"
+            utf8_path.write_bytes(
+                b"filler line\n" * self.FILLER_LINES + "év1.2.3 v2.0.0\n".encode("utf-8")
+            )
+            self._scan_both_ways(utf8_path, r"\bv(\d+\.\d+\.\d+)")
+            control_path = Path(tmpdir) / "control.txt"
+            control_path.write_bytes(b"filler line\n" * self.FILLER_LINES + b"version:\x1c1.2.3\n")
+            self._scan_both_ways(control_path, r"version:\s(\d+\.\d+\.\d+)")
+
+    def test_cmd_ver_agrees_across_large_and_small_crlf_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "big.txt").write_bytes(b"filler line\r\n" * self.FILLER_LINES + b"version: 1.2.3\r\n")
+            (root / "small.txt").write_bytes(b"version: 1.2.3\r\n")
+            with mock.patch.object(core, "get_git_root", return_value=root):
+                with VerCommandTest._mock_ls_files(root):
+                    core.CONFIG["ver_rules"] = [{"pattern": "*.txt", "regex": r"version: (.+)"}]
+                    self.addCleanup(core.CONFIG.update, {"ver_rules": core.DEFAULT_CONFIG["ver_rules"]})
+                    buffer = io.StringIO()
+                    with contextlib.redirect_stdout(buffer):
+                        core.cmd_ver([])
+            self.assertEqual(buffer.getvalue().strip(), "1.2.3")
+
+    def test_small_files_and_non_ascii_patterns_scan_decoded_text(self):
+        compiled = core.re.compile(self.REGEX)
+        self.assertIsNone(core._compile_version_bytes_regex(core.re.compile(r"versión (\d+)")))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "package.json"
+            path.write_bytes(b'{"version": "1.2.3"}\r\n')
+            text, versions = core._scan_version_file(
+                path, [compiled], [core._compile_version_bytes_regex(compiled)]
+            )
+            self.assertEqual(text, '{"version": "1.2.3"}\n')
+            self.assertEqual(versions, [["1.2.3"]])
+            self.assertEqual(
+                core._scan_version_file(Path(tmpdir) / "missing", [compiled]), (None, None)
+            )